@@ -18,21 +18,15 @@ import json
 import plotly.express as px
 
 from src.utils import (
-    PIPELINE_PATH,
     METADATA_PATH,
     IMAGES_DIR,
     CURRENT_YEAR,
     PREMIUM_BRANDS,
     format_price_inr,
-    load_model,
 )
 from src.prediction import predict_price
-from src.data_processing import (
-    load_and_merge_datasets,
-    clean_data,
-    convert_price_to_inr,
-    create_features,
-)
+from src.inference_context import get_inference_context
+from src.data_snapshot import load_dataset_snapshot
 
 # ---------------------------------------------------------------------------
 # Page Configuration
@@ -636,22 +630,20 @@ st.markdown(
 # ---------------------------------------------------------------------------
 # Data Loading & Caching
 # ---------------------------------------------------------------------------
-@st.cache_data
+@st.cache_resource
 def load_data():
     try:
-        raw = load_and_merge_datasets()
-        clean = clean_data(raw)
-        conv = convert_price_to_inr(clean)
-        feat = create_features(conv)
-        return feat
-    except Exception:
-        return None
+        return load_dataset_snapshot()
+    except Exception as e:
+        st.error(f"Failed to load dataset snapshot: {e}")
+        return None, None
 
 
-@st.cache_resource
-def load_ml_pipeline():
+def load_inference_context(knowledge_engine):
+    # Not cached by Streamlit: the shared context reloads itself (a stat
+    # call per run) when a new model is promoted or the config changes
     try:
-        return load_model(PIPELINE_PATH)
+        return get_inference_context(knowledge_engine)
     except FileNotFoundError:
         return None
 
@@ -665,28 +657,13 @@ def load_metadata():
         return None
 
 
-from src.knowledge_engine import VehicleKnowledgeEngine
-
-
-@st.cache_resource
-def load_knowledge_engine(dataframe: pd.DataFrame, _version=2):
-    try:
-        return VehicleKnowledgeEngine(dataframe)
-    except Exception as e:
-        st.error(f"Failed to initialize Knowledge Engine: {e}")
-        return None
-
-
-df = load_data()
+df, knowledge_engine = load_data()
 if df is None:
     st.error("Failed to load dataset.")
     st.stop()
 
-knowledge_engine = load_knowledge_engine(df)
-if knowledge_engine is None:
-    st.stop()
-
-pipeline = load_ml_pipeline()
+inference_context = load_inference_context(knowledge_engine)
+pipeline = inference_context.pipeline if inference_context else None
 metadata = load_metadata()
 
 
@@ -941,9 +918,9 @@ if page == "Predict Price":
                     fuel_type=fuel_type,
                     mpg=mpg,
                     engine_size=engine_size,
-                    pipeline=pipeline,
                     asking_price=asking_price,
                     knowledge_engine=knowledge_engine,
+                    context=inference_context,
                 )
                 st.divider()
 
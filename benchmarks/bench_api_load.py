@@ -0,0 +1,197 @@
+"""
+API load test: /predict under concurrency, with /health probed alongside.
+
+Starts the FastAPI app on a local uvicorn server in a child process (so
+the load generator does not share its GIL). N concurrent clients
+then post knowledge-base configurations to /predict while one prober
+polls /health every few ms. A client that gets a 429 drops that car and
+waits for Retry-After. The test runs once per mode:
+
+    - inline: valuations run on the event loop (the old behaviour)
+    - pool: valuations run on the bounded inference pool (429 when full)
+
+and prints /predict and /health p50/p99 latency, throughput and the
+number of shed (429) requests.
+
+Usage:
+    python -m benchmarks.bench_api_load --concurrency 16 --requests 400
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import time
+
+import httpx
+import numpy as np
+import uvicorn
+
+import src.api as api
+from src.inference_pool import InferencePool
+from src.utils import logger
+from src.valuation_cache import ValuationCache
+
+PORT = 8765
+
+
+def serve(
+    mode: str,
+    workers: int,
+    queue_size: int,
+    window_ms: float,
+    max_batch: int,
+    cache_size: int,
+    reload_poll_s: float,
+):
+    logger.setLevel(logging.WARNING)
+    api.MODEL_RELOAD_POLL_S = reload_poll_s
+    api.COALESCE_WINDOW_MS = window_ms
+    api.COALESCE_MAX_BATCH = max_batch
+    api.valuation_cache = ValuationCache(cache_size) if cache_size else None
+    if mode == "inline":
+
+        async def inline(fn, *fn_args):
+            return fn(*fn_args)
+
+        api._run_inference = inline
+    else:
+        api.inference_pool = InferencePool(workers, queue_size)
+    uvicorn.run(api.app, host="127.0.0.1", port=PORT, log_level="error")
+
+
+def start_server(
+    mode: str,
+    workers: int,
+    queue_size: int,
+    window_ms: float = 0.0,
+    max_batch: int = 32,
+    cache_size: int = 0,
+    reload_poll_s: float = 0.0,
+):
+    """Serve the API in a child process and wait until it is healthy."""
+    process = multiprocessing.Process(
+        target=serve,
+        args=(
+            mode,
+            workers,
+            queue_size,
+            window_ms,
+            max_batch,
+            cache_size,
+            reload_poll_s,
+        ),
+        daemon=True,
+    )
+    process.start()
+    while True:
+        try:
+            httpx.get(f"http://127.0.0.1:{PORT}/health").raise_for_status()
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+
+
+def sample_cars(n: int, explanation_level: str):
+    from src.data_snapshot import load_dataset_snapshot
+
+    _, knowledge_engine = load_dataset_snapshot()
+    kb = knowledge_engine.kb.dropna(
+        subset=["brand", "base_model", "year", "variant", "fuelType", "transmission"]
+    )
+    rows = kb.sample(n, replace=True, random_state=0)
+    return [
+        {
+            "brand": row.brand,
+            "model": row.base_model,
+            "variant": row.variant,
+            "year": int(row.year),
+            "transmission": row.transmission,
+            "mileage": 40000,
+            "fuelType": row.fuelType,
+            "explanation_level": explanation_level,
+        }
+        for row in rows.itertuples()
+    ]
+
+
+async def load(cars, concurrency: int):
+    predict_ms, health_ms, statuses = [], [], []
+    queue = list(cars)
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{PORT}",
+        timeout=120,
+        limits=httpx.Limits(
+            max_connections=concurrency + 1,
+            max_keepalive_connections=concurrency + 1,
+        ),
+    ) as client:
+
+        async def worker():
+            while queue:
+                car = queue.pop()
+                start = time.perf_counter()
+                response = await client.post("/predict", json=car)
+                predict_ms.append((time.perf_counter() - start) * 1000)
+                statuses.append(response.status_code)
+                if response.status_code == 429:
+                    await asyncio.sleep(float(response.headers["retry-after"]))
+
+        async def prober():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                health_ms.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.01)
+
+        probe = asyncio.ensure_future(prober())
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe
+
+    return np.array(predict_ms), np.array(health_ms), np.array(statuses), elapsed
+
+
+def report(mode, predict_ms, health_ms, statuses, elapsed):
+    ok = statuses == 200
+    print(
+        f"{mode:>6}: /predict p50={np.percentile(predict_ms[ok], 50):7.1f} ms "
+        f"p99={np.percentile(predict_ms[ok], 99):7.1f} ms, "
+        f"{ok.sum() / elapsed:6.1f} req/s, 429s={int((statuses == 429).sum())} | "
+        f"/health p50={np.percentile(health_ms, 50):6.1f} ms "
+        f"p99={np.percentile(health_ms, 99):7.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=api.INFERENCE_WORKERS)
+    parser.add_argument("--queue-size", type=int, default=api.INFERENCE_QUEUE_SIZE)
+    parser.add_argument(
+        "--explanation-level", default="exact", choices=["none", "approx", "exact"]
+    )
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    cars = sample_cars(args.requests, args.explanation_level)
+    print(
+        f"{args.requests} requests, {args.concurrency} clients, "
+        f"explanation_level={args.explanation_level}, pool "
+        f"{args.workers} workers + {args.queue_size} queued"
+    )
+    for mode in ["inline", "pool"]:
+        server = start_server(mode, args.workers, args.queue_size)
+        asyncio.run(load(cars[:20], 4))  # warm-up
+        report(mode, *asyncio.run(load(cars, args.concurrency)))
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
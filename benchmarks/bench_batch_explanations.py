@@ -0,0 +1,88 @@
+"""
+Batched vs per-car explanation benchmark.
+
+Explains the same cars with one ``ExplanationEngine.explain_prediction``
+call per car and with a single ``ExplanationEngine.explain_batch`` call,
+and separately times top-k factor selection on a contribution matrix:
+``np.argpartition`` (explain_batch) vs a Python sort per row
+(explain_prediction).
+
+Usage:
+    python -m benchmarks.bench_batch_explanations --sizes 100 1000
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.explanation_engine import NEGLIGIBLE_CONTRIBUTION, _top_k
+from src.inference_context import get_inference_context
+from src.prediction import create_input_frame
+from src.utils import logger
+
+from benchmarks.bench_batch_predict import make_cars
+
+
+def sorted_top_k(values: np.ndarray, feature_names, k: int):
+    """The per-row selection explain_prediction does, for every row."""
+    rows = []
+    for row in values:
+        ranked = sorted(zip(feature_names, row), key=lambda x: abs(x[1]), reverse=True)
+        ranked = [(f, c) for f, c in ranked if abs(c) >= NEGLIGIBLE_CONTRIBUTION]
+        rows.append(
+            ([f for f, c in ranked if c > 0][:k], [f for f, c in ranked if c < 0][:k])
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--topk-rows", type=int, default=50_000)
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    context = get_inference_context()
+    pipeline = context.pipeline
+    engine = context.explanation_engine
+    columns = list(pipeline.feature_names_in_)
+
+    for size in args.sizes:
+        features = context.feature_engineer.engineer_features(
+            create_input_frame(make_cars(size))
+        )[columns]
+
+        start = time.perf_counter()
+        for i in range(size):
+            engine.explain_prediction(pipeline, features.iloc[[i]])
+        per_car = time.perf_counter() - start
+
+        start = time.perf_counter()
+        engine.explain_batch(pipeline, features)
+        batched = time.perf_counter() - start
+
+        print(
+            f"{size:>7,} cars: per-car {per_car:7.2f} s "
+            f"({size / per_car:7,.0f} cars/s), batched {batched:7.2f} s "
+            f"({size / batched:7,.0f} cars/s)"
+        )
+
+    rng = np.random.default_rng(0)
+    values = rng.normal(0, 50_000, size=(args.topk_rows, len(columns)))
+    start = time.perf_counter()
+    sorted_top_k(values, columns, 3)
+    python_sort = time.perf_counter() - start
+    start = time.perf_counter()
+    _top_k(values, 3)
+    _top_k(-values, 3)
+    argpartition = time.perf_counter() - start
+    print(
+        f"top-3 selection over {args.topk_rows:,} rows: python sort "
+        f"{python_sort * 1000:.1f} ms, argpartition {argpartition * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Batch valuation throughput benchmark for ``predict_price_batch``.
+
+Values batches of increasing size with the shared inference context and
+prints rows/second, alongside the per-row ``predict_price`` loop that
+batch requests previously required.
+
+Usage:
+    python -m benchmarks.bench_batch_predict --sizes 100 1000 10000
+"""
+
+import argparse
+import logging
+import time
+
+import pandas as pd
+
+from benchmarks.bench_inference_latency import SAMPLE_CARS
+from src.inference_context import get_inference_context
+from src.prediction import predict_price, predict_price_batch
+from src.utils import logger
+
+COLUMNS = [
+    "brand",
+    "model",
+    "year",
+    "transmission",
+    "mileage",
+    "fuel_type",
+    "mpg",
+    "engine_size",
+]
+
+
+def make_cars(n_rows: int) -> pd.DataFrame:
+    rows = [SAMPLE_CARS[i % len(SAMPLE_CARS)] for i in range(n_rows)]
+    cars = pd.DataFrame(rows, columns=COLUMNS)
+    # Vary mileage so rows are not identical
+    cars["mileage"] = cars["mileage"] + (cars.index % 997) * 100
+    return cars
+
+
+def time_batch(cars: pd.DataFrame, context) -> float:
+    start = time.perf_counter()
+    predict_price_batch(cars, context=context)
+    return time.perf_counter() - start
+
+
+def time_loop(cars: pd.DataFrame, context) -> float:
+    start = time.perf_counter()
+    for car in cars.itertuples(index=False):
+        predict_price(*car, context=context)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument(
+        "--loop-rows",
+        type=int,
+        default=200,
+        help="Rows valued one at a time for the baseline",
+    )
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    context = get_inference_context()
+
+    # Warm-up so one-off import and allocation costs are excluded
+    predict_price_batch(make_cars(8), context=context)
+
+    loop_seconds = time_loop(make_cars(args.loop_rows), context)
+    print(
+        f"predict_price loop x{args.loop_rows}: "
+        f"{args.loop_rows / loop_seconds:,.0f} rows/s"
+    )
+    for size in args.sizes:
+        seconds = time_batch(make_cars(size), context)
+        print(
+            f"predict_price_batch x{size}: {seconds * 1000:,.0f} ms, "
+            f"{size / seconds:,.0f} rows/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Micro-batching benchmark: /predict throughput and latency per coalescing
+window.
+
+Serves the API (pool mode) with COALESCE_WINDOW_MS set to each window in
+turn (0 disables coalescing) and drives it with N concurrent clients, as
+in ``benchmarks.bench_api_load``. Prints throughput, /predict p50/p99 and
+the mean batch size the server formed.
+
+Usage:
+    python -m benchmarks.bench_coalescing --windows 0 2 5 10 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+
+import httpx
+import numpy as np
+
+import src.api as api
+from src.utils import logger
+
+from benchmarks.bench_api_load import PORT, load, sample_cars, start_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 2, 5, 10])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--max-batch", type=int, default=api.COALESCE_MAX_BATCH)
+    parser.add_argument("--workers", type=int, default=api.INFERENCE_WORKERS)
+    parser.add_argument("--queue-size", type=int, default=api.INFERENCE_QUEUE_SIZE)
+    parser.add_argument(
+        "--explanation-level", default="none", choices=["none", "approx", "exact"]
+    )
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    cars = sample_cars(args.requests, args.explanation_level)
+    print(
+        f"{args.requests} requests, {args.concurrency} clients, "
+        f"explanation_level={args.explanation_level}, max batch {args.max_batch}"
+    )
+    for window_ms in args.windows:
+        server = start_server(
+            "pool", args.workers, args.queue_size, window_ms, args.max_batch
+        )
+        asyncio.run(load(cars[:20], 4))  # warm-up
+        predict_ms, _, statuses, elapsed = asyncio.run(load(cars, args.concurrency))
+        coalescing = httpx.get(f"http://127.0.0.1:{PORT}/health").json()[
+            "request_coalescing"
+        ]
+        server.terminate()
+        server.join()
+
+        ok = statuses == 200
+        batch = coalescing["mean_batch_size"] if coalescing else 1.0
+        print(
+            f"window {window_ms:5.1f} ms: {ok.sum() / elapsed:6.1f} req/s, "
+            f"p50={np.percentile(predict_ms[ok], 50):7.1f} ms "
+            f"p99={np.percentile(predict_ms[ok], 99):7.1f} ms, "
+            f"mean batch {batch:5.2f}, errors={int((~ok).sum())}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Cold-start benchmark: time-to-first-prediction of a fresh process.
+
+Each run starts a new interpreter that imports the service modules, loads
+the dataset and knowledge engine, resolves specs for a car and serves the
+first ``predict_price`` call, as the API startup does. Two modes are
+compared:
+
+    rebuild   - run the raw-CSV data engineering chain (previous behaviour)
+    snapshot  - load the versioned dataset snapshot
+
+Usage:
+    python -m benchmarks.bench_cold_start --runs 3
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import argparse  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+
+import numpy as np  # noqa: E402
+
+
+def _first_prediction(mode: str) -> str:
+    import logging
+
+    from src.data_snapshot import build_dataset, load_dataset_snapshot
+    from src.inference_context import get_inference_context
+    from src.knowledge_engine import VehicleKnowledgeEngine
+    from src.prediction import predict_price
+    from src.utils import logger
+
+    logger.setLevel(logging.WARNING)
+    load_start = time.perf_counter()
+    if mode == "rebuild":
+        knowledge_engine = VehicleKnowledgeEngine(build_dataset())
+    else:
+        _, knowledge_engine = load_dataset_snapshot()
+    load_seconds = time.perf_counter() - load_start
+
+    context = get_inference_context(knowledge_engine)
+    specs = knowledge_engine.get_specs(
+        "Maruti", "Swift", 2018, "Dzire VDI", "Diesel", "Manual"
+    )
+    predict_price(
+        "Maruti",
+        "Swift Dzire VDI",
+        2018,
+        "Manual",
+        45000,
+        "Diesel",
+        specs["mileage"] if specs else 23.4,
+        specs["engineSize"] if specs else 1.2,
+        context=context,
+    )
+    return f"{load_seconds} {time.perf_counter() - _START}"
+
+
+def _run(mode: str) -> np.ndarray:
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_cold_start", "--child", mode],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return np.array(out.stdout.strip().splitlines()[-1].split(), dtype=float)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--child", choices=["rebuild", "snapshot"])
+    args = parser.parse_args()
+
+    if args.child:
+        print(_first_prediction(args.child))
+        return
+
+    _run("snapshot")  # make sure the snapshot exists
+    for mode in ["rebuild", "snapshot"]:
+        load, total = np.median([_run(mode) for _ in range(args.runs)], axis=0)
+        print(
+            f"{mode:>8}: dataset + knowledge engine {load:.2f} s, "
+            f"time-to-first-prediction {total:.2f} s (median of {args.runs})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Columnar vs per-car decision report benchmark.
+
+Scores N engineered cars with synthetic predicted and asking prices:
+
+    - per-car: ``DecisionIntelligenceEngine.generate_decision_report`` on
+      each valuation report dict, timed on a sample and extrapolated to N
+    - columnar: one ``generate_decision_reports`` call (deal score, 5-year
+      ownership cost, negotiation offers and forecast grid as arrays)
+
+and the cost of formatting report dicts lazily from the columnar result.
+Every sampled car is checked for equality between the two paths.
+
+Usage:
+    python -m benchmarks.bench_decision_reports --rows 1000000 --loop-rows 5000
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.inference_context import get_inference_context
+from src.prediction import create_input_frame
+from src.utils import logger
+
+from benchmarks.bench_batch_predict import make_cars
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--loop-rows", type=int, default=5000)
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    context = get_inference_context()
+    input_df = create_input_frame(make_cars(args.rows))
+    features_df = context.feature_engineer.engineer_features(input_df)
+    rng = np.random.default_rng(0)
+    prices = rng.uniform(1e5, 5e6, args.rows)
+    asking = prices * rng.uniform(0.85, 1.3, args.rows)
+    asking[rng.random(args.rows) < 0.3] = np.nan
+    summary = pd.DataFrame(
+        {
+            "car_age": input_df["car_age"],
+            "mpg": input_df["mpg"],
+            "engineSize": input_df["engineSize"],
+        }
+    )
+    valuations = context.valuation_engine.build_valuation_reports(
+        prices, input_df, features_df
+    )
+    engine = context.decision_engine
+
+    start = time.perf_counter()
+    batch = engine.generate_decision_reports(valuations, summary, asking)
+    columnar = time.perf_counter() - start
+
+    sample = min(args.loop_rows, args.rows)
+    reports = [valuations.report(i) for i in range(sample)]
+    summaries = summary.iloc[:sample].to_dict("records")
+    start = time.perf_counter()
+    expected = [
+        engine.generate_decision_report(
+            reports[i],
+            summaries[i],
+            None if np.isnan(asking[i]) else float(asking[i]),
+            [],
+        )
+        for i in range(sample)
+    ]
+    per_car = (time.perf_counter() - start) / sample * args.rows
+
+    start = time.perf_counter()
+    formatted = [batch.report(i) for i in range(sample)]
+    materialize = (time.perf_counter() - start) / sample * 1e6
+
+    assert formatted == expected
+
+    print(
+        f"{args.rows:,} cars: per-car {per_car:8.2f} s (extrapolated from "
+        f"{sample:,}), columnar {columnar:8.2f} s "
+        f"({args.rows / columnar:,.0f} cars/s, {per_car / columnar:,.0f}x)"
+    )
+    print(f"lazy report dict: {materialize:.1f} us/car")
+
+
+if __name__ == "__main__":
+    main()
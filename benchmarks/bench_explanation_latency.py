@@ -0,0 +1,91 @@
+"""
+Explanation latency benchmark, reported separately from prediction.
+
+Times ``ExplanationEngine.explain_prediction`` for one car per request with
+the production pipeline:
+
+    - rebuilt: a fresh provider per request (explainer built every time)
+    - cached: the shared InferenceContext provider (explainer cached per
+      model version)
+
+and the price-only path (prediction + report, no explanation) for scale.
+
+Usage:
+    python -m benchmarks.bench_explanation_latency --requests 200
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.explanation_engine import (
+    ExplanationEngine,
+    ShapExplanationProvider,
+    clear_explainer_cache,
+)
+from src.inference_context import get_inference_context
+from src.prediction import create_input_record
+from src.utils import logger
+
+from benchmarks.bench_inference_latency import SAMPLE_CARS
+
+
+def time_requests(fn, inputs, n_requests: int) -> np.ndarray:
+    latencies = np.empty(n_requests)
+    for i in range(n_requests):
+        start = time.perf_counter()
+        fn(inputs[i % len(inputs)])
+        latencies[i] = (time.perf_counter() - start) * 1000
+    return latencies
+
+
+def report(label: str, latencies: np.ndarray) -> None:
+    print(
+        f"{label:>12}: p50={np.percentile(latencies, 50):8.3f} ms, "
+        f"p95={np.percentile(latencies, 95):8.3f} ms, "
+        f"mean={latencies.mean():8.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    logger.setLevel(logging.ERROR)
+
+    context = get_inference_context()
+    pipeline = context.pipeline
+    records = [create_input_record(*car) for car in SAMPLE_CARS]
+    features = [context.feature_engineer.engineer_record(r) for r in records]
+    frames = [context.compiled_pipeline.input_frame(f) for f in features]
+
+    def rebuilt(X):
+        engine = ExplanationEngine(ShapExplanationProvider(), context.config)
+        engine.explain_prediction(pipeline, X)
+
+    def cached(X):
+        context.explanation_engine.explain_prediction(pipeline, X)
+
+    def price_only(i):
+        price = context.compiled_pipeline.predict_record(features[i])
+        context.valuation_engine.build_valuation_report(price, records[i], features[i])
+
+    clear_explainer_cache()
+    start = time.perf_counter()
+    cached(frames[0])
+    print(
+        f"first explanation (cold cache): {(time.perf_counter() - start) * 1000:.2f} ms"
+    )
+
+    report("rebuilt", time_requests(rebuilt, frames, args.requests))
+    report("cached", time_requests(cached, frames, args.requests))
+    report(
+        "price only",
+        time_requests(price_only, list(range(len(features))), args.requests),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Latency of each explanation level on the production pipeline.
+
+For every level in ``EXPLANATION_LEVELS`` times one
+``ExplanationEngine.explain_prediction`` call per car (p50/p95), then
+explains a batch at the approx and exact levels and reports how often the
+approximate top positive/negative factor matches the exact one.
+
+Usage:
+    python -m benchmarks.bench_explanation_levels --requests 200 --batch 1000
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.explanation_engine import EXPLANATION_LEVELS
+from src.inference_context import get_inference_context
+from src.prediction import create_input_frame
+from src.utils import logger
+
+from benchmarks.bench_batch_predict import make_cars
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    context = get_inference_context()
+    pipeline = context.pipeline
+    engine = context.explanation_engine
+    features = context.feature_engineer.engineer_features(
+        create_input_frame(make_cars(args.batch))
+    )[list(pipeline.feature_names_in_)]
+
+    for level in EXPLANATION_LEVELS:
+        engine.explain_prediction(pipeline, features.iloc[[0]], level)  # warm-up
+        latencies = np.empty(args.requests)
+        for i in range(args.requests):
+            row = features.iloc[[i % len(features)]]
+            start = time.perf_counter()
+            engine.explain_prediction(pipeline, row, level)
+            latencies[i] = (time.perf_counter() - start) * 1000
+        print(
+            f"{level:>6} per car: p50={np.percentile(latencies, 50):7.3f} ms, "
+            f"p95={np.percentile(latencies, 95):7.3f} ms"
+        )
+
+    batches = {}
+    for level in ["approx", "exact"]:
+        start = time.perf_counter()
+        batches[level] = engine.explain_batch(pipeline, features, level=level)
+        seconds = time.perf_counter() - start
+        print(
+            f"{level:>6} batch of {len(features):,}: "
+            f"{seconds * 1000 / len(features):7.3f} ms/car"
+        )
+
+    for side in ["positive", "negative"]:
+        key = f"top_{side}_features"
+        agreement = np.mean(batches["approx"][key][:, 0] == batches["exact"][key][:, 0])
+        print(f"approx top {side} factor matches exact: {agreement:.1%}")
+
+
+if __name__ == "__main__":
+    main()
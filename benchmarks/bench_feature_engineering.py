@@ -0,0 +1,53 @@
+"""
+Feature engineering throughput benchmark.
+
+Fits MarketStatistics on the cleaned dataset, tiles the cleaned rows up to
+each target size and times ``MarketFeatureEngineer.engineer_features`` in
+batch and batch-invariant mode.
+
+Usage:
+    python -m benchmarks.bench_feature_engineering --sizes 10000 100000 1000000
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.data_processing import clean_data, load_and_merge_datasets
+from src.feature_engineering import MarketFeatureEngineer
+from src.market_statistics import MarketStatistics
+from src.utils import logger
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    base = clean_data(load_and_merge_datasets())
+    stats = MarketStatistics(base.copy())
+
+    for size in args.sizes:
+        rows = np.resize(np.arange(len(base)), size)
+        df = base.iloc[rows].reset_index(drop=True)
+        line = f"{size:>10,} rows:"
+        for label, invariant in [("batch", False), ("invariant", True)]:
+            engineer = MarketFeatureEngineer(stats, batch_invariant=invariant)
+            times = []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                engineer.engineer_features(df)
+                times.append(time.perf_counter() - start)
+            seconds = float(np.median(times))
+            line += f" {label} {seconds:6.2f} s ({size / seconds:>10,.0f} rows/s)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
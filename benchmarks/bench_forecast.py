@@ -0,0 +1,71 @@
+"""
+Multi-horizon depreciation forecast benchmark.
+
+Builds MarketStatistics (with brand x age-bucket depreciation curves) from
+the prepared training data, then forecasts N inventory cars over a horizon:
+
+    - per-car: ``ForecastEngine.calculate_forecast`` for each car, timed on
+      a sample and extrapolated to N
+    - columnar: one ``ForecastEngine.calculate_forecast_grid`` call
+
+and prints the learned global curve.
+
+Usage:
+    python -m benchmarks.bench_forecast --rows 1000000 --horizon 10
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.data_processing import prepare_data
+from src.decision_intelligence.forecast_engine import ForecastEngine
+from src.market_statistics import DEPRECIATION_AGE_BUCKETS, MarketStatistics
+from src.utils import logger
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--horizon", type=int, default=10)
+    parser.add_argument("--loop-rows", type=int, default=5000)
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    df = prepare_data()
+    start = time.perf_counter()
+    stats = MarketStatistics(df)
+    print(f"MarketStatistics build: {time.perf_counter() - start:.2f} s")
+    print(
+        f"global curve (age buckets <= {DEPRECIATION_AGE_BUCKETS}, then older): "
+        f"{np.round(stats.global_depreciation_curve, 3)}"
+    )
+
+    rng = np.random.default_rng(0)
+    rows = rng.integers(0, len(df), args.rows)
+    brands = df["brand"].to_numpy()[rows]
+    ages = df["car_age"].to_numpy()[rows]
+    values = df["selling_price"].to_numpy(dtype=float)[rows]
+    engine = ForecastEngine(stats)
+
+    sample = min(args.loop_rows, args.rows)
+    start = time.perf_counter()
+    for i in range(sample):
+        engine.calculate_forecast(values[i], brands[i], ages[i], horizon=args.horizon)
+    per_car = (time.perf_counter() - start) / sample * args.rows
+
+    start = time.perf_counter()
+    grid, _ = engine.calculate_forecast_grid(values, brands, ages, horizon=args.horizon)
+    columnar = time.perf_counter() - start
+
+    print(
+        f"{args.rows:,} cars x {args.horizon} years: per-car {per_car:8.2f} s "
+        f"(extrapolated from {sample:,}), columnar {columnar:6.3f} s "
+        f"({per_car / columnar:,.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Hot reload benchmark: /predict while a new production model is picked up.
+
+Serves the API (pool mode, no result cache) and drives it with N
+concurrent clients for a fixed time. Halfway through, a new model version
+is made active in one of two ways:
+
+    - restart: the server process is stopped and started again (the
+      only option before registry polling)
+    - reload: registry.json is touched, as a promotion does, and the
+      server swaps the reloaded model in from the background
+
+Prints failed requests, /predict p50/p99/max overall and in the 5 s
+after the switch, and the longest gap without a successful response.
+
+Usage:
+    python -m benchmarks.bench_hot_reload --concurrency 8 --seconds 20
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+import httpx
+import numpy as np
+
+import src.api as api
+from src.utils import REGISTRY_PATH, logger
+
+from benchmarks.bench_api_load import PORT, sample_cars, start_server
+
+
+async def drive(cars, concurrency: int, seconds: float, switch):
+    """Post cars until ``seconds`` elapsed; ``switch()`` runs at half time."""
+    finished, failures = [], 0
+    start = time.perf_counter()
+
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{PORT}", timeout=120
+    ) as client:
+
+        async def worker(offset):
+            nonlocal failures
+            i = offset
+            while time.perf_counter() - start < seconds:
+                sent = time.perf_counter()
+                try:
+                    response = await client.post("/predict", json=cars[i % len(cars)])
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    finished.append((sent - start, time.perf_counter() - start))
+                else:
+                    failures += 1
+                    await asyncio.sleep(0.05)
+                i += concurrency
+
+        async def switcher():
+            await asyncio.sleep(seconds / 2)
+            await asyncio.get_running_loop().run_in_executor(None, switch)
+
+        await asyncio.gather(switcher(), *(worker(i) for i in range(concurrency)))
+
+    return np.array(finished), failures
+
+
+def report(mode, finished, failures, switch_at):
+    latency_ms = (finished[:, 1] - finished[:, 0]) * 1000
+    after = (finished[:, 0] >= switch_at) & (finished[:, 0] < switch_at + 5)
+    done = np.sort(finished[:, 1])
+    print(
+        f"{mode:>7}: failed={failures:4d}, /predict p50={np.percentile(latency_ms, 50):6.1f} "
+        f"p99={np.percentile(latency_ms, 99):7.1f} max={latency_ms.max():7.1f} ms | "
+        f"after switch p99={np.percentile(latency_ms[after], 99):7.1f} ms, "
+        f"longest gap {np.diff(done).max() * 1000:7.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--poll-seconds", type=float, default=1.0)
+    parser.add_argument("--workers", type=int, default=api.INFERENCE_WORKERS)
+    parser.add_argument("--queue-size", type=int, default=api.INFERENCE_QUEUE_SIZE)
+    parser.add_argument(
+        "--explanation-level", default="exact", choices=["none", "approx", "exact"]
+    )
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    cars = sample_cars(200, args.explanation_level)
+    print(
+        f"{args.concurrency} clients for {args.seconds:.0f} s, "
+        f"explanation_level={args.explanation_level}, "
+        f"registry polled every {args.poll_seconds} s"
+    )
+
+    def start():
+        return start_server(
+            "pool", args.workers, args.queue_size, reload_poll_s=args.poll_seconds
+        )
+
+    for mode in ["restart", "reload"]:
+        server = start()
+        asyncio.run(drive(cars, 4, 1, lambda: None))  # warm-up
+
+        def switch():
+            nonlocal server
+            if mode == "restart":
+                server.terminate()
+                server.join()
+                server = start()
+            else:
+                stat = REGISTRY_PATH.stat()
+                os.utime(REGISTRY_PATH, ns=(stat.st_atime_ns, time.time_ns()))
+
+        finished, failures = asyncio.run(
+            drive(cars, args.concurrency, args.seconds, switch)
+        )
+        if mode == "reload":
+            reloads = httpx.get(f"http://127.0.0.1:{PORT}/health").json()[
+                "model_reloads"
+            ]
+            assert reloads["reloads"] == 1, reloads
+        server.terminate()
+        server.join()
+        report(mode, finished, failures, args.seconds / 2)
+
+
+if __name__ == "__main__":
+    main()
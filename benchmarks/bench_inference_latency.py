@@ -0,0 +1,59 @@
+"""
+Single-valuation latency benchmark for ``predict_price``.
+
+Measures wall-clock latency per request with the production pipeline
+pre-loaded (as the API and Streamlit app do) and prints p50/p95/mean.
+
+Usage:
+    python -m benchmarks.bench_inference_latency --requests 200
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.prediction import predict_price
+from src.utils import PIPELINE_PATH, load_model, logger
+
+SAMPLE_CARS = [
+    ("Maruti", "Swift Dzire VDI", 2018, "Manual", 45000, "Diesel", 23.4, 1.2),
+    ("Hyundai", "i20 Asta 1.2", 2016, "Manual", 60000, "Petrol", 18.6, 1.2),
+    ("Honda", "City i-VTEC VX", 2019, "Automatic", 25000, "Petrol", 17.4, 1.5),
+    ("BMW", "3 Series 320d", 2015, "Automatic", 80000, "Diesel", 22.7, 2.0),
+]
+
+
+def run(n_requests: int) -> np.ndarray:
+    pipeline = load_model(PIPELINE_PATH)
+
+    # Warm-up so one-off import and allocation costs are excluded
+    predict_price(*SAMPLE_CARS[0], pipeline=pipeline)
+
+    latencies = np.empty(n_requests)
+    for i in range(n_requests):
+        car = SAMPLE_CARS[i % len(SAMPLE_CARS)]
+        start = time.perf_counter()
+        predict_price(*car, pipeline=pipeline)
+        latencies[i] = (time.perf_counter() - start) * 1000
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    latencies = run(args.requests)
+    print(
+        f"predict_price x{args.requests}: "
+        f"p50={np.percentile(latencies, 50):.2f} ms, "
+        f"p95={np.percentile(latencies, 95):.2f} ms, "
+        f"mean={latencies.mean():.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
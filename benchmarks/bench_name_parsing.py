@@ -0,0 +1,85 @@
+"""
+Name and spec parsing benchmark for the CarDekho and Kasliwal loaders.
+
+Scales both raw files (default 100x) and times the row-wise ``apply``
+parsers the loaders used against the columnar parsers, checking that the
+outputs are identical.
+
+Usage:
+    python -m benchmarks.bench_name_parsing --scale 100
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from src.data_processing import (
+    parse_brand_model,
+    parse_brand_model_columns,
+    parse_mileage_kmpl,
+    parse_mileage_kmpl_column,
+    parse_numeric_column,
+    parse_numeric_with_unit,
+)
+from src.utils import DATA_DIR
+
+SOURCES = {
+    "cardekho_v3": ("name", "mileage", "engine", "max_power"),
+    "kasliwal_train": ("Name", "Mileage", "Engine", "Power"),
+}
+
+
+def parse_rowwise(df: pd.DataFrame, columns) -> pd.DataFrame:
+    name, mileage, engine, power = columns
+    parsed = df[name].apply(parse_brand_model)
+    return pd.DataFrame(
+        {
+            "brand": parsed.apply(lambda x: x[0]),
+            "model": parsed.apply(lambda x: x[1]),
+            "base_model": parsed.apply(lambda x: x[2]),
+            "variant": parsed.apply(lambda x: x[3]),
+            "mileage_kmpl": df[mileage].apply(parse_mileage_kmpl),
+            "engine_cc": df[engine].apply(lambda x: parse_numeric_with_unit(x, "CC")),
+            "max_power_bhp": df[power].apply(
+                lambda x: parse_numeric_with_unit(x, "bhp")
+            ),
+        }
+    )
+
+
+def parse_columnar(df: pd.DataFrame, columns) -> pd.DataFrame:
+    name, mileage, engine, power = columns
+    parsed = parse_brand_model_columns(df[name])
+    parsed["mileage_kmpl"] = parse_mileage_kmpl_column(df[mileage])
+    parsed["engine_cc"] = parse_numeric_column(df[engine], "CC")
+    parsed["max_power_bhp"] = parse_numeric_column(df[power], "bhp")
+    return parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=int, default=100)
+    args = parser.parse_args()
+
+    for source, columns in SOURCES.items():
+        raw = pd.read_csv(DATA_DIR / "raw" / f"{source}.csv")
+        df = pd.concat([raw] * args.scale, ignore_index=True)
+
+        start = time.perf_counter()
+        expected = parse_rowwise(df, columns)
+        rowwise = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = parse_columnar(df, columns)
+        columnar = time.perf_counter() - start
+
+        pd.testing.assert_frame_equal(result, expected)
+        print(
+            f"{source} x{args.scale} ({len(df):,} rows): row-wise {rowwise:.2f} s, "
+            f"columnar {columnar:.2f} s, {rowwise / columnar:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
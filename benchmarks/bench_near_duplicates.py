@@ -0,0 +1,71 @@
+"""
+Near-duplicate filter benchmark (``clean_data`` step 8).
+
+Generates synthetic listings (about 200 per brand/model/year/fuel/
+transmission key, clustered prices and km so near-duplicates occur),
+sorts them by price as ``clean_data`` does and times the vectorized
+``near_duplicate_mask`` against the row-by-row reference, checking that
+both keep-masks agree.
+
+Usage:
+    python -m benchmarks.bench_near_duplicates --sizes 14000 1000000 10000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.data_processing import _near_duplicate_mask_reference, near_duplicate_mask
+
+
+def make_listings(n_rows: int, seed: int = 42):
+    rng = np.random.default_rng(seed)
+    n_keys = max(1, n_rows // 200)
+    key_ids = rng.integers(0, n_keys, n_rows)
+
+    base_price = rng.lognormal(13.5, 0.8, n_keys)
+    price = np.round(base_price[key_ids] * rng.lognormal(0.0, 0.15, n_rows), -3)
+    price = np.maximum(price, 20_000).astype(np.int64)
+    km = rng.integers(100, 150_000, n_rows)
+
+    order = np.argsort(price, kind="stable")
+    keys = np.array([f"key{k}" for k in range(n_keys)], dtype=object)[key_ids]
+    return keys[order], km[order], price[order]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[14_000, 1_000_000, 10_000_000]
+    )
+    parser.add_argument(
+        "--reference-limit",
+        type=int,
+        default=1_000_000,
+        help="Largest size also timed with the row-by-row reference",
+    )
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        keys, km, price = make_listings(size)
+
+        start = time.perf_counter()
+        mask = near_duplicate_mask(keys, km, price)
+        vectorized = time.perf_counter() - start
+        line = (
+            f"{size:>10,} rows: vectorized {vectorized:8.2f} s "
+            f"({(~mask).sum():,} near-duplicates)"
+        )
+
+        if size <= args.reference_limit:
+            start = time.perf_counter()
+            expected = _near_duplicate_mask_reference(keys, km, price)
+            reference = time.perf_counter() - start
+            assert (mask == expected).all(), "keep-masks differ"
+            line += f", reference {reference:8.2f} s, {reference / vectorized:.0f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Pre-fork benchmark: memory and startup of multi-worker serving.
+
+Starts the API with N workers in two ways:
+
+    - uvicorn: ``uvicorn src.api:app --workers N`` (every worker loads
+      all artifacts itself)
+    - prefork: ``python -m src.prefork_server --workers N`` (artifacts
+      loaded once, workers forked copy-on-write)
+
+waits until /health has answered from N distinct worker pids, sends some
+/predict traffic, and prints time-to-ready plus per-worker RSS and USS
+and the total PSS of the server's processes (parent and workers).
+
+Usage:
+    python -m benchmarks.bench_prefork --workers 4
+"""
+
+import argparse
+import asyncio
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+from src.utils import process_memory
+
+from benchmarks.bench_api_load import PORT, load, sample_cars
+
+
+def _children(pid: int):
+    path = Path(f"/proc/{pid}/task/{pid}/children")
+    return [int(child) for child in path.read_text().split()]
+
+
+def _wait_for_workers(workers: int) -> float:
+    start = time.perf_counter()
+    pids = set()
+    while len(pids) < workers:
+        try:
+            # A new connection per probe, so every worker gets to answer
+            health = httpx.get(f"http://127.0.0.1:{PORT}/health").json()
+            pids.add(health["process_memory"]["pid"])
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    return time.perf_counter() - start
+
+
+def run(mode: str, workers: int, cars):
+    if mode == "uvicorn":
+        command = ["uvicorn", "src.api:app", "--workers", str(workers)]
+    else:
+        command = [sys.executable, "-m", "src.prefork_server"]
+        command += ["--workers", str(workers)]
+    command += ["--port", str(PORT), "--log-level", "error"]
+    server = subprocess.Popen(
+        command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        ready = _wait_for_workers(workers)
+        asyncio.run(load(cars, workers * 2))
+        pids = [server.pid] + _children(server.pid)
+        memory = {pid: process_memory(pid) for pid in pids}
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+    # uvicorn also forks a resource tracker; only the API workers serve
+    worker_memory = [memory[pid] for pid in pids[1:]]
+    worker_memory = sorted(worker_memory, key=lambda m: -m["rss_mb"])[:workers]
+    rss = [m["rss_mb"] for m in worker_memory]
+    uss = [m["uss_mb"] for m in worker_memory]
+    total_pss = sum(m["pss_mb"] for m in memory.values())
+    print(
+        f"{mode:>8}: ready in {ready:5.1f} s | per worker rss "
+        f"{min(rss):6.1f}-{max(rss):6.1f} MB, uss {min(uss):6.1f}-{max(uss):6.1f} MB"
+        f" | total pss {total_pss:7.1f} MB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--explanation-level", default="exact", choices=["none", "approx", "exact"]
+    )
+    args = parser.parse_args()
+
+    cars = sample_cars(args.requests, args.explanation_level)
+    print(f"{args.workers} workers, {args.requests} requests before measuring")
+    for mode in ["uvicorn", "prefork"]:
+        run(mode, args.workers, cars)
+
+
+if __name__ == "__main__":
+    main()
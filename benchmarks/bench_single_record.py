@@ -0,0 +1,80 @@
+"""
+Single-record valuation benchmark: DataFrame path vs compiled record path.
+
+Times input construction, feature engineering, the model call and report
+building for one car at a time (explanations excluded, they are measured
+separately). The DataFrame path is what ``predict_price`` did before the
+record fast path; both paths produce the same report.
+
+Usage:
+    python -m benchmarks.bench_single_record --requests 2000
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.inference_context import get_inference_context
+from src.prediction import create_input_dataframe, create_input_record
+from src.utils import logger
+
+from benchmarks.bench_inference_latency import SAMPLE_CARS
+
+
+def dataframe_path(context, car):
+    input_df = create_input_dataframe(*car)
+    features_df = context.feature_engineer.engineer_features(input_df)
+    engine = context.valuation_engine
+    predictions, _ = engine.predict(context.pipeline, input_df, features_df)
+    return engine.build_valuation_report(
+        max(0.0, float(predictions[0])), input_df, features_df
+    )
+
+
+def record_path(context, car):
+    record = create_input_record(*car)
+    features = context.feature_engineer.engineer_record(record)
+    price = context.compiled_pipeline.predict_record(features)
+    return context.valuation_engine.build_valuation_report(
+        max(0.0, price), record, features
+    )
+
+
+def time_path(path, context, n_requests: int) -> np.ndarray:
+    path(context, SAMPLE_CARS[0])  # warm-up
+    latencies = np.empty(n_requests)
+    for i in range(n_requests):
+        car = SAMPLE_CARS[i % len(SAMPLE_CARS)]
+        start = time.perf_counter()
+        path(context, car)
+        latencies[i] = (time.perf_counter() - start) * 1e6
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    context = get_inference_context()
+    if context.compiled_pipeline is None:
+        raise SystemExit("Production pipeline does not support the record path")
+
+    for car in SAMPLE_CARS:
+        assert dataframe_path(context, car) == record_path(context, car)
+
+    for label, path in [("dataframe", dataframe_path), ("record", record_path)]:
+        latencies = time_path(path, context, args.requests)
+        print(
+            f"{label:>9} x{args.requests}: "
+            f"p50={np.percentile(latencies, 50):8.1f} us, "
+            f"p95={np.percentile(latencies, 95):8.1f} us, "
+            f"mean={latencies.mean():8.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Valuation cache benchmark: /predict under popular-configuration traffic.
+
+Serves the API (pool mode) without and with the valuation cache and
+drives it with N concurrent clients. Cars are drawn from a few popular
+knowledge-base configurations with Zipf-distributed popularity and a
+uniform mileage, as in production traffic. Prints throughput, /predict
+p50/p99 and the cache hit ratio the server reports on /health.
+
+Usage:
+    python -m benchmarks.bench_valuation_cache --configs 50 --requests 1000
+"""
+
+import argparse
+import asyncio
+import logging
+
+import httpx
+import numpy as np
+
+import src.api as api
+from src.utils import logger
+
+from benchmarks.bench_api_load import PORT, load, sample_cars, start_server
+
+
+def popular_cars(n: int, configs: int, explanation_level: str, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    pool = sample_cars(configs, explanation_level)
+    popularity = 1.0 / np.arange(1, configs + 1) ** 1.1
+    picks = rng.choice(configs, size=n, p=popularity / popularity.sum())
+    mileages = rng.integers(20_000, 80_000, size=n)
+    return [dict(pool[i], mileage=int(mileage)) for i, mileage in zip(picks, mileages)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--configs", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--cache-size", type=int, default=api.VALUATION_CACHE_SIZE)
+    parser.add_argument("--workers", type=int, default=api.INFERENCE_WORKERS)
+    parser.add_argument("--queue-size", type=int, default=api.INFERENCE_QUEUE_SIZE)
+    parser.add_argument(
+        "--explanation-level", default="exact", choices=["none", "approx", "exact"]
+    )
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    cars = popular_cars(args.requests, args.configs, args.explanation_level)
+    print(
+        f"{args.requests} requests over {args.configs} configurations, "
+        f"{args.concurrency} clients, explanation_level={args.explanation_level}"
+    )
+    for cache_size in [0, args.cache_size]:
+        server = start_server(
+            "pool", args.workers, args.queue_size, cache_size=cache_size
+        )
+        asyncio.run(load([dict(cars[0], mileage=1)], 1))  # warm-up
+        predict_ms, _, statuses, elapsed = asyncio.run(load(cars, args.concurrency))
+        cache = httpx.get(f"http://127.0.0.1:{PORT}/health").json()["valuation_cache"]
+        server.terminate()
+        server.join()
+
+        ok = statuses == 200
+        hit_ratio = "-"
+        if cache:  # the warm-up request is a miss
+            hit_ratio = f"{cache['hits'] / (cache['hits'] + cache['misses'] - 1):.1%}"
+        print(
+            f"cache {cache_size or 'off':>5}: {ok.sum() / elapsed:7.1f} req/s, "
+            f"p50={np.percentile(predict_ms[ok], 50):7.1f} ms "
+            f"p99={np.percentile(predict_ms[ok], 99):7.1f} ms, "
+            f"hit ratio {hit_ratio}, errors={int((~ok).sum())}"
+        )
+
+
+if __name__ == "__main__":
+    main()
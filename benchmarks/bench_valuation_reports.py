@@ -0,0 +1,73 @@
+"""
+Columnar vs per-row valuation report benchmark.
+
+Builds valuation reports for N engineered cars with synthetic predicted
+prices (the model call is measured by the other benchmarks):
+
+    - per-row: ``ValuationIntelligenceEngine.build_valuation_report`` on one
+      record dict per car, timed on a sample and extrapolated to N
+    - columnar: one ``build_valuation_reports`` call over the whole frame
+
+and the cost of materializing report dicts lazily from the columnar result.
+Every sampled row is checked for equality between the two paths.
+
+Usage:
+    python -m benchmarks.bench_valuation_reports --rows 1000000 --loop-rows 5000
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.inference_context import get_inference_context
+from src.prediction import create_input_frame
+from src.utils import logger
+
+from benchmarks.bench_batch_predict import make_cars
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--loop-rows", type=int, default=5000)
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    context = get_inference_context()
+    engine = context.valuation_engine
+    input_df = create_input_frame(make_cars(args.rows))
+    features_df = context.feature_engineer.engineer_features(input_df)
+    prices = np.random.default_rng(0).uniform(1e5, 5e6, args.rows)
+
+    start = time.perf_counter()
+    batch = engine.build_valuation_reports(prices, input_df, features_df)
+    columnar = time.perf_counter() - start
+
+    sample = min(args.loop_rows, args.rows)
+    data = input_df.iloc[:sample].to_dict("records")
+    features = features_df.iloc[:sample].to_dict("records")
+    start = time.perf_counter()
+    expected = [
+        engine.build_valuation_report(float(prices[i]), data[i], features[i])
+        for i in range(sample)
+    ]
+    per_row = (time.perf_counter() - start) / sample * args.rows
+
+    start = time.perf_counter()
+    reports = [batch.report(i) for i in range(sample)]
+    materialize = (time.perf_counter() - start) / sample * 1e6
+
+    assert reports == expected
+
+    print(
+        f"{args.rows:,} rows: per-row {per_row:8.2f} s (extrapolated from "
+        f"{sample:,}), columnar {columnar:8.2f} s "
+        f"({args.rows / columnar:,.0f} rows/s, {per_row / columnar:,.0f}x)"
+    )
+    print(f"lazy report dict: {materialize:.1f} us/row")
+
+
+if __name__ == "__main__":
+    main()
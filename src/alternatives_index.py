@@ -0,0 +1,398 @@
+"""
+Alternatives Index
+==================
+
+Nearest-neighbour index over knowledge-base configurations, used by the
+AlternativesEngine to suggest similar cars.
+
+Listings of the engineered dataset are grouped by the knowledge-base
+configuration keys (brand, base model, year, variant, fuel, transmission)
+into one row per configuration with its median price and specifications.
+Configurations are blocked by vehicle segment; each block gets a KD-tree
+over standardized numeric specs (log price, year, engine size, power,
+fuel efficiency, seats). A query searches the requested segment's block (or every
+block), post-filters by budget and drops the car's own model, widening the
+search until k distinct models are found. ``query_batch`` answers many
+queries with one KD-tree query per block.
+
+The index is built at training time and saved as a versioned joblib
+artifact next to the production pipeline.
+
+Usage:
+    python -m src.alternatives_index   # build from the dataset snapshot, save
+                                       # and time queries
+"""
+
+import hashlib
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import KDTree
+
+from src.market_statistics import vehicle_segments
+from src.utils import ALTERNATIVES_INDEX_PATH, format_price_inr, logger
+
+# Bump when the saved index layout changes
+ALTERNATIVES_INDEX_FORMAT_VERSION = 1
+
+CONFIG_KEYS = ["brand", "base_model", "year", "variant", "fuelType", "transmission"]
+
+# Numeric specs -> weight in the (standardized) distance; price enters as
+# log(price)
+SPEC_WEIGHTS = {
+    "price": 2.0,
+    "year": 1.0,
+    "engineSize": 1.0,
+    "max_power_bhp": 1.0,
+    "mpg": 0.5,
+    "seats": 0.5,
+}
+SPEC_COLUMNS = list(SPEC_WEIGHTS)
+
+# Neighbours fetched per wanted alternative before filtering
+OVERSAMPLE = 8
+LEAF_SIZE = 16
+
+
+class AlternativesIndex:
+    """
+    Segment-blocked KD-tree index of configurations.
+
+    Build with ``AlternativesIndex.build(df)``; load with
+    ``load_alternatives_index``.
+    """
+
+    def __init__(
+        self,
+        configs: pd.DataFrame,
+        center: np.ndarray,
+        scale: np.ndarray,
+        dataset_key: Optional[str] = None,
+    ):
+        self.format_version = ALTERNATIVES_INDEX_FORMAT_VERSION
+        self.configs = configs.reset_index(drop=True)
+        self.center = center
+        self.scale = scale
+        self.dataset_key = dataset_key
+        digest = hashlib.sha256(
+            pd.util.hash_pandas_object(self.configs, index=False).to_numpy().tobytes()
+        )
+        self.version = digest.hexdigest()[:12]
+        self._build_blocks()
+
+    def _build_blocks(self):
+        """KD-tree per segment plus the per-row arrays queries read."""
+        self._prices = self.configs["price"].to_numpy(dtype=float)
+        self._brands = self.configs["brand"].to_numpy(dtype=object)
+        self._models = self.configs["base_model"].to_numpy(dtype=object)
+        self._records = self.configs.to_dict("records")
+        points = self._points(self.configs[SPEC_COLUMNS].to_numpy(dtype=float))
+        self.blocks: Dict[str, Tuple[KDTree, np.ndarray]] = {
+            segment: (KDTree(points[rows], leaf_size=LEAF_SIZE), rows)
+            for segment, rows in self.configs.groupby("segment").indices.items()
+        }
+
+    @classmethod
+    def build(
+        cls, df: pd.DataFrame, dataset_key: Optional[str] = None
+    ) -> "AlternativesIndex":
+        """
+        Build the index from the engineered dataset (``build_dataset`` output).
+
+        Args:
+            df: Listings with the knowledge-base configuration columns,
+                price_inr, engineSize, max_power_bhp, mpg, seats and
+                km_driven.
+            dataset_key: Identifier of the dataset (e.g. the snapshot key).
+        """
+        listings = df.dropna(subset=["price_inr"])
+        configs = (
+            listings.groupby(CONFIG_KEYS, dropna=True)
+            .agg(
+                price=("price_inr", "median"),
+                engineSize=("engineSize", "median"),
+                max_power_bhp=("max_power_bhp", "median"),
+                mpg=("mpg", "median"),
+                seats=("seats", "median"),
+                km_driven=("km_driven", "median"),
+                listings=("price_inr", "size"),
+            )
+            .reset_index()
+        )
+        configs = configs[configs["price"] > 0]
+        configs["segment"] = vehicle_segments(configs["engineSize"])
+
+        features = configs[SPEC_COLUMNS].assign(price=np.log(configs["price"]))
+        center = features.median().to_numpy()
+        scale = features.std().replace(0.0, 1.0).fillna(1.0).to_numpy()
+        index = cls(configs, center, scale, dataset_key)
+        logger.info(
+            f"Alternatives index built: {len(configs)} configurations in "
+            f"{len(index.blocks)} segments (version {index.version})"
+        )
+        return index
+
+    def __getstate__(self):
+        # Trees and row caches are rebuilt on load (cheap, sklearn-version bound)
+        keep = [
+            "format_version",
+            "configs",
+            "center",
+            "scale",
+            "dataset_key",
+            "version",
+        ]
+        return {key: self.__dict__[key] for key in keep}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.format_version == ALTERNATIVES_INDEX_FORMAT_VERSION:
+            self._build_blocks()
+
+    def _points(self, specs: np.ndarray) -> np.ndarray:
+        """
+        Weighted, standardized points for raw SPEC_COLUMNS rows; missing
+        specs sit at the center.
+        """
+        values = specs.copy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values[:, 0] = np.log(values[:, 0])
+        values = (values - self.center) / self.scale
+        values[~np.isfinite(values)] = 0.0
+        return values * np.array(list(SPEC_WEIGHTS.values()))
+
+    def query(
+        self,
+        specs: Mapping[str, Any],
+        k: int = 3,
+        budget: Optional[float] = None,
+        segment: Optional[str] = None,
+        exclude: Optional[Tuple[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Top-k alternative configurations, one per model, nearest first.
+
+        Args:
+            specs: Target price and specs (price, year, engineSize,
+                max_power_bhp, mpg, seats); missing ones are ignored.
+            k: Number of alternatives.
+            budget: Maximum median price of an alternative.
+            segment: Only search this vehicle segment (all when None or unknown).
+            exclude: (brand, model) of the car itself; configurations of that
+                brand whose base model starts the model string are skipped.
+
+        Returns:
+            List of alternative dicts, at most ``k``.
+        """
+        raw = [specs.get(col) for col in SPEC_COLUMNS]
+        points = self._points(
+            np.array([[np.nan if v is None else v for v in raw]], dtype=float)
+        )
+        budgets = np.array([np.nan if budget is None else budget], dtype=float)
+        return self._query_points(points, k, budgets, [segment], [exclude])[0]
+
+    def query_batch(
+        self,
+        specs: pd.DataFrame,
+        k: int = 3,
+        budgets: Optional[np.ndarray] = None,
+        segments: Optional[Sequence[Optional[str]]] = None,
+        excludes: Optional[Sequence[Optional[Tuple[str, str]]]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        ``query`` for every row of ``specs``, with one KD-tree query per block.
+
+        Args:
+            specs: One row per query with (some of) the SPEC_COLUMNS;
+                missing columns and NaNs are ignored.
+            k: Number of alternatives per query.
+            budgets: Budget per query, NaN (or None) for no budget.
+            segments: Segment per query (None: every block).
+            excludes: (brand, model) to skip per query, or None.
+
+        Returns:
+            ``query``'s result for each row.
+        """
+        n = len(specs)
+        points = self._points(specs.reindex(columns=SPEC_COLUMNS).to_numpy(dtype=float))
+        budgets = (
+            np.full(n, np.nan) if budgets is None else np.asarray(budgets, dtype=float)
+        )
+        segments = [None] * n if segments is None else segments
+        excludes = [None] * n if excludes is None else excludes
+        return self._query_points(points, k, budgets, segments, excludes)
+
+    def _query_points(self, points, k, budgets, segments, excludes):
+        # Queries searching the same blocks are answered together
+        groups = defaultdict(list)
+        for i, segment in enumerate(segments):
+            groups[segment if segment in self.blocks else None].append(i)
+
+        candidates = [[] for _ in range(len(points))]
+        for segment, queries in groups.items():
+            blocks = (
+                [self.blocks[segment]] if segment is not None else self.blocks.values()
+            )
+            queries = np.array(queries)
+            block_excludes = [excludes[i] for i in queries]
+            for tree, rows in blocks:
+                matches = self._query_block(
+                    tree, rows, points[queries], k, budgets[queries], block_excludes
+                )
+                for i, block_matches in zip(queries, matches):
+                    candidates[i].extend(block_matches)
+        return [self._top_k(query_candidates, k) for query_candidates in candidates]
+
+    def _top_k(self, candidates, k) -> List[Dict[str, Any]]:
+        """The k nearest candidates, one per model."""
+        candidates.sort()
+        results, seen = [], set()
+        for distance, row in candidates:
+            model = (self._brands[row], self._models[row])
+            if model in seen:
+                continue
+            seen.add(model)
+            results.append(self._alternative(row, distance))
+            if len(results) == k:
+                break
+        return results
+
+    def _query_block(self, tree, rows, points, k, budgets, excludes):
+        """(distance, row) of up to k distinct-model matches per point in one block."""
+        n_rows = len(rows)
+        fetch = min(n_rows, k * OVERSAMPLE)
+        results = [None] * len(points)
+        pending = np.arange(len(points))
+        while len(pending):
+            distances, positions = tree.query(points[pending], k=fetch)
+            found = rows[positions]
+            # A NaN budget compares False: no budget
+            affordable = ~(self._prices[found] > budgets[pending, None])
+            short = []
+            for j, query in enumerate(pending):
+                matches, models = [], set()
+                exclude = excludes[query]
+                for distance, row in zip(
+                    distances[j][affordable[j]], found[j][affordable[j]]
+                ):
+                    model = (self._brands[row], self._models[row])
+                    if exclude is not None and _same_model(model, exclude):
+                        continue
+                    matches.append((float(distance), int(row)))
+                    models.add(model)
+                results[query] = matches
+                if len(models) < k and fetch < n_rows:
+                    short.append(query)
+            pending = np.array(short, dtype=int)
+            fetch = min(n_rows, fetch * 4)
+        return results
+
+    def _alternative(self, row: int, distance: float) -> Dict[str, Any]:
+        config = self._records[row]
+        price = float(config["price"])
+        return {
+            "brand": config["brand"],
+            "model": config["base_model"],
+            "variant": config["variant"],
+            "year": int(config["year"]),
+            "fuelType": config["fuelType"],
+            "transmission": config["transmission"],
+            "engineSize": (
+                round(float(config["engineSize"]), 1)
+                if pd.notna(config["engineSize"])
+                else 0.0
+            ),
+            "segment": config["segment"],
+            "mileage": int(config["km_driven"]) if pd.notna(config["km_driven"]) else 0,
+            "price": format_price_inr(price),
+            "price_raw": price,
+            "listings": int(config["listings"]),
+            "distance": round(distance, 4),
+        }
+
+
+def _same_model(candidate: Tuple[str, str], exclude: Tuple[str, str]) -> bool:
+    brand, model = exclude
+    base_model = candidate[1]
+    return candidate[0] == brand and (
+        model == base_model or str(model).startswith(f"{base_model} ")
+    )
+
+
+def save_alternatives_index(
+    index: AlternativesIndex, path: Path = ALTERNATIVES_INDEX_PATH
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(index, path)
+    logger.info(f"Alternatives index saved to {path}")
+
+
+def load_alternatives_index(
+    path: Path = ALTERNATIVES_INDEX_PATH,
+) -> Optional[AlternativesIndex]:
+    """
+    Load a saved index; None if it is missing, unreadable or an old format.
+    """
+    try:
+        index = joblib.load(path)
+    except FileNotFoundError:
+        logger.info(f"No alternatives index at {path}; alternatives disabled.")
+        return None
+    except Exception as e:
+        logger.warning(f"Unreadable alternatives index at {path}: {e}")
+        return None
+
+    if getattr(index, "format_version", None) != ALTERNATIVES_INDEX_FORMAT_VERSION:
+        logger.warning(f"Ignoring alternatives index at {path}: old format.")
+        return None
+    return index
+
+
+def build_alternatives_index(
+    path: Path = ALTERNATIVES_INDEX_PATH,
+) -> Tuple[AlternativesIndex, pd.DataFrame]:
+    """
+    Build the index from the engineered dataset snapshot and save it.
+
+    Returns:
+        Tuple of (index, engineered DataFrame it was built from).
+    """
+    from src.data_snapshot import compute_snapshot_key, load_dataset_snapshot
+
+    df, _ = load_dataset_snapshot()
+    index = AlternativesIndex.build(df, compute_snapshot_key())
+    save_alternatives_index(index, path)
+    return index, df
+
+
+if __name__ == "__main__":
+    # Pickle the class under its importable name, not __main__
+    import src.alternatives_index as alternatives_index
+
+    index, df = alternatives_index.build_alternatives_index()
+
+    sample = df.sample(200, random_state=0).to_dict("records")
+    latencies = []
+    for car in sample:
+        start = time.perf_counter()
+        index.query(
+            {
+                "price": car["price_inr"],
+                "year": car["year"],
+                "engineSize": car["engineSize"],
+                "mpg": car["mpg"],
+            },
+            budget=car["price_inr"] * 1.1,
+            segment=car["vehicle_segment"],
+            exclude=(car["brand"], car["model"]),
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+    print(
+        f"Alternatives index {index.version}: {len(index.configs)} configurations, "
+        f"query p50={np.percentile(latencies, 50):.3f} ms"
+    )
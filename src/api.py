@@ -6,13 +6,37 @@ REST API providing car price prediction endpoints.
 
 Endpoints:
     POST /predict  - Predict the price of a single car
+    POST /predict/batch - Predict the prices of many cars in one vectorized pass
     GET  /health   - Health check
     GET  /brands   - Get available brands
     GET  /models/{brand} - Get models for a specific brand
+
+Valuations run on a bounded worker pool, off the event loop. Its size is
+set with the INFERENCE_WORKERS and INFERENCE_QUEUE_SIZE environment
+variables. When the pool is full, prediction endpoints answer 429.
+
+With COALESCE_WINDOW_MS > 0, concurrent POST /predict requests are
+micro-batched. Requests arriving within the window, or until
+COALESCE_MAX_BATCH are waiting, are valued in one vectorized pass.
+
+POST /predict results are cached per configuration, mileage and model
+version (see ``src.valuation_cache``). VALUATION_CACHE_SIZE (0 disables
+the cache) and VALUATION_CACHE_TTL_S configure it. Setting
+VALUATION_CACHE_MILEAGE_BUCKET_KM above 1 (the default, exact mileage)
+lets cars at similar mileages share an entry; cached cars are then
+valued at the midpoint of their mileage bucket.
+
+Models promoted in the registry are picked up without a restart: every
+MODEL_RELOAD_POLL_S seconds (0 disables it) models/registry.json is
+checked, and a new version is loaded in the background and swapped in
+atomically. Responses and GET /health carry the active model version.
 """
 
+import os
 import sys
+import time
 from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 # Ensure project root is on the path
 project_root = Path(__file__).resolve().parent.parent
@@ -20,18 +44,23 @@ sys.path.insert(0, str(project_root))
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-
-from src.prediction import predict_price
-from src.utils import (
-    PIPELINE_PATH,
-    load_model,
-    logger,
+import pandas as pd
+from pydantic import BaseModel, Field, ValidationError
+
+from src.prediction import predict_price, predict_price_batch, predict_prices
+from src.explanation_engine import EXPLANATION_LEVELS
+from src.inference_context import get_inference_context, loaded_model_version
+from src.inference_pool import (
+    DEFAULT_MAX_QUEUE,
+    InferencePool,
+    InferencePoolSaturated,
+    default_workers,
 )
+from src.model_reloader import ModelReloader
+from src.request_coalescer import RequestCoalescer
+from src.utils import logger, process_memory
+from src.valuation_cache import ValuationCache
 
-# ---------------------------------------------------------------------------
-# App Initialization
-# ---------------------------------------------------------------------------
 # ---------------------------------------------------------------------------
 # App Initialization
 # ---------------------------------------------------------------------------
@@ -59,43 +88,116 @@ app.add_middleware(
 # Global instances
 pipeline = None
 knowledge_engine = None
+coalescer: Optional[RequestCoalescer] = None
+model_reloader: Optional[ModelReloader] = None
+
+# Upper bound on rows accepted by POST /predict/batch
+MAX_BATCH_SIZE = 10_000
+
+# Valuations running concurrently, and waiting for a worker, before 429s
+INFERENCE_WORKERS = int(os.environ.get("INFERENCE_WORKERS", default_workers()))
+INFERENCE_QUEUE_SIZE = int(os.environ.get("INFERENCE_QUEUE_SIZE", DEFAULT_MAX_QUEUE))
+inference_pool = InferencePool(INFERENCE_WORKERS, INFERENCE_QUEUE_SIZE)
+
+# Micro-batching of concurrent /predict requests (0 ms disables it)
+COALESCE_WINDOW_MS = float(os.environ.get("COALESCE_WINDOW_MS", 0))
+COALESCE_MAX_BATCH = int(os.environ.get("COALESCE_MAX_BATCH", 32))
+
+# Result cache for POST /predict (size 0 disables it)
+VALUATION_CACHE_SIZE = int(os.environ.get("VALUATION_CACHE_SIZE", 4096))
+VALUATION_CACHE_TTL_S = float(os.environ.get("VALUATION_CACHE_TTL_S", 600))
+VALUATION_CACHE_MILEAGE_BUCKET_KM = int(
+    os.environ.get("VALUATION_CACHE_MILEAGE_BUCKET_KM", 1)
+)
+valuation_cache: Optional[ValuationCache] = (
+    ValuationCache(
+        VALUATION_CACHE_SIZE, VALUATION_CACHE_TTL_S, VALUATION_CACHE_MILEAGE_BUCKET_KM
+    )
+    if VALUATION_CACHE_SIZE > 0
+    else None
+)
+
+# Seconds between checks of the registry for a newly promoted model (0: off)
+MODEL_RELOAD_POLL_S = float(os.environ.get("MODEL_RELOAD_POLL_S", 5))
+
+INVALID_CONFIGURATION = (
+    "Invalid vehicle configuration. Combination does not exist in the Indian market."
+)
 
 
 @app.on_event("startup")
 async def startup_event():
     """Load the ML pipeline and Knowledge Engine on application startup."""
+    global coalescer
+    global model_reloader
+
+    if COALESCE_WINDOW_MS > 0:
+        coalescer = RequestCoalescer(
+            _predict_coalesced,
+            window_ms=COALESCE_WINDOW_MS,
+            max_batch=COALESCE_MAX_BATCH,
+            runner=lambda fn, *args: _run_inference(fn, *args),
+        )
+
+    load_artifacts()
+
+    if MODEL_RELOAD_POLL_S > 0:
+        model_reloader = ModelReloader(
+            poll_seconds=MODEL_RELOAD_POLL_S, on_swap=_on_model_swap
+        )
+        model_reloader.start()
+
+
+def load_artifacts() -> None:
+    """
+    Load the ML pipeline and Knowledge Engine, unless already loaded.
+
+    Pre-fork serving (``src.prefork_server``) calls this in the parent
+    process, so workers start with everything in place.
+    """
     global pipeline
     global knowledge_engine
 
-    # Load ML pipeline
-    try:
-        pipeline = load_model(PIPELINE_PATH)
-        logger.info("Pipeline loaded successfully at startup.")
-    except FileNotFoundError:
-        logger.warning(
-            "Model not found. Run 'python -m src.prediction' first. "
-            "API will return errors until model is available."
-        )
+    # Load ML pipeline, market statistics and engines once for all requests
+    if pipeline is None:
+        try:
+            pipeline = get_inference_context().pipeline
+            logger.info("Pipeline loaded successfully at startup.")
+        except FileNotFoundError:
+            logger.warning(
+                "Model not found. Run 'python -m src.prediction' first. "
+                "API will return errors until model is available."
+            )
 
-    # Load Knowledge Engine
-    try:
-        from src.data_processing import (
-            load_and_merge_datasets,
-            clean_data,
-            convert_price_to_inr,
-            create_features,
-        )
-        from src.knowledge_engine import VehicleKnowledgeEngine
+    # Load Knowledge Engine (from the dataset snapshot when it is current)
+    if knowledge_engine is None:
+        try:
+            from src.data_snapshot import load_dataset_snapshot
 
-        raw_df = load_and_merge_datasets()
-        clean_df = clean_data(raw_df)
-        conv_df = convert_price_to_inr(clean_df)
-        final_df = create_features(conv_df)
+            _, knowledge_engine = load_dataset_snapshot()
+            if pipeline is not None:
+                get_inference_context(knowledge_engine)
+            logger.info("Vehicle Knowledge Engine initialized successfully.")
+        except Exception as e:
+            logger.error(f"Failed to initialize Knowledge Engine: {e}")
 
-        knowledge_engine = VehicleKnowledgeEngine(final_df)
-        logger.info("Vehicle Knowledge Engine initialized successfully.")
-    except Exception as e:
-        logger.error(f"Failed to initialize Knowledge Engine: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop watching the registry."""
+    global model_reloader
+
+    if model_reloader is not None:
+        model_reloader.stop()
+        model_reloader = None
+
+
+def _on_model_swap(context) -> None:
+    """Serve a newly promoted model (called from the reloader thread)."""
+    global pipeline
+
+    context.bind_knowledge_engine(knowledge_engine)
+    pipeline = context.pipeline
 
 
 # ---------------------------------------------------------------------------
@@ -113,6 +215,21 @@ class CarInput(BaseModel):
     transmission: str = Field(..., description="Transmission type (Manual/Automatic)")
     mileage: int = Field(..., ge=0, description="Kilometers driven")
     fuelType: str = Field(..., description="Fuel type (Petrol/Diesel/CNG/LPG/Electric)")
+    explanation_level: Literal["none", "approx", "exact"] = Field(
+        default="exact",
+        description=(
+            "Price factor attribution: none (0 ms), approx (path attribution, "
+            "~3 ms) or exact (TreeSHAP, ~13 ms)"
+        ),
+    )
+    deadline_ms: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Latency budget for the valuation in ms; the explanation is "
+            "degraded to a cheaper level when it would not fit"
+        ),
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -144,6 +261,42 @@ class PredictionResponse(BaseModel):
         default=[], description="Similar vehicle recommendations"
     )
     input_summary: dict = Field(..., description="Summary of input features used")
+    explanation: dict = Field(
+        default={},
+        description="Top price factors and the explanation level actually used",
+    )
+    model_version: str = Field(
+        default="", description="Production model version that valued the car"
+    )
+
+
+class BatchPredictionRequest(BaseModel):
+    """Input schema for batch car price prediction."""
+
+    cars: List[Dict[str, Any]] = Field(
+        ...,
+        description=(
+            "Cars to value, each following the CarInput schema. "
+            "Rows are validated individually."
+        ),
+    )
+
+
+class BatchPredictionItem(BaseModel):
+    """Outcome of a single row in a batch prediction."""
+
+    index: int = Field(..., description="Position of the row in the request")
+    status: str = Field(..., description="'ok' or 'error'")
+    result: Optional[PredictionResponse] = None
+    error: Optional[str] = None
+
+
+class BatchPredictionResponse(BaseModel):
+    """Output schema for batch car price prediction."""
+
+    results: List[BatchPredictionItem]
+    n_succeeded: int
+    n_failed: int
 
 
 class HealthResponse(BaseModel):
@@ -153,6 +306,26 @@ class HealthResponse(BaseModel):
     model_loaded: bool
     knowledge_engine_loaded: bool
     version: str = "2.0.0"
+    model_version: Optional[str] = Field(
+        default=None, description="Active production model version"
+    )
+    model_reloads: Optional[Dict[str, float]] = Field(
+        default=None, description="Registry polling settings and counters, if enabled"
+    )
+    process_memory: Dict[str, Union[int, float]] = Field(
+        default={},
+        description="pid and resident (RSS), unique (USS), proportional (PSS) MB",
+    )
+    inference_pool: Dict[str, int] = Field(
+        default={}, description="Worker pool limits and counters"
+    )
+    request_coalescing: Optional[Dict[str, float]] = Field(
+        default=None, description="Micro-batching settings and counters, if enabled"
+    )
+    valuation_cache: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="Result cache settings and hit/miss ratios, if enabled",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -176,9 +349,27 @@ async def health_check():
         model_loaded=pipeline is not None,
         knowledge_engine_loaded=knowledge_engine is not None,
         version="2.0.0",
+        model_version=loaded_model_version(),
+        model_reloads=model_reloader.stats() if model_reloader else None,
+        process_memory=dict(process_memory(), pid=os.getpid()),
+        inference_pool=inference_pool.stats(),
+        request_coalescing=coalescer.stats() if coalescer else None,
+        valuation_cache=valuation_cache.stats() if valuation_cache else None,
     )
 
 
+async def _run_inference(fn, *args):
+    """Run a blocking valuation on the inference pool; 429 when it is full."""
+    try:
+        return await inference_pool.run(fn, *args)
+    except InferencePoolSaturated:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many valuations in progress. Retry shortly.",
+            headers={"Retry-After": "1"},
+        )
+
+
 @app.post(
     "/predict",
     response_model=PredictionResponse,
@@ -192,6 +383,50 @@ async def predict(car: CarInput):
 
     Returns the predicted price in Indian Lakhs notation.
     """
+    if valuation_cache is None:
+        return await _value(car)
+
+    version = loaded_model_version()
+    if version is None:  # not loaded yet, or a new model was promoted
+        return await _value(car)
+
+    valuation_cache.sync_version(version)
+    key = valuation_cache.key(version, car.model_dump(exclude={"deadline_ms"}))
+    response = valuation_cache.get(key)
+    if response is not None:
+        return response
+
+    # Only a result that will be stored is valued at the bucket midpoint.
+    # With a deadline the explanation may be degraded, which is not stored
+    # (a provider without an approximate mode runs "approx" as "exact").
+    bucketed = car.model_copy(
+        update={"mileage": valuation_cache.bucket_mileage(car.mileage)}
+    )
+    valued = bucketed if car.deadline_ms is None else car
+    response = await _value(valued)
+    at_least_requested = EXPLANATION_LEVELS[
+        EXPLANATION_LEVELS.index(car.explanation_level) :
+    ]
+    if (
+        valued.mileage == bucketed.mileage
+        and response.explanation.get("level") in at_least_requested
+    ):
+        valuation_cache.put(key, response)
+    return response
+
+
+async def _value(car: CarInput) -> PredictionResponse:
+    """Value one car on the inference pool, through the coalescer if enabled."""
+    if coalescer is None:
+        return await _run_inference(_predict, car)
+    deadline = None
+    if car.deadline_ms is not None:
+        deadline = time.perf_counter() + car.deadline_ms / 1000
+    return await coalescer.submit((car, deadline))
+
+
+def _check_loaded() -> None:
+    """Raise 503 unless the model and knowledge engine are loaded."""
     if pipeline is None:
         raise HTTPException(
             status_code=503,
@@ -203,47 +438,64 @@ async def predict(car: CarInput):
             detail="Knowledge Engine not loaded.",
         )
 
-    try:
-        # Retrieve specs from knowledge engine automatically
-        specs = knowledge_engine.get_specs(
-            brand=car.brand,
-            base_model=car.model,
-            year=car.year,
-            variant=car.variant,
-            fuel=car.fuelType,
-            transmission=car.transmission,
+
+def _resolve_car(car: CarInput) -> Dict[str, Any]:
+    """
+    ``predict_price`` arguments for a car, with specs from the knowledge
+    engine.
+
+    Raises:
+        HTTPException: 400 if the configuration does not exist.
+    """
+    specs = knowledge_engine.get_specs(
+        brand=car.brand,
+        base_model=car.model,
+        year=car.year,
+        variant=car.variant,
+        fuel=car.fuelType,
+        transmission=car.transmission,
+    )
+
+    if not specs:
+        raise HTTPException(
+            status_code=400,
+            detail=INVALID_CONFIGURATION,
         )
 
-        if not specs:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid vehicle configuration. Combination does not exist in the Indian market.",
-            )
+    return {
+        "brand": car.brand,
+        "model": knowledge_engine.get_full_model_string(car.model, car.variant),
+        "year": car.year,
+        "transmission": car.transmission,
+        "mileage": car.mileage,
+        "fuel_type": car.fuelType,
+        "mpg": specs["mileage"],
+        "engine_size": specs["engineSize"],
+    }
+
+
+def _predict(car: CarInput, deadline: Optional[float] = None) -> PredictionResponse:
+    """
+    Blocking body of POST /predict, run on the inference pool.
 
-        full_model = knowledge_engine.get_full_model_string(car.model, car.variant)
+    ``deadline`` (a ``time.perf_counter()`` time) overrides
+    ``car.deadline_ms`` for requests that already waited in a batch.
+    """
+    deadline_ms = car.deadline_ms
+    if deadline is not None:
+        deadline_ms = max(0.0, (deadline - time.perf_counter()) * 1000)
+
+    _check_loaded()
 
+    try:
         result = predict_price(
-            brand=car.brand,
-            model=full_model,
-            year=car.year,
-            transmission=car.transmission,
-            mileage=car.mileage,
-            fuel_type=car.fuelType,
-            mpg=specs["mileage"],
-            engine_size=specs["engineSize"],
-            pipeline=pipeline,
+            **_resolve_car(car),
+            context=get_inference_context(knowledge_engine),
+            explanation_level=car.explanation_level,
+            deadline_ms=deadline_ms,
         )
 
-        return PredictionResponse(
-            predicted_price=result["predicted_price"],
-            predicted_price_raw=result["predicted_price_raw"],
-            price_range=result["price_range"],
-            original_price=result["original_price"],
-            depreciation_percent=result["depreciation_percent"],
-            confidence=result["confidence"],
-            recommendations=result.get("recommendations", []),
-            input_summary=result["input_summary"],
-        )
+        return _to_prediction_response(result)
 
     except HTTPException:
         raise
@@ -255,6 +507,170 @@ async def predict(car: CarInput):
         )
 
 
+@app.post(
+    "/predict/batch",
+    response_model=BatchPredictionResponse,
+    tags=["Prediction"],
+    summary="Predict many car prices",
+    description=(
+        "Predict the prices of up to 10,000 used cars in a single request. "
+        "Invalid rows are reported individually without failing the batch."
+    ),
+)
+async def predict_batch(request: BatchPredictionRequest):
+    """
+    Predict the prices of many used cars.
+
+    Specs are resolved with one knowledge base join and all valid rows go
+    through feature engineering and the model pipeline together.
+    """
+    return await _run_inference(_predict_batch, request)
+
+
+def _predict_batch(request: BatchPredictionRequest) -> BatchPredictionResponse:
+    """Blocking body of POST /predict/batch, run on the inference pool."""
+    _check_loaded()
+    if len(request.cars) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large. At most {MAX_BATCH_SIZE} cars per request.",
+        )
+
+    items: List[Optional[BatchPredictionItem]] = [None] * len(request.cars)
+
+    # 1. Per-row schema validation
+    valid_rows, valid_index = [], []
+    for i, raw in enumerate(request.cars):
+        try:
+            car = CarInput.model_validate(raw)
+        except ValidationError as e:
+            items[i] = BatchPredictionItem(
+                index=i, status="error", error=_format_validation_error(e)
+            )
+            continue
+        valid_rows.append(car.model_dump())
+        valid_index.append(i)
+
+    try:
+        if valid_rows:
+            cars = pd.DataFrame(valid_rows, index=valid_index)
+
+            # 2. Resolve specs for every row in one join
+            specs = knowledge_engine.get_specs_batch(
+                cars.rename(columns={"model": "base_model"})
+            )
+            for i in specs.index[~specs["found"]]:
+                items[i] = BatchPredictionItem(
+                    index=i, status="error", error=INVALID_CONFIGURATION
+                )
+
+            found = cars[specs["found"]]
+            if len(found) > 0:
+                full_model = (found["model"] + " " + found["variant"]).str.strip()
+                full_model = full_model.where(
+                    found["variant"] != "Standard", found["model"]
+                )
+                batch = pd.DataFrame(
+                    {
+                        "brand": found["brand"],
+                        "model": full_model,
+                        "year": found["year"],
+                        "transmission": found["transmission"],
+                        "mileage": found["mileage"],
+                        "fuel_type": found["fuelType"],
+                        "mpg": specs.loc[found.index, "mileage"],
+                        "engine_size": specs.loc[found.index, "engineSize"],
+                    }
+                )
+
+                # 3. Vectorized valuation
+                results = predict_price_batch(
+                    batch, context=get_inference_context(knowledge_engine)
+                )
+                for i, result in zip(found.index, results):
+                    items[i] = BatchPredictionItem(
+                        index=i,
+                        status="ok",
+                        result=_to_prediction_response(result),
+                    )
+
+    except Exception as e:
+        logger.error(f"Batch prediction error: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Batch prediction failed: {str(e)}",
+        )
+
+    n_failed = sum(item.status == "error" for item in items)
+    return BatchPredictionResponse(
+        results=items,
+        n_succeeded=len(items) - n_failed,
+        n_failed=n_failed,
+    )
+
+
+def _predict_coalesced(
+    requests: List[Tuple[CarInput, Optional[float]]],
+) -> List[Union[PredictionResponse, HTTPException]]:
+    """
+    Batch handler of the /predict coalescer: value (car, deadline) pairs
+    with one model call (see ``predict_prices``).
+
+    Returns one response, or the HTTPException for that request, per pair.
+    """
+    _check_loaded()
+    results: List[Union[PredictionResponse, HTTPException]] = [None] * len(requests)
+    valid, cars = [], []
+    for i, (car, _) in enumerate(requests):
+        try:
+            cars.append(_resolve_car(car))
+            valid.append(i)
+        except HTTPException as e:
+            results[i] = e
+
+    try:
+        if cars:
+            valuations = predict_prices(
+                cars,
+                context=get_inference_context(knowledge_engine),
+                explanation_levels=[requests[i][0].explanation_level for i in valid],
+                deadlines=[requests[i][1] for i in valid],
+            )
+            for i, result in zip(valid, valuations):
+                results[i] = _to_prediction_response(result)
+    except Exception as e:
+        logger.error(f"Prediction error: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Prediction failed: {str(e)}",
+        )
+    return results
+
+
+def _to_prediction_response(result: Dict[str, Any]) -> PredictionResponse:
+    """Map a predict_price result dict onto the API response schema."""
+    return PredictionResponse(
+        predicted_price=result["predicted_price"],
+        predicted_price_raw=result["predicted_price_raw"],
+        price_range=result["price_range"],
+        original_price=result["original_price"],
+        depreciation_percent=result["depreciation_percent"],
+        confidence=result["confidence"],
+        recommendations=result.get("recommendations", []),
+        input_summary=result["input_summary"],
+        explanation=result["valuation_report"]["explanation"],
+        model_version=result["model_version"],
+    )
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """Flatten a pydantic ValidationError into a single readable line."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
 @app.get("/knowledge/brands", tags=["Knowledge Engine"])
 async def get_brands():
     """Get the list of all valid car brands."""
@@ -0,0 +1,181 @@
+"""
+Compiled Pipeline
+=================
+
+Single-record fast path for the production sklearn pipeline.
+
+The production pipeline is a ColumnTransformer (OneHotEncoder +
+StandardScaler) in front of a regressor. For one car, running the
+ColumnTransformer on a one-row DataFrame costs far more than the model
+itself. ``CompiledPipeline`` reads the fitted encoder categories and scaler
+statistics once and writes a feature record straight into a preallocated
+(per-thread) float64 vector in the transformer's output order, then calls
+the final estimator on it. The vector is the exact array the pipeline would
+have built, so predictions are identical.
+
+Pipelines with other steps or transformer settings are not compiled
+(``CompiledPipeline.compile`` returns None) and callers keep using the
+DataFrame path.
+"""
+
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from src.utils import logger
+
+
+class CompiledPipeline:
+    """
+    Record -> feature vector -> prediction, equivalent to ``pipeline.predict``.
+
+    Use ``CompiledPipeline.compile(pipeline)`` rather than the constructor.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        feature_names: List[str],
+        categorical: List[tuple],
+        numerical: List[tuple],
+        n_outputs: int,
+    ):
+        self.pipeline = pipeline
+        self.estimator = pipeline.steps[-1][1]
+        self.feature_names = feature_names
+        # (feature, {category: output column}) per one-hot encoded feature
+        self._categorical = categorical
+        # (feature, output column, mean, scale) per numerical feature
+        self._numerical = numerical
+        self.n_outputs = n_outputs
+        self._local = threading.local()
+
+    @classmethod
+    def compile(cls, pipeline) -> Optional["CompiledPipeline"]:
+        """
+        Compile a fitted pipeline, or return None if it is not supported.
+
+        Supported: ``Pipeline([ColumnTransformer, estimator])`` whose
+        transformers are OneHotEncoders (``handle_unknown='ignore'``, no
+        ``drop``, no infrequent categories) and StandardScalers, with the
+        remainder dropped.
+        """
+        try:
+            return cls._compile(pipeline)
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.info(f"Single-record fast path unavailable: {e}")
+            return None
+
+    @classmethod
+    def _compile(cls, pipeline) -> "CompiledPipeline":
+        if not isinstance(pipeline, Pipeline) or len(pipeline.steps) != 2:
+            raise TypeError("expected a two-step Pipeline")
+        preprocessor = pipeline.steps[0][1]
+        if not isinstance(preprocessor, ColumnTransformer):
+            raise TypeError("first step is not a ColumnTransformer")
+
+        categorical, numerical = [], []
+        offset = 0
+        for name, transformer, columns in preprocessor.transformers_:
+            if transformer == "drop" or len(columns) == 0:
+                continue
+            if name == "remainder":
+                raise ValueError("remainder columns are not dropped")
+            columns = list(columns)
+
+            if isinstance(transformer, OneHotEncoder):
+                if (
+                    transformer.handle_unknown != "ignore"
+                    or transformer.drop_idx_ is not None
+                    or getattr(transformer, "_infrequent_enabled", False)
+                ):
+                    raise ValueError(f"unsupported OneHotEncoder settings in {name}")
+                for column, categories in zip(columns, transformer.categories_):
+                    positions = {c: offset + i for i, c in enumerate(categories)}
+                    categorical.append((column, positions))
+                    offset += len(categories)
+            elif isinstance(transformer, StandardScaler):
+                means = (
+                    transformer.mean_
+                    if transformer.with_mean
+                    else np.zeros(len(columns))
+                )
+                scales = (
+                    transformer.scale_
+                    if transformer.with_std
+                    else np.ones(len(columns))
+                )
+                for column, mean, scale in zip(columns, means, scales):
+                    numerical.append((column, offset, float(mean), float(scale)))
+                    offset += 1
+            else:
+                raise TypeError(f"unsupported transformer {type(transformer)}")
+
+        feature_names = list(getattr(pipeline, "feature_names_in_", []))
+        if not feature_names:
+            raise ValueError("pipeline was not fitted on a DataFrame")
+        return cls(pipeline, feature_names, categorical, numerical, offset)
+
+    def accepts(self, features: Mapping[str, Any]) -> bool:
+        """Whether ``features`` holds every column the pipeline was trained on."""
+        return all(name in features for name in self.feature_names)
+
+    def transform_record(
+        self, features: Mapping[str, Any], out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Write the preprocessed feature vector for one record.
+
+        Args:
+            features: Engineered feature record.
+            out: Vector to fill (allocated if omitted).
+
+        Returns:
+            float64 vector, identical to the pipeline's transformed row.
+        """
+        if out is None:
+            out = np.empty(self.n_outputs)
+        out.fill(0.0)
+        for column, positions in self._categorical:
+            position = positions.get(features[column])
+            if position is not None:  # unknown categories encode as all zeros
+                out[position] = 1.0
+        for column, position, mean, scale in self._numerical:
+            out[position] = (features[column] - mean) / scale
+        return out
+
+    def predict_record(self, features: Mapping[str, Any]) -> float:
+        """Model prediction for one engineered feature record."""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = np.empty((1, self.n_outputs))
+        self.transform_record(features, buffer[0])
+        return float(self.estimator.predict(buffer)[0])
+
+    def predict_records(self, records: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """
+        Model predictions for many engineered feature records, with a single
+        estimator call (identical to ``predict_record`` per record).
+        """
+        matrix = np.empty((len(records), self.n_outputs))
+        for i, features in enumerate(records):
+            self.transform_record(features, matrix[i])
+        return np.asarray(self.estimator.predict(matrix), dtype=float)
+
+    def input_frame(self, features: Mapping[str, Any]) -> pd.DataFrame:
+        """One-row model input frame, for consumers that need one (explainers)."""
+        row: Dict[str, Any] = {name: [features[name]] for name in self.feature_names}
+        return pd.DataFrame(row)
+
+    def input_frames(self, records: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+        """Model input frame with one row per record."""
+        columns: Dict[str, Any] = {
+            name: [features[name] for features in records]
+            for name in self.feature_names
+        }
+        return pd.DataFrame(columns)
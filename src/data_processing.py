@@ -16,11 +16,23 @@ This module handles:
 Data Sources:
     - Dataset A: CarDekho v3 (nehalbirla/vehicle-dataset-from-cardekho) — ODbL License
     - Dataset B: Kasliwal Multi-City (avikasliwal/used-cars-price-prediction) — Public/Kaggle
+    - Dataset C: DRIVEIQ v1 UK per-brand archive (data/archive/) — disabled by default
+
+Sources are declared in src/data_sources.py.
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 from sklearn.compose import ColumnTransformer
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
@@ -30,7 +42,6 @@ from src.utils import (
     NUMERICAL_FEATURES,
     TARGET_COLUMN,
     CURRENT_YEAR,
-    get_data_dir,
     logger,
 )
 
@@ -74,6 +85,58 @@ OWNER_NORMALIZE = {
 }
 
 
+# Unified schema shared by every source loader
+UNIFIED_COLUMNS = [
+    "brand",
+    "model",
+    "base_model",
+    "variant",
+    "year",
+    "selling_price",
+    "km_driven",
+    "fuel_type",
+    "transmission",
+    "owner_type",
+    "mileage_kmpl",
+    "engine_cc",
+    "max_power_bhp",
+    "seats",
+    "seller_type",
+    "location",
+    "source",
+]
+
+
+# Raw -> unified column names for each source format
+CARDEKHO_V3_SCHEMA = {
+    "selling_price": "selling_price",
+    "km_driven": "km_driven",
+    "fuel": "fuel_type",
+    "transmission": "transmission",
+    "owner": "owner_type",
+    "seats": "seats",
+}
+KASLIWAL_SCHEMA = {
+    "Year": "year",
+    "Kilometers_Driven": "km_driven",
+    "Fuel_Type": "fuel_type",
+    "Transmission": "transmission",
+    "Owner_Type": "owner_type",
+    "Seats": "seats",
+    "Location": "location",
+}
+UK_ARCHIVE_SCHEMA = {
+    "model": "model",
+    "year": "year",
+    "price": "price_gbp",
+    "transmission": "transmission",
+    "mileage": "mileage_miles",
+    "fuelType": "fuel_type",
+    "mpg": "mpg",
+    "engineSize": "engine_litres",
+}
+
+
 # ---------------------------------------------------------------------------
 # Parsing Utilities
 # ---------------------------------------------------------------------------
@@ -184,12 +247,184 @@ def parse_mileage_kmpl(value) -> Optional[float]:
         return None
 
 
+# ---------------------------------------------------------------------------
+# Columnar Parsing (vectorized equivalents of the parsers above)
+# ---------------------------------------------------------------------------
+# Columns are parsed with Arrow string kernels. The few values the kernels
+# cannot reproduce exactly (non-ASCII text, irregular whitespace, multi-word
+# brands) go through the row-wise parsers, so results are identical.
+# Without pyarrow the row-wise parsers are used for every value.
+
+# ASCII characters treated as whitespace by str.split() and str.strip()
+_ASCII_WHITESPACE = "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f "
+
+# Names that are not single-spaced printable ASCII or start with a
+# multi-word brand
+_IRREGULAR_NAME = r"^$|^ | $|  |[^\x20-\x7e]|^(?:Land Rover|Ashok Leyland)(?: |$)"
+
+# Plain decimal literals; anything else goes through Python's float()
+_DECIMAL_PATTERN = r"^[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?$"
+
+# Suffixes stripped by parse_numeric_with_unit, in order
+_NUMERIC_SUFFIXES = ["CC", "cc", "bhp", "BHP", "kmpl", "km/kg", "kmkg"]
+
+
+def _to_arrow(values: pd.Series) -> "pa.Array":
+    """Arrow string array of ``values``; non-string values become null."""
+    values = values.to_numpy(dtype=object)
+    try:
+        return pa.array(values, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        is_str = np.array([type(v) is str for v in values], dtype=bool)
+        return pa.array(np.where(is_str, values, None), type=pa.string())
+
+
+def _positions(mask: "pa.Array") -> np.ndarray:
+    """Positions where an Arrow boolean mask is true (nulls count as false)."""
+    return np.flatnonzero(pc.fill_null(mask, False).to_numpy(zero_copy_only=False))
+
+
+def _non_empty_or(values: "pa.Array", default: str) -> "pa.Array":
+    """Replace null and empty strings with ``default``."""
+    return pc.if_else(pc.fill_null(pc.not_equal(values, ""), False), values, default)
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_float_array(cleaned: "pa.Array") -> np.ndarray:
+    """
+    Convert strings to float exactly as ``float()`` would, NaN on failure.
+
+    Plain decimals are cast in one pass; the remaining strings (empty,
+    'null', 'inf', ...) fall back to ``float()`` one by one.
+    """
+    is_decimal = pc.fill_null(
+        pc.match_substring_regex(cleaned, _DECIMAL_PATTERN), False
+    )
+    decimals = pc.if_else(is_decimal, cleaned, pa.scalar(None, pa.string()))
+    result = pc.cast(decimals, pa.float64()).to_numpy(zero_copy_only=False)
+
+    others = _positions(pc.and_(pc.is_valid(cleaned), pc.invert(is_decimal)))
+    for pos, value in zip(others, cleaned.take(others).to_pylist()):
+        parsed = _to_float(value)
+        result[pos] = np.nan if parsed is None else parsed
+    return result
+
+
+def _parse_non_ascii(result: np.ndarray, values: pd.Series, text, parse) -> None:
+    """Re-parse non-ASCII values of ``text`` in place with a row-wise parser."""
+    for pos in _positions(pc.invert(pc.string_is_ascii(text))):
+        parsed = parse(values.iloc[pos])
+        result[pos] = np.nan if parsed is None else parsed
+
+
+def parse_brand_model_columns(names: pd.Series) -> pd.DataFrame:
+    """
+    Vectorized ``parse_brand_model`` over a Series of names.
+
+    Args:
+        names: Combined car names.
+
+    Returns:
+        DataFrame with brand, model, base_model and variant columns,
+        identical to applying ``parse_brand_model`` row by row.
+    """
+    columns = ["brand", "model", "base_model", "variant"]
+    if not PYARROW_AVAILABLE:
+        return pd.DataFrame(
+            [parse_brand_model(n) for n in names], columns=columns, index=names.index
+        )
+
+    text = _to_arrow(names)
+    parts = pc.split_pattern(text, " ")
+
+    brand = pc.list_element(parts, 0).to_pandas()
+    parsed = pd.DataFrame(
+        {
+            "brand": brand.map(BRAND_NORMALIZE).fillna(brand).fillna("Unknown"),
+            "model": _non_empty_or(
+                pc.binary_join(pc.list_slice(parts, 1, 4), " "), "Unknown"
+            ).to_pandas(),
+            "base_model": _non_empty_or(
+                pc.binary_join(pc.list_slice(parts, 1, 2), ""), "Unknown"
+            ).to_pandas(),
+            "variant": _non_empty_or(
+                pc.binary_join(pc.list_slice(parts, 2), " "), "Standard"
+            ).to_pandas(),
+        }
+    )
+
+    irregular = _positions(pc.match_substring_regex(text, _IRREGULAR_NAME))
+    if len(irregular):
+        parsed.iloc[irregular] = [parse_brand_model(n) for n in names.iloc[irregular]]
+    parsed.index = names.index
+    return parsed
+
+
+def parse_numeric_column(values: pd.Series, unit_to_strip: str = "") -> pd.Series:
+    """
+    Vectorized ``parse_numeric_with_unit`` over a Series.
+
+    Returns:
+        Float Series, NaN where parsing fails.
+    """
+    if not PYARROW_AVAILABLE:
+        return values.apply(lambda x: parse_numeric_with_unit(x, unit_to_strip))
+
+    text = _to_arrow(values)
+    cleaned = pc.utf8_trim(text, _ASCII_WHITESPACE)
+    for suffix in ([unit_to_strip] if unit_to_strip else []) + _NUMERIC_SUFFIXES:
+        cleaned = pc.replace_substring(cleaned, suffix, "")
+        cleaned = pc.utf8_trim(cleaned, _ASCII_WHITESPACE)
+
+    result = _to_float_array(cleaned)
+    _parse_non_ascii(
+        result, values, text, lambda x: parse_numeric_with_unit(x, unit_to_strip)
+    )
+    return pd.Series(result, index=values.index, name=values.name)
+
+
+def parse_mileage_kmpl_column(values: pd.Series) -> pd.Series:
+    """
+    Vectorized ``parse_mileage_kmpl`` over a Series.
+
+    Returns:
+        Float Series of fuel efficiency in kmpl, NaN where parsing fails.
+    """
+    if not PYARROW_AVAILABLE:
+        return values.apply(parse_mileage_kmpl)
+
+    text = _to_arrow(values)
+    cleaned = pc.ascii_lower(pc.utf8_trim(text, _ASCII_WHITESPACE))
+
+    # Only the first unit present is removed
+    unmatched = pc.is_valid(cleaned)
+    for unit in ["kmpl", "km/kg", "km/l"]:
+        has_unit = pc.and_(unmatched, pc.match_substring(cleaned, unit))
+        stripped = pc.utf8_trim(
+            pc.replace_substring(cleaned, unit, ""), _ASCII_WHITESPACE
+        )
+        cleaned = pc.if_else(has_unit, stripped, cleaned)
+        unmatched = pc.and_(unmatched, pc.invert(has_unit))
+
+    result = _to_float_array(cleaned)
+    _parse_non_ascii(result, values, text, parse_mileage_kmpl)
+    return pd.Series(result, index=values.index, name=values.name)
+
+
 # ---------------------------------------------------------------------------
 # Dataset A: CarDekho v3 Loader
 # ---------------------------------------------------------------------------
 
 
-def load_cardekho_v3(filepath: Path) -> pd.DataFrame:
+def load_cardekho_v3(
+    filepath: Path, schema: Dict[str, str] = CARDEKHO_V3_SCHEMA
+) -> pd.DataFrame:
     """
     Load and standardize the CarDekho v3 dataset.
 
@@ -198,6 +433,7 @@ def load_cardekho_v3(filepath: Path) -> pd.DataFrame:
 
     Args:
         filepath: Path to cardekho_v3.csv.
+        schema: Raw to unified column name mapping.
 
     Returns:
         DataFrame with standardized column names.
@@ -207,30 +443,16 @@ def load_cardekho_v3(filepath: Path) -> pd.DataFrame:
     logger.info(f"  Raw records: {len(df)}")
 
     # Parse brand and model from 'name'
-    parsed = df["name"].apply(parse_brand_model)
-    df["brand"] = parsed.apply(lambda x: x[0])
-    df["model"] = parsed.apply(lambda x: x[1])
-    df["base_model"] = parsed.apply(lambda x: x[2])
-    df["variant"] = parsed.apply(lambda x: x[3])
+    parsed = parse_brand_model_columns(df["name"])
+    df[["brand", "model", "base_model", "variant"]] = parsed
 
     # Parse numeric fields from strings
-    df["mileage_kmpl"] = df["mileage"].apply(parse_mileage_kmpl)
-    df["engine_cc"] = df["engine"].apply(lambda x: parse_numeric_with_unit(x, "CC"))
-    df["max_power_bhp"] = df["max_power"].apply(
-        lambda x: parse_numeric_with_unit(x, "bhp")
-    )
+    df["mileage_kmpl"] = parse_mileage_kmpl_column(df["mileage"])
+    df["engine_cc"] = parse_numeric_column(df["engine"], "CC")
+    df["max_power_bhp"] = parse_numeric_column(df["max_power"], "bhp")
 
     # Rename columns to unified schema
-    df = df.rename(
-        columns={
-            "selling_price": "selling_price",
-            "km_driven": "km_driven",
-            "fuel": "fuel_type",
-            "transmission": "transmission",
-            "owner": "owner_type",
-            "seats": "seats",
-        }
-    )
+    df = df.rename(columns=schema)
 
     # Normalize categorical values
     df["fuel_type"] = df["fuel_type"].map(FUEL_NORMALIZE).fillna(df["fuel_type"])
@@ -245,26 +467,7 @@ def load_cardekho_v3(filepath: Path) -> pd.DataFrame:
     df["source"] = "cardekho_v3"
 
     # Select unified columns
-    unified_cols = [
-        "brand",
-        "model",
-        "base_model",
-        "variant",
-        "year",
-        "selling_price",
-        "km_driven",
-        "fuel_type",
-        "transmission",
-        "owner_type",
-        "mileage_kmpl",
-        "engine_cc",
-        "max_power_bhp",
-        "seats",
-        "seller_type",
-        "location",
-        "source",
-    ]
-    df = df[[c for c in unified_cols if c in df.columns]].copy()
+    df = df[[c for c in UNIFIED_COLUMNS if c in df.columns]].copy()
 
     logger.info(f"  Standardized records: {len(df)}")
     return df
@@ -275,7 +478,9 @@ def load_cardekho_v3(filepath: Path) -> pd.DataFrame:
 # ---------------------------------------------------------------------------
 
 
-def load_kasliwal_multicity(filepath: Path) -> pd.DataFrame:
+def load_kasliwal_multicity(
+    filepath: Path, schema: Dict[str, str] = KASLIWAL_SCHEMA
+) -> pd.DataFrame:
     """
     Load and standardize the Kasliwal multi-city dataset.
 
@@ -284,6 +489,7 @@ def load_kasliwal_multicity(filepath: Path) -> pd.DataFrame:
 
     Args:
         filepath: Path to kasliwal_train.csv.
+        schema: Raw to unified column name mapping.
 
     Returns:
         DataFrame with standardized column names.
@@ -297,38 +503,20 @@ def load_kasliwal_multicity(filepath: Path) -> pd.DataFrame:
         df = df.drop(columns=["Unnamed: 0"])
 
     # Parse brand and model from 'Name'
-    parsed = df["Name"].apply(parse_brand_model)
-    df["brand"] = parsed.apply(lambda x: x[0])
-    df["model"] = parsed.apply(lambda x: x[1])
-    df["base_model"] = parsed.apply(lambda x: x[2])
-    df["variant"] = parsed.apply(lambda x: x[3])
+    parsed = parse_brand_model_columns(df["Name"])
+    df[["brand", "model", "base_model", "variant"]] = parsed
 
     # Convert price from Lakhs to raw INR
     df["selling_price"] = (df["Price"] * 100_000).astype(int)
 
     # Parse numeric fields
-    df["mileage_kmpl"] = df["Mileage"].apply(parse_mileage_kmpl)
-    df["engine_cc"] = df["Engine"].apply(lambda x: parse_numeric_with_unit(x, "CC"))
-    df["max_power_bhp"] = df["Power"].apply(
-        lambda x: (
-            parse_numeric_with_unit(x, "bhp")
-            if isinstance(x, str) and x.strip().lower() != "null"
-            else None
-        )
-    )
+    # ('null bhp' and friends fail to parse and become NaN)
+    df["mileage_kmpl"] = parse_mileage_kmpl_column(df["Mileage"])
+    df["engine_cc"] = parse_numeric_column(df["Engine"], "CC")
+    df["max_power_bhp"] = parse_numeric_column(df["Power"], "bhp")
 
     # Rename columns to unified schema
-    df = df.rename(
-        columns={
-            "Year": "year",
-            "Kilometers_Driven": "km_driven",
-            "Fuel_Type": "fuel_type",
-            "Transmission": "transmission",
-            "Owner_Type": "owner_type",
-            "Seats": "seats",
-            "Location": "location",
-        }
-    )
+    df = df.rename(columns=schema)
 
     # Normalize categorical values
     df["fuel_type"] = df["fuel_type"].map(FUEL_NORMALIZE).fillna(df["fuel_type"])
@@ -342,65 +530,255 @@ def load_kasliwal_multicity(filepath: Path) -> pd.DataFrame:
     df["source"] = "kasliwal_multicity"
 
     # Select unified columns
-    unified_cols = [
-        "brand",
-        "model",
-        "base_model",
-        "variant",
-        "year",
-        "selling_price",
-        "km_driven",
-        "fuel_type",
-        "transmission",
-        "owner_type",
-        "mileage_kmpl",
-        "engine_cc",
-        "max_power_bhp",
-        "seats",
-        "seller_type",
-        "location",
-        "source",
-    ]
-    df = df[[c for c in unified_cols if c in df.columns]].copy()
+    df = df[[c for c in UNIFIED_COLUMNS if c in df.columns]].copy()
+
+    logger.info(f"  Standardized records: {len(df)}")
+    return df
+
+
+# ---------------------------------------------------------------------------
+# Dataset C: Archived UK Listings Loader (DRIVEIQ v1)
+# ---------------------------------------------------------------------------
+
+# Approximate reference rate; UK prices are a different market, so these
+# sources are disabled by default (see src/data_sources.py)
+GBP_TO_INR = 105.0
+KM_PER_MILE = 1.609344
+KMPL_PER_UK_MPG = KM_PER_MILE / 4.54609  # imperial gallon in litres
+
+UK_TRANSMISSION_NORMALIZE = {"Semi-Auto": "Automatic"}
+
+
+def load_uk_archive(
+    filepath: Path,
+    brand: str,
+    schema: Dict[str, str] = UK_ARCHIVE_SCHEMA,
+    source: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Load and standardize one archived per-brand UK listings file.
+
+    Prices are converted from GBP, mileage from miles and fuel economy from
+    imperial mpg, so the output matches the unified Indian schema.
+
+    Args:
+        filepath: Path to a ``data/archive/<brand>.csv`` file.
+        brand: Brand name for every listing in the file.
+        schema: Raw to unified column name mapping.
+        source: ``source`` label of the listings (the registered source
+            name); defaults to ``uk_archive_<brand>``.
+
+    Returns:
+        DataFrame with standardized column names.
+    """
+    logger.info(f"Loading UK archive ({brand}) from {filepath}")
+    df = pd.read_csv(filepath).rename(columns=schema)
+    logger.info(f"  Raw records: {len(df)}")
+
+    df["brand"] = brand
+    df["model"] = df["model"].str.strip()
+    df["base_model"] = df["model"].str.split().str[0].fillna("Unknown")
+    df["variant"] = "Standard"
+
+    # Convert units to the Indian schema (0 marks a missing spec)
+    df["selling_price"] = (df["price_gbp"] * GBP_TO_INR).round().astype(int)
+    df["km_driven"] = (df["mileage_miles"] * KM_PER_MILE).round().astype(int)
+    df["mileage_kmpl"] = (df["mpg"] * KMPL_PER_UK_MPG).where(df["mpg"] > 0)
+    df["engine_cc"] = (df["engine_litres"] * 1000).where(df["engine_litres"] > 0)
+    df["max_power_bhp"] = np.nan
+    df["seats"] = np.nan
+
+    # Normalize categorical values
+    df["fuel_type"] = df["fuel_type"].map(FUEL_NORMALIZE).fillna(df["fuel_type"])
+    df["transmission"] = (
+        df["transmission"]
+        .map({**TRANSMISSION_NORMALIZE, **UK_TRANSMISSION_NORMALIZE})
+        .fillna(df["transmission"])
+    )
+
+    # Add metadata
+    df["owner_type"] = None
+    df["seller_type"] = None
+    df["location"] = None
+    df["source"] = source or f"uk_archive_{brand.lower()}"
+
+    df = df[UNIFIED_COLUMNS].copy()
 
     logger.info(f"  Standardized records: {len(df)}")
     return df
 
 
+# ---------------------------------------------------------------------------
+# Near-Duplicate Detection
+# ---------------------------------------------------------------------------
+
+# Upper bound on candidate pairs materialized at once
+_DEDUP_PAIR_CHUNK = 4_000_000
+
+# Vectorized resolution rounds before finishing long chains row by row
+_DEDUP_MAX_ROUNDS = 64
+
+
+def _near_duplicate_mask_reference(
+    keys: np.ndarray, km: np.ndarray, price: np.ndarray
+) -> np.ndarray:
+    """
+    Row-by-row near-duplicate filter (reference for tests and benchmarks).
+
+    Rows are visited in the given order; a row is dropped when its key
+    matches a previously kept row whose km_driven is within max(500, 2%)
+    and whose price is within 5%.
+    """
+    mask = np.ones(len(keys), dtype=bool)
+    seen = {}
+    for pos in range(len(keys)):
+        key, k, p = keys[pos], km[pos], price[pos]
+        if key in seen:
+            for prev_km, prev_price in seen[key]:
+                km_close = abs(k - prev_km) < max(500, 0.02 * prev_km)
+                price_close = abs(p - prev_price) < 0.05 * prev_price
+                if km_close and price_close:
+                    mask[pos] = False
+                    break
+            if mask[pos]:
+                seen[key].append((k, p))
+        else:
+            seen[key] = [(k, p)]
+    return mask
+
+
+def near_duplicate_mask(
+    keys: np.ndarray, km: np.ndarray, price: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized near-duplicate filter.
+
+    Produces exactly the keep-mask of ``_near_duplicate_mask_reference`` for
+    rows visited in ascending price order (as ``clean_data`` sorts them):
+
+        1. Group rows by key (stable, so visiting order is kept per key).
+        2. Within a group prices are non-decreasing, so every earlier row
+           within 5% of a row's price lies in a contiguous window found with
+           ``searchsorted``. Window pairs are filtered with the original
+           km/price expressions, giving the "close predecessor" pairs.
+        3. A row is kept iff none of its close predecessors is kept. This is
+           resolved in vectorized rounds (each round settles at least the
+           earliest open row); rare long chains are finished row by row.
+
+    Args:
+        keys: Dedup key per row, in visiting order.
+        km: km_driven per row.
+        price: Selling price per row, non-decreasing within each key.
+
+    Returns:
+        Boolean keep-mask aligned with the input order.
+    """
+    n = len(keys)
+    if n == 0:
+        return np.ones(0, dtype=bool)
+
+    codes, _ = pd.factorize(keys, use_na_sentinel=False)
+    perm = np.lexsort((np.arange(n), codes))
+    codes = codes[perm].astype(np.int64)
+    km = np.asarray(km)[perm]
+    price = np.asarray(price)[perm]
+
+    # Monotone composite (group, price rank) for window lookups
+    uniq_prices = np.unique(price)
+    rank = np.searchsorted(uniq_prices, price)
+    stride = len(uniq_prices) + 1
+    composite = codes * stride + rank
+
+    # Earliest candidate: price_i > price_j / 1.05 (with a float safety margin)
+    lower_rank = np.searchsorted(uniq_prices, price / 1.05 * (1 - 1e-9), side="left")
+    lo = np.searchsorted(composite, codes * stride + lower_rank, side="left")
+    counts = np.arange(n) - lo
+
+    # Collect close (predecessor, row) pairs in bounded chunks
+    thresholds = np.arange(_DEDUP_PAIR_CHUNK, counts.sum(), _DEDUP_PAIR_CHUNK)
+    bounds = np.unique(
+        np.concatenate(([0], np.searchsorted(np.cumsum(counts), thresholds), [n]))
+    )
+    pair_i, pair_j = [], []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        c = counts[start:stop]
+        j = np.repeat(np.arange(start, stop), c)
+        offsets = np.arange(len(j)) - np.repeat(np.cumsum(c) - c, c)
+        i = np.repeat(lo[start:stop], c) + offsets
+
+        prev_km, prev_price = km[i], price[i]
+        km_close = np.abs(km[j] - prev_km) < np.maximum(500, 0.02 * prev_km)
+        price_close = np.abs(price[j] - prev_price) < 0.05 * prev_price
+        close = km_close & price_close
+        pair_i.append(i[close])
+        pair_j.append(j[close])
+
+    pair_i = np.concatenate(pair_i)
+    pair_j = np.concatenate(pair_j)
+
+    # 0 = open, 1 = kept, 2 = dropped
+    status = np.ones(n, dtype=np.int8)
+    status[pair_j] = 0
+    for _ in range(_DEDUP_MAX_ROUNDS):
+        open_pairs = status[pair_j] == 0
+        if not open_pairs.any():
+            break
+        pair_i, pair_j = pair_i[open_pairs], pair_j[open_pairs]
+        pred = status[pair_i]
+
+        has_kept = np.zeros(n, dtype=bool)
+        has_kept[pair_j[pred == 1]] = True
+        has_open = np.zeros(n, dtype=bool)
+        has_open[pair_j[pred == 0]] = True
+
+        rows = np.unique(pair_j)
+        status[rows[has_kept[rows]]] = 2
+        status[rows[~has_kept[rows] & ~has_open[rows]]] = 1
+    else:
+        # Finish any remaining chain in visiting order
+        open_pairs = status[pair_j] == 0
+        pair_i, pair_j = pair_i[open_pairs], pair_j[open_pairs]
+        order = np.argsort(pair_j, kind="stable")
+        pair_i, pair_j = pair_i[order], pair_j[order]
+        starts = np.searchsorted(pair_j, np.unique(pair_j))
+        for row, begin, end in zip(
+            pair_j[starts], starts, np.append(starts[1:], len(pair_j))
+        ):
+            status[row] = 2 if (status[pair_i[begin:end]] == 1).any() else 1
+
+    mask = np.empty(n, dtype=bool)
+    mask[perm] = status == 1
+    return mask
+
+
 # ---------------------------------------------------------------------------
 # Unified Data Engineering Pipeline
 # ---------------------------------------------------------------------------
 
 
-def load_and_merge_datasets() -> pd.DataFrame:
+def load_and_merge_datasets(
+    sources: Optional[List[str]] = None, max_workers: Optional[int] = None
+) -> pd.DataFrame:
     """
     Load all approved datasets and merge into a single unified DataFrame.
 
+    Sources come from the registry in ``src.data_sources``; uncached ones
+    are parsed in a process pool.
+
+    Args:
+        sources: Registered source names to load (defaults to the enabled
+            sources, i.e. CarDekho v3 and Kasliwal multi-city).
+        max_workers: Process pool size; 1 loads in-process.
+
     Returns:
         Merged DataFrame with standardized columns.
 
     Raises:
         FileNotFoundError: If no dataset files are found.
     """
-    data_dir = get_data_dir()
-    raw_dir = data_dir / "raw"
-    frames = []
+    from src.data_sources import get_sources, load_sources
 
-    # Load Dataset A: CarDekho v3
-    cardekho_path = raw_dir / "cardekho_v3.csv"
-    if cardekho_path.exists():
-        df_a = load_cardekho_v3(cardekho_path)
-        frames.append(df_a)
-    else:
-        logger.warning(f"CarDekho v3 not found at {cardekho_path}")
-
-    # Load Dataset B: Kasliwal multi-city
-    kasliwal_path = raw_dir / "kasliwal_train.csv"
-    if kasliwal_path.exists():
-        df_b = load_kasliwal_multicity(kasliwal_path)
-        frames.append(df_b)
-    else:
-        logger.warning(f"Kasliwal multi-city not found at {kasliwal_path}")
+    frames = load_sources(get_sources(sources), max_workers=max_workers)
 
     if not frames:
         raise FileNotFoundError(
@@ -508,23 +886,11 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
         + df["transmission"]
     )
     # For same key, remove records with km_driven within 2% and price within 5%
-    mask = pd.Series(True, index=df.index)
-    seen = {}
-    for idx, row in df.iterrows():
-        key = row["_dedup_key"]
-        km = row["km_driven"]
-        price = row["selling_price"]
-        if key in seen:
-            for prev_km, prev_price in seen[key]:
-                km_close = abs(km - prev_km) < max(500, 0.02 * prev_km)
-                price_close = abs(price - prev_price) < 0.05 * prev_price
-                if km_close and price_close:
-                    mask[idx] = False
-                    break
-            if mask[idx]:
-                seen[key].append((km, price))
-        else:
-            seen[key] = [(km, price)]
+    mask = near_duplicate_mask(
+        df["_dedup_key"].to_numpy(),
+        df["km_driven"].to_numpy(),
+        df["selling_price"].to_numpy(),
+    )
 
     df = df[mask].drop(columns=["_dedup_key"])
     logger.info(f"  Removed {before - len(df)} near-duplicate listings")
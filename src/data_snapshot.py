@@ -0,0 +1,157 @@
+"""
+Dataset Snapshot
+================
+
+Versioned on-disk snapshot of the engineered dataset and the
+VehicleKnowledgeEngine knowledge base.
+
+Building the dataset runs the full ``load_and_merge_datasets`` ->
+``clean_data`` -> ``convert_price_to_inr`` -> ``create_features`` chain
+over the raw CSVs. The snapshot stores its result as Parquet under
+``models/snapshots/<key>/``, where the key hashes the raw CSV bytes, the
+source of the modules that produce the frame and the current year (which
+drives ``car_age``). A matching snapshot is loaded directly; otherwise the
+dataset is rebuilt and a new snapshot written.
+
+Usage:
+    python -m src.data_snapshot   # build (or verify) the snapshot ahead of time
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+import pandas as pd
+
+from src.data_processing import (
+    clean_data,
+    convert_price_to_inr,
+    create_features,
+    load_and_merge_datasets,
+)
+from src.knowledge_engine import VehicleKnowledgeEngine
+from src.utils import CURRENT_YEAR, SNAPSHOT_DIR, get_data_dir, logger
+
+try:
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Bump when the snapshot layout changes
+SNAPSHOT_FORMAT_VERSION = 1
+
+FEATURES_FILE = "features.parquet"
+KNOWLEDGE_BASE_FILE = "knowledge_base.parquet"
+
+# Modules whose code determines the engineered frame and knowledge base
+_SOURCE_MODULES = [
+    Path(__file__).resolve().parent / "data_processing.py",
+    Path(__file__).resolve().parent / "data_sources.py",
+    Path(__file__).resolve().parent / "knowledge_engine.py",
+]
+
+
+def compute_snapshot_key(raw_dir: Optional[Path] = None) -> str:
+    """
+    Content hash identifying the dataset a snapshot was built from.
+
+    Args:
+        raw_dir: Directory holding the raw CSVs (defaults to ``data/raw``).
+
+    Returns:
+        First 16 hex characters of the SHA-256 over the raw CSVs, the
+        processing code and the current year.
+    """
+    if raw_dir is None:
+        raw_dir = get_data_dir() / "raw"
+
+    digest = hashlib.sha256()
+    digest.update(f"format={SNAPSHOT_FORMAT_VERSION};year={CURRENT_YEAR}".encode())
+    for path in sorted(Path(raw_dir).glob("*.csv")) + _SOURCE_MODULES:
+        digest.update(path.name.encode())
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def build_dataset() -> pd.DataFrame:
+    """Run the full data engineering chain over the raw CSVs."""
+    raw_df = load_and_merge_datasets()
+    clean_df = clean_data(raw_df)
+    conv_df = convert_price_to_inr(clean_df)
+    return create_features(conv_df)
+
+
+def _write_snapshot(
+    snapshot_path: Path, df: pd.DataFrame, knowledge_engine: VehicleKnowledgeEngine
+) -> None:
+    """Write a snapshot atomically: build it in a temp dir, then rename."""
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(tempfile.mkdtemp(dir=snapshot_path.parent, prefix=".tmp-"))
+    try:
+        df.to_parquet(tmp_path / FEATURES_FILE)
+        knowledge_engine.kb.to_parquet(tmp_path / KNOWLEDGE_BASE_FILE)
+        os.rename(tmp_path, snapshot_path)
+    except OSError:
+        # Another process published the same snapshot first
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not snapshot_path.exists():
+            raise
+        return
+
+    # Drop snapshots of older datasets or code versions
+    for stale in snapshot_path.parent.iterdir():
+        if stale.is_dir() and stale != snapshot_path and not stale.name.startswith("."):
+            shutil.rmtree(stale, ignore_errors=True)
+    logger.info(f"Dataset snapshot written to {snapshot_path}")
+
+
+def load_dataset_snapshot(
+    snapshot_dir: Path = SNAPSHOT_DIR,
+) -> Tuple[pd.DataFrame, VehicleKnowledgeEngine]:
+    """
+    Load the engineered dataset and knowledge engine, rebuilding if stale.
+
+    Args:
+        snapshot_dir: Directory holding versioned snapshots.
+
+    Returns:
+        Tuple of (engineered DataFrame, VehicleKnowledgeEngine).
+    """
+    if not PARQUET_AVAILABLE:
+        logger.warning("pyarrow not installed; building dataset without snapshot.")
+        df = build_dataset()
+        return df, VehicleKnowledgeEngine(df)
+
+    snapshot_path = Path(snapshot_dir) / compute_snapshot_key()
+    if snapshot_path.exists():
+        try:
+            df = pd.read_parquet(snapshot_path / FEATURES_FILE)
+            kb = pd.read_parquet(snapshot_path / KNOWLEDGE_BASE_FILE)
+            logger.info(f"Dataset snapshot loaded from {snapshot_path}")
+            return df, VehicleKnowledgeEngine.from_knowledge_base(kb)
+        except Exception as e:
+            logger.warning(f"Unreadable dataset snapshot, rebuilding: {e}")
+            shutil.rmtree(snapshot_path, ignore_errors=True)
+
+    df = build_dataset()
+    knowledge_engine = VehicleKnowledgeEngine(df)
+    try:
+        _write_snapshot(snapshot_path, df, knowledge_engine)
+    except OSError as e:
+        logger.warning(f"Could not write dataset snapshot: {e}")
+    return df, knowledge_engine
+
+
+if __name__ == "__main__":
+    df, knowledge_engine = load_dataset_snapshot()
+    print(
+        f"Snapshot {compute_snapshot_key()}: {len(df)} rows, "
+        f"{len(knowledge_engine.kb)} configurations"
+    )
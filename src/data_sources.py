@@ -0,0 +1,302 @@
+"""
+Data Source Registry
+====================
+
+Registry of the listing feeds ``load_and_merge_datasets`` can ingest.
+
+Each source declares its CSV path (relative to the data directory), the
+loader that standardizes it into the unified schema and the raw to unified
+column mapping the loader applies. Loaders run in a process pool and each
+source's output is cached as Parquet under ``models/source_cache/``, keyed
+by a hash of its CSV, its declaration and the loader module source, so
+adding or changing one feed only reparses that feed.
+
+Registered sources:
+    - cardekho_v3, kasliwal_train: the Indian datasets (enabled)
+    - uk_archive_<brand>: DRIVEIQ v1 per-brand UK files in ``data/archive/``
+      (GBP, miles, mpg; disabled by default, pass them by name to opt in)
+
+Usage:
+    from src.data_sources import DataSource, register_source
+
+    register_source(
+        DataSource("dealer_feed", "raw/dealer_feed.csv", load_dealer_feed, {...})
+    )
+"""
+
+import hashlib
+import inspect
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from src.data_processing import (
+    CARDEKHO_V3_SCHEMA,
+    KASLIWAL_SCHEMA,
+    PYARROW_AVAILABLE,
+    UK_ARCHIVE_SCHEMA,
+    load_cardekho_v3,
+    load_kasliwal_multicity,
+    load_uk_archive,
+)
+from src.utils import SOURCE_CACHE_DIR, get_data_dir, logger
+
+# Bump when the cached frame layout changes
+SOURCE_CACHE_FORMAT_VERSION = 1
+
+
+class DataSource:
+    """
+    Declaration of one listing feed.
+
+    Args:
+        name: Unique source name (also names its cache file).
+        path: CSV path relative to the data directory.
+        loader: Module-level function called as
+            ``loader(filepath, schema=schema, **options)``; it must return a
+            frame in the unified schema and be picklable for the pool.
+        schema: Raw to unified column name mapping.
+        options: Extra keyword arguments for the loader.
+        enabled: Whether the source is part of the default dataset.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        loader: Callable[..., pd.DataFrame],
+        schema: Dict[str, str],
+        options: Optional[Dict[str, Any]] = None,
+        enabled: bool = True,
+    ):
+        self.name = name
+        self.path = path
+        self.loader = loader
+        self.schema = dict(schema)
+        self.options = dict(options or {})
+        self.enabled = enabled
+
+    def __repr__(self) -> str:
+        return (
+            f"DataSource({self.name!r}, {self.path!r}, "
+            f"loader={self.loader.__qualname__}, enabled={self.enabled})"
+        )
+
+    def load(self, data_dir: Path) -> pd.DataFrame:
+        """Run the loader on this source's CSV."""
+        return self.loader(data_dir / self.path, schema=self.schema, **self.options)
+
+    def cache_key(self, data_dir: Path) -> str:
+        """
+        Hash of everything the loaded frame depends on.
+
+        Returns:
+            First 16 hex characters of the SHA-256 over the declaration, the
+            CSV bytes and the source of the loader's module.
+        """
+        digest = hashlib.sha256()
+        digest.update(
+            repr(
+                (
+                    SOURCE_CACHE_FORMAT_VERSION,
+                    self.name,
+                    self.path,
+                    self.loader.__module__,
+                    self.loader.__qualname__,
+                    sorted(self.schema.items()),
+                    sorted(self.options.items()),
+                )
+            ).encode()
+        )
+        for path in [data_dir / self.path, Path(inspect.getsourcefile(self.loader))]:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        return digest.hexdigest()[:16]
+
+
+# Registration order is the row order of the merged dataset
+SOURCE_REGISTRY: Dict[str, DataSource] = {}
+
+
+def register_source(source: DataSource, replace: bool = False) -> DataSource:
+    """
+    Add a source to the registry.
+
+    Raises:
+        ValueError: If a source with the same name exists and ``replace``
+            is not set.
+    """
+    if source.name in SOURCE_REGISTRY and not replace:
+        raise ValueError(f"Data source '{source.name}' is already registered")
+    SOURCE_REGISTRY[source.name] = source
+    return source
+
+
+def get_sources(names: Optional[List[str]] = None) -> List[DataSource]:
+    """
+    Resolve source names to registered sources.
+
+    Args:
+        names: Source names, in the desired order. Defaults to every
+            enabled source in registration order.
+
+    Raises:
+        ValueError: If a name is not registered.
+    """
+    if names is None:
+        return [s for s in SOURCE_REGISTRY.values() if s.enabled]
+    unknown = [n for n in names if n not in SOURCE_REGISTRY]
+    if unknown:
+        raise ValueError(
+            f"Unknown data source(s): {unknown}. "
+            f"Registered: {list(SOURCE_REGISTRY)}"
+        )
+    return [SOURCE_REGISTRY[n] for n in names]
+
+
+register_source(
+    DataSource(
+        "cardekho_v3", "raw/cardekho_v3.csv", load_cardekho_v3, CARDEKHO_V3_SCHEMA
+    )
+)
+register_source(
+    DataSource(
+        "kasliwal_train",
+        "raw/kasliwal_train.csv",
+        load_kasliwal_multicity,
+        KASLIWAL_SCHEMA,
+    )
+)
+for _file, _brand in [
+    ("audi", "Audi"),
+    ("bmw", "BMW"),
+    ("ford", "Ford"),
+    ("hyundai", "Hyundai"),
+    ("mercedes", "Mercedes"),
+    ("skoda", "Skoda"),
+    ("toyota", "Toyota"),
+    ("vw", "Volkswagen"),
+]:
+    register_source(
+        DataSource(
+            f"uk_archive_{_file}",
+            f"archive/{_file}.csv",
+            load_uk_archive,
+            UK_ARCHIVE_SCHEMA,
+            options={"brand": _brand, "source": f"uk_archive_{_file}"},
+            enabled=False,
+        )
+    )
+
+
+# ---------------------------------------------------------------------------
+# Per-Source Cache
+# ---------------------------------------------------------------------------
+
+
+def _cache_path(cache_dir: Path, source: DataSource, key: str) -> Path:
+    return cache_dir / f"{source.name}-{key}.parquet"
+
+
+def _read_cache(path: Path) -> Optional[pd.DataFrame]:
+    if not PYARROW_AVAILABLE or not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable source cache {path}: {e}")
+        return None
+
+
+def _write_cache(path: Path, source: DataSource, df: pd.DataFrame) -> None:
+    """Write atomically and drop this source's stale cache files."""
+    if not PYARROW_AVAILABLE:
+        return
+    tmp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        os.close(fd)
+        df.to_parquet(tmp_name)
+        os.replace(tmp_name, path)
+    except OSError as e:
+        logger.warning(f"Could not cache source '{source.name}': {e}")
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+        return
+
+    for stale in path.parent.glob("*.parquet"):
+        if stale != path and stale.stem.rsplit("-", 1)[0] == source.name:
+            stale.unlink(missing_ok=True)
+
+
+def _load_source(source: DataSource, data_dir: Path) -> pd.DataFrame:
+    return source.load(data_dir)
+
+
+# ---------------------------------------------------------------------------
+# Parallel Loading
+# ---------------------------------------------------------------------------
+
+
+def load_sources(
+    sources: Optional[List[DataSource]] = None,
+    data_dir: Optional[Path] = None,
+    cache_dir: Optional[Path] = SOURCE_CACHE_DIR,
+    max_workers: Optional[int] = None,
+) -> List[pd.DataFrame]:
+    """
+    Load sources, reusing cached frames and parsing the rest in parallel.
+
+    Args:
+        sources: Sources to load (defaults to the enabled ones).
+        data_dir: Directory the source paths are relative to.
+        cache_dir: Per-source cache directory; None disables caching.
+        max_workers: Process pool size (defaults to one per pending source,
+            capped at the CPU count); 1 loads in-process.
+
+    Returns:
+        One standardized frame per source whose CSV exists, in order.
+    """
+    if sources is None:
+        sources = get_sources()
+    if data_dir is None:
+        data_dir = get_data_dir()
+
+    frames: Dict[str, pd.DataFrame] = {}
+    pending = []
+    for source in sources:
+        if not (data_dir / source.path).exists():
+            logger.warning(f"Data source '{source.name}' not found at {source.path}")
+            continue
+        if cache_dir is None:
+            pending.append((source, None))
+            continue
+        path = _cache_path(cache_dir, source, source.cache_key(data_dir))
+        cached = _read_cache(path)
+        if cached is None:
+            pending.append((source, path))
+        else:
+            logger.info(f"Loaded source '{source.name}' from cache ({len(cached)})")
+            frames[source.name] = cached
+
+    if max_workers is None:
+        max_workers = min(len(pending), os.cpu_count() or 1)
+    if len(pending) > 1 and max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_load_source, s, data_dir) for s, _ in pending]
+            loaded = [f.result() for f in futures]
+    else:
+        loaded = [_load_source(s, data_dir) for s, _ in pending]
+
+    for (source, path), df in zip(pending, loaded):
+        if path is not None:
+            _write_cache(path, source, df)
+        frames[source.name] = df
+
+    return [frames[s.name] for s in sources if s.name in frames]
@@ -1,19 +1,96 @@
 from typing import Dict, Any, List
 
+import numpy as np
+import pandas as pd
+
+from src.market_statistics import vehicle_segments
+
+# Alternatives may cost up to this much more than the car's estimated value
+BUDGET_HEADROOM = 1.1
+MAX_ALTERNATIVES = 3
+
 
 class AlternativesEngine:
-    def __init__(self, knowledge_engine):
+    def __init__(self, knowledge_engine, index=None):
         self.knowledge_engine = knowledge_engine
+        self.index = index
 
     def generate_alternatives(
         self, valuation_report: Dict[str, Any], input_summary: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
-        # This acts as a placeholder if no knowledge engine is provided
-        # In actual integration, we filter based on budget and segment.
-        # Since we might not have full access to a loaded dataset here, we'll return
-        # the recommendations list passed by the previous pipeline if available,
-        # or implement a simple mock logic.
-        return []
+        """
+        Nearest configurations of other models in the same segment, priced
+        within the budget (estimated value plus headroom).
+
+        Returns an empty list when no alternatives index is loaded.
+        """
+        if self.index is None:
+            return []
+
+        value = valuation_report.get("estimated_market_value_raw")
+        if not value:
+            return []
+        engine_size = input_summary.get("engineSize")
+        segment = None
+        if engine_size is not None:
+            segment = str(vehicle_segments([engine_size])[0])
+
+        return self.index.query(
+            {
+                "price": value,
+                "year": input_summary.get("year"),
+                "engineSize": engine_size,
+                "mpg": input_summary.get("mpg"),
+            },
+            k=MAX_ALTERNATIVES,
+            budget=value * BUDGET_HEADROOM,
+            segment=segment,
+            exclude=(input_summary.get("brand"), input_summary.get("model")),
+        )
+
+    def generate_alternatives_batch(
+        self, est_values: np.ndarray, input_summary: pd.DataFrame
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        ``generate_alternatives`` for N cars, with one index query per segment.
+
+        Args:
+            est_values: Estimated market value per car.
+            input_summary: N-row frame with (some of) brand, model, year,
+                mpg and engineSize.
+        """
+        n = len(input_summary)
+        if self.index is None:
+            return [[] for _ in range(n)]
+
+        est_values = np.asarray(est_values, dtype=float)
+        columns = input_summary.columns
+        specs = pd.DataFrame(
+            {
+                key: input_summary[key].to_numpy()
+                for key in ("year", "engineSize", "mpg")
+                if key in columns
+            },
+            index=range(n),
+        ).assign(price=est_values)
+        segments = [None] * n
+        if "engineSize" in columns:
+            segments = vehicle_segments(input_summary["engineSize"]).tolist()
+        brands = input_summary["brand"].tolist() if "brand" in columns else [None] * n
+        models = input_summary["model"].tolist() if "model" in columns else [None] * n
+
+        valued = np.flatnonzero(est_values != 0)
+        alternatives = [[] for _ in range(n)]
+        results = self.index.query_batch(
+            specs.iloc[valued],
+            k=MAX_ALTERNATIVES,
+            budgets=est_values[valued] * BUDGET_HEADROOM,
+            segments=[segments[i] for i in valued],
+            excludes=[(brands[i], models[i]) for i in valued],
+        )
+        for i, result in zip(valued, results):
+            alternatives[i] = result
+        return alternatives
 
     def process(
         self,
@@ -23,7 +100,11 @@ class AlternativesEngine:
     ) -> Dict[str, Any]:
         """
         Processes alternative suggestions.
-        Takes advantage of the existing 'recommendations' array if provided by the predictor.
+        Takes advantage of the existing 'recommendations' array if provided by
+        the predictor, otherwise queries the alternatives index.
         """
-        alts = current_recommendations if current_recommendations else []
+        if current_recommendations:
+            alts = current_recommendations
+        else:
+            alts = self.generate_alternatives(valuation_report, input_summary)
         return {"alternatives": alts}
@@ -1,4 +1,9 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.market_statistics import vehicle_segments
 
 from .recommendation_engine import RecommendationEngine
 from .negotiation_engine import NegotiationEngine
@@ -7,6 +12,107 @@ from .ownership_engine import OwnershipEngine
 from .alternatives_engine import AlternativesEngine
 from .buyer_insights_engine import BuyerInsightsEngine
 
+# Input summary fields read by BuyerInsightsEngine.generate_insights
+INSIGHT_FIELDS = ("mpg", "engineSize")
+# Cars whose alternatives are looked up together by DecisionReportBatch
+ALTERNATIVES_BLOCK_SIZE = 1024
+
+
+def _summary_column(input_summary: pd.DataFrame, key: str, default: Any):
+    """Column ``key`` of the input summaries, or ``default`` for every car."""
+    if key in input_summary.columns:
+        return input_summary[key].to_numpy()
+    return np.full(len(input_summary), default)
+
+
+class DecisionReportBatch:
+    """
+    Columnar decision reports for N cars.
+
+    Deal scores, recommendations, remaining life, 5-year ownership costs,
+    negotiation offers and the forecast grid are arrays; the display dicts
+    of ``DecisionIntelligenceEngine.generate_decision_report`` (formatted
+    prices, insights, alternatives) are only built by ``report`` /
+    ``reports``; alternatives are looked up for a block of
+    ALTERNATIVES_BLOCK_SIZE cars at a time.
+    """
+
+    def __init__(
+        self,
+        engine: "DecisionIntelligenceEngine",
+        est_values: np.ndarray,
+        risks: Dict[str, np.ndarray],
+        input_summary: pd.DataFrame,
+        ownership_costs: Dict[str, np.ndarray],
+        forecast_grid: np.ndarray,
+        forecast_retention: np.ndarray,
+        negotiations: Dict[str, np.ndarray],
+        remaining_life: Dict[str, np.ndarray],
+        deal_scores: np.ndarray,
+        recommendations: np.ndarray,
+    ):
+        self._engine = engine
+        self._est_values = est_values
+        self._risks = risks
+        self._input_summary = input_summary
+        self.ownership_costs = ownership_costs
+        self.forecast_grid = forecast_grid
+        self.forecast_retention = forecast_retention
+        self.negotiations = negotiations
+        self.remaining_life = remaining_life
+        self.deal_scores = deal_scores
+        self.recommendations = recommendations
+        self._alternative_blocks: Dict[int, List[List[Dict[str, Any]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.deal_scores)
+
+    def report(self, i: int) -> Dict[str, Any]:
+        """Report dict for car ``i``, as ``generate_decision_report`` returns it."""
+        engine = self._engine
+        summary = {
+            key: self._input_summary[key].iat[i]
+            for key in INSIGHT_FIELDS
+            if key in self._input_summary.columns
+        }
+        risks = {name: levels[i] for name, levels in self._risks.items()}
+        insights = engine.buyer_insights_engine.generate_insights(
+            {"risk_assessment": risks}, summary
+        )
+        report = engine.ownership_engine.format_ownership_cost(self.ownership_costs, i)
+        report["forecast_timeline"] = engine.forecast_engine.format_forecast(
+            self.forecast_grid[i], self.forecast_retention[i]
+        )
+        report["insights"] = insights
+        report["alternatives"] = self._alternatives(i)
+        report["negotiation_assistant"] = engine.negotiation_engine.format_negotiation(
+            self.negotiations, i
+        )
+        report["remaining_life"] = {
+            key: values[i].item() if key != "label" else values[i]
+            for key, values in self.remaining_life.items()
+        }
+        report["deal_score"] = int(self.deal_scores[i])
+        report["final_recommendation"] = self.recommendations[i]
+        return report
+
+    def _alternatives(self, i: int) -> List[Dict[str, Any]]:
+        block, offset = divmod(i, ALTERNATIVES_BLOCK_SIZE)
+        if block not in self._alternative_blocks:
+            rows = slice(
+                block * ALTERNATIVES_BLOCK_SIZE, (block + 1) * ALTERNATIVES_BLOCK_SIZE
+            )
+            self._alternative_blocks[block] = (
+                self._engine.alternatives_engine.generate_alternatives_batch(
+                    self._est_values[rows], self._input_summary.iloc[rows]
+                )
+            )
+        return self._alternative_blocks[block][offset]
+
+    def reports(self) -> List[Dict[str, Any]]:
+        """Report dicts for every car."""
+        return [self.report(i) for i in range(len(self))]
+
 
 class DecisionIntelligenceEngine:
     """
@@ -14,12 +120,16 @@ class DecisionIntelligenceEngine:
     Acts as a facade over all the specific modules.
     """
 
-    def __init__(self, knowledge_engine=None):
+    def __init__(
+        self, knowledge_engine=None, market_stats=None, alternatives_index=None
+    ):
         self.recommendation_engine = RecommendationEngine()
         self.negotiation_engine = NegotiationEngine()
-        self.forecast_engine = ForecastEngine()
+        self.forecast_engine = ForecastEngine(market_stats)
         self.ownership_engine = OwnershipEngine()
-        self.alternatives_engine = AlternativesEngine(knowledge_engine)
+        self.alternatives_engine = AlternativesEngine(
+            knowledge_engine, alternatives_index
+        )
         self.buyer_insights_engine = BuyerInsightsEngine()
 
     def generate_decision_report(
@@ -36,7 +146,7 @@ class DecisionIntelligenceEngine:
 
         # 1. Ownership & Forecast
         report.update(self.ownership_engine.process(valuation_report, input_summary))
-        report.update(self.forecast_engine.process(valuation_report))
+        report.update(self.forecast_engine.process(valuation_report, input_summary))
 
         # 2. Buyer Insights
         report.update(
@@ -63,3 +173,66 @@ class DecisionIntelligenceEngine:
         )
 
         return report
+
+    def generate_decision_reports(
+        self,
+        valuation_reports,
+        input_summary: pd.DataFrame,
+        asking_prices: Optional[np.ndarray] = None,
+    ) -> DecisionReportBatch:
+        """
+        Columnar ``generate_decision_report`` for N cars.
+
+        Args:
+            valuation_reports: ValuationReportBatch for the same cars.
+            input_summary: N-row frame with car_age, engineSize and mpg.
+            asking_prices: Asking price per car, NaN (or None) where unknown.
+
+        Alternatives are looked up lazily, by block, by the batch's ``report``.
+        """
+        n = len(valuation_reports)
+        est_values = np.asarray(valuation_reports.predicted_price, dtype=float)
+        if asking_prices is None:
+            asking_prices = np.full(n, np.nan)
+        asking_prices = np.asarray(asking_prices, dtype=float)
+
+        car_age = _summary_column(input_summary, "car_age", 5)
+        engine_size = _summary_column(input_summary, "engineSize", 1.2)
+        mpg = _summary_column(input_summary, "mpg", 15.0)
+        risks = valuation_reports.risks
+        brands = segments = None
+        if "brand" in input_summary.columns:
+            brands = input_summary["brand"].to_numpy()
+        if "engineSize" in input_summary.columns:
+            segments = vehicle_segments(input_summary["engineSize"].to_numpy())
+
+        deal_scores = self.recommendation_engine.calculate_deal_scores(
+            est_values,
+            asking_prices,
+            valuation_reports.rounded_confidence_score(),
+            valuation_reports.market_position,
+            risks["Ownership Risk"],
+            risks["Maintenance Risk"],
+        )
+        forecast_grid, forecast_retention = (
+            self.forecast_engine.calculate_forecast_grid(
+                est_values, brands, car_age, segments
+            )
+        )
+        return DecisionReportBatch(
+            self,
+            est_values,
+            risks,
+            input_summary,
+            self.ownership_engine.calculate_ownership_costs(
+                est_values, car_age, engine_size, mpg
+            ),
+            forecast_grid,
+            forecast_retention,
+            self.negotiation_engine.calculate_negotiations(est_values, asking_prices),
+            self.recommendation_engine.calculate_remaining_lives(car_age),
+            deal_scores,
+            self.recommendation_engine.generate_recommendations(
+                deal_scores, asking_prices
+            ),
+        )
@@ -1,31 +1,120 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from src.market_statistics import DEFAULT_ANNUAL_DEPRECIATION, vehicle_segments
+from src.utils import format_price_inr, logger
+
+FORECAST_YEARS = 5
 
 
 class ForecastEngine:
-    def __init__(self):
-        # We could use the knowledge base or market stats here, but we'll use standard heuristics
-        self.annual_depreciation_rate = 0.12
-
-    def calculate_forecast(self, current_value: float) -> List[Dict[str, Any]]:
-        from src.utils import format_price_inr
-
-        forecast = []
-
-        for year in range(1, 6):
-            retained_pct = (1 - self.annual_depreciation_rate) ** year
-            value = current_value * retained_pct
-            forecast.append(
-                {
-                    "year": year,
-                    "projected_value_raw": value,
-                    "projected_value": format_price_inr(value),
-                    "retention_percentage": round(retained_pct * 100, 1),
-                }
+    def __init__(self, market_stats=None):
+        # Brand x age-bucket depreciation curves from training when the market
+        # statistics have them; otherwise a flat standard heuristic rate
+        self.annual_depreciation_rate = DEFAULT_ANNUAL_DEPRECIATION
+        if market_stats is not None and not market_stats.has_depreciation_curves:
+            logger.warning(
+                "MarketStatistics has no depreciation curves (pickled by an older "
+                "version); forecasts use a flat "
+                f"{DEFAULT_ANNUAL_DEPRECIATION:.0%} annual rate. Run "
+                "'python -m src.market_statistics' or re-run training to add them."
+            )
+            market_stats = None
+        self.market_stats = market_stats
+
+    def retention_curves(
+        self,
+        n_cars: int,
+        brands=None,
+        car_ages=None,
+        segments=None,
+        horizon: int = FORECAST_YEARS,
+    ) -> np.ndarray:
+        """
+        Share of today's value retained after 1..``horizon`` years, per car.
+
+        Returns:
+            Array of shape (n_cars, horizon).
+        """
+        if self.market_stats is None or brands is None:
+            flat = np.array(
+                [
+                    (1 - self.annual_depreciation_rate) ** year
+                    for year in range(1, horizon + 1)
+                ]
             )
+            return np.broadcast_to(flat, (n_cars, horizon))
+        if car_ages is None:
+            car_ages = np.full(n_cars, 5)
+        return self.market_stats.retention_forecast(
+            np.asarray(brands, dtype=object), car_ages, horizon, segments
+        )
+
+    def calculate_forecast(
+        self,
+        current_value: float,
+        brand: Optional[str] = None,
+        car_age: Optional[float] = None,
+        segment: Optional[str] = None,
+        horizon: int = FORECAST_YEARS,
+    ) -> List[Dict[str, Any]]:
+        retained = self.retention_curves(
+            1,
+            None if brand is None else [brand],
+            None if car_age is None else [car_age],
+            None if segment is None else np.array([segment], dtype=object),
+            horizon,
+        )[0]
+        return self.format_forecast(current_value * retained, retained)
+
+    def calculate_forecast_grid(
+        self,
+        current_values: np.ndarray,
+        brands=None,
+        car_ages=None,
+        segments=None,
+        horizon: int = FORECAST_YEARS,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Columnar ``calculate_forecast``.
 
-        return forecast
+        Returns:
+            Tuple of (projected values, retained shares), each (N, horizon).
+        """
+        retained = self.retention_curves(
+            len(current_values), brands, car_ages, segments, horizon
+        )
+        return current_values[:, None] * retained, retained
+
+    def format_forecast(
+        self, values: np.ndarray, retained: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """``calculate_forecast`` output for one row of the forecast grid."""
+        return [
+            {
+                "year": year,
+                "projected_value_raw": value,
+                "projected_value": format_price_inr(value),
+                "retention_percentage": round(retained_pct * 100, 1),
+            }
+            for year, (value, retained_pct) in enumerate(
+                zip(values.tolist(), retained.tolist()), start=1
+            )
+        ]
 
-    def process(self, valuation_report: Dict[str, Any]) -> Dict[str, Any]:
+    def process(
+        self,
+        valuation_report: Dict[str, Any],
+        input_summary: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         current_value = valuation_report["estimated_market_value_raw"]
-        forecast_timeline = self.calculate_forecast(current_value)
+        input_summary = input_summary or {}
+        engine_size = input_summary.get("engineSize")
+        forecast_timeline = self.calculate_forecast(
+            current_value,
+            brand=input_summary.get("brand"),
+            car_age=input_summary.get("car_age", 5),
+            segment=None if engine_size is None else vehicle_segments(engine_size)[()],
+        )
         return {"forecast_timeline": forecast_timeline}
@@ -1,5 +1,15 @@
 from typing import Dict, Any
 
+import numpy as np
+
+from src.utils import format_price_inr
+
+DIFFICULTY_REASONING = {
+    "Hard": "The asking price is significantly above market value. The seller may have unrealistic expectations.",
+    "Moderate": "The asking price is slightly above market value. There is room for standard negotiation.",
+    "Easy": "The asking price is already at or below fair market value. Minimal negotiation needed.",
+}
+
 
 class NegotiationEngine:
     def __init__(self):
@@ -24,15 +34,10 @@ class NegotiationEngine:
         # Negotiation difficulty
         if asking_price > est_value * 1.15:
             difficulty = "Hard"
-            reasoning = "The asking price is significantly above market value. The seller may have unrealistic expectations."
         elif asking_price > est_value:
             difficulty = "Moderate"
-            reasoning = "The asking price is slightly above market value. There is room for standard negotiation."
         else:
             difficulty = "Easy"
-            reasoning = "The asking price is already at or below fair market value. Minimal negotiation needed."
-
-        from src.utils import format_price_inr
 
         return {
             "is_available": True,
@@ -42,7 +47,63 @@ class NegotiationEngine:
             "maximum_recommended_offer": format_price_inr(max_offer),
             "estimated_negotiation_margin": format_price_inr(margin),
             "negotiation_difficulty": difficulty,
-            "reasoning": reasoning,
+            "reasoning": DIFFICULTY_REASONING[difficulty],
+        }
+
+    def calculate_negotiations(
+        self, est_values: np.ndarray, asking_prices: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Columnar ``calculate_negotiation``; missing asking prices are NaN.
+
+        Returns:
+            Dict of arrays: is_available, initial_offer, max_offer, margin and
+            difficulty (values are meaningless where is_available is False).
+        """
+        is_available = ~np.isnan(asking_prices) & (asking_prices != 0)
+        # Python min()/max() semantics, as in calculate_negotiation
+        initial_offer = np.where(
+            asking_prices * 0.90 < est_values * 0.92,
+            asking_prices * 0.90,
+            est_values * 0.92,
+        )
+        max_offer = est_values * 1.02
+        margin = asking_prices - initial_offer
+        margin = np.where(margin > 0, margin, 0)
+        difficulty = np.select(
+            [asking_prices > est_values * 1.15, asking_prices > est_values],
+            ["Hard", "Moderate"],
+            "Easy",
+        ).astype(object)
+
+        return {
+            "is_available": is_available,
+            "asking_price": asking_prices,
+            "est_value": est_values,
+            "initial_offer": initial_offer,
+            "max_offer": max_offer,
+            "margin": margin,
+            "difficulty": difficulty,
+        }
+
+    def format_negotiation(
+        self, negotiations: Dict[str, np.ndarray], i: int
+    ) -> Dict[str, Any]:
+        """``calculate_negotiation`` output for row ``i`` of ``negotiations``."""
+        if not negotiations["is_available"][i]:
+            return {"is_available": False}
+        difficulty = negotiations["difficulty"][i]
+        return {
+            "is_available": True,
+            "seller_asking_price": format_price_inr(negotiations["asking_price"][i]),
+            "estimated_fair_value": format_price_inr(negotiations["est_value"][i]),
+            "suggested_initial_offer": format_price_inr(
+                negotiations["initial_offer"][i]
+            ),
+            "maximum_recommended_offer": format_price_inr(negotiations["max_offer"][i]),
+            "estimated_negotiation_margin": format_price_inr(negotiations["margin"][i]),
+            "negotiation_difficulty": difficulty,
+            "reasoning": DIFFICULTY_REASONING[difficulty],
         }
 
     def process(
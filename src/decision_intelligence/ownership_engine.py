@@ -1,5 +1,9 @@
 from typing import Dict, Any
 
+import numpy as np
+
+from src.utils import format_price_inr
+
 
 class OwnershipEngine:
     def __init__(self):
@@ -37,8 +41,6 @@ class OwnershipEngine:
 
         total_5y = insurance_5y + maintenance_5y + fuel_5y + registration_5y
 
-        from src.utils import format_price_inr
-
         return {
             "insurance_5y": format_price_inr(insurance_5y),
             "maintenance_5y": format_price_inr(maintenance_5y),
@@ -52,6 +54,57 @@ class OwnershipEngine:
             },
         }
 
+    def calculate_ownership_costs(
+        self,
+        est_values: np.ndarray,
+        car_age: np.ndarray,
+        engine_size: np.ndarray,
+        mpg: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Columnar ``calculate_ownership_cost``: raw 5-year cost components per car.
+
+        Returns:
+            Dict of arrays: insurance_5y, maintenance_5y, fuel_5y,
+            registration_misc_5y, total_5y and mpg_used.
+        """
+        insurance_5y = est_values * self.annual_insurance_rate * 5
+        annual_maintenance = (
+            self.annual_maintenance_base + (car_age * 2000) + (engine_size * 5000)
+        )
+        maintenance_5y = annual_maintenance * 5
+        mpg = np.where(mpg <= 0, 15.0, mpg)
+        annual_fuel = (self.annual_distance_km / mpg) * self.fuel_price_per_liter
+        fuel_5y = annual_fuel * 5
+        registration_5y = np.full(len(est_values), 10000)
+        total_5y = insurance_5y + maintenance_5y + fuel_5y + registration_5y
+
+        return {
+            "insurance_5y": insurance_5y,
+            "maintenance_5y": maintenance_5y,
+            "fuel_5y": fuel_5y,
+            "registration_misc_5y": registration_5y,
+            "total_5y": total_5y,
+            "mpg_used": mpg,
+        }
+
+    def format_ownership_cost(
+        self, costs: Dict[str, np.ndarray], i: int
+    ) -> Dict[str, Any]:
+        """``calculate_ownership_cost`` output for row ``i`` of ``costs``."""
+        return {
+            "insurance_5y": format_price_inr(costs["insurance_5y"][i]),
+            "maintenance_5y": format_price_inr(costs["maintenance_5y"][i]),
+            "fuel_5y": format_price_inr(costs["fuel_5y"][i]),
+            "registration_misc_5y": format_price_inr(costs["registration_misc_5y"][i]),
+            "total_5y": format_price_inr(costs["total_5y"][i]),
+            "assumptions": {
+                "annual_distance_km": self.annual_distance_km,
+                "fuel_price": self.fuel_price_per_liter,
+                "mpg_used": costs["mpg_used"][i].item(),
+            },
+        }
+
     def process(
         self, valuation_report: Dict[str, Any], input_summary: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -1,5 +1,7 @@
 from typing import Dict, Any
 
+import numpy as np
+
 
 class RecommendationEngine:
     def __init__(self):
@@ -79,6 +81,81 @@ class RecommendationEngine:
         else:
             return "Avoid"
 
+    # ------------------------------------------------------------------
+    # Columnar counterparts; missing asking prices are NaN
+    # ------------------------------------------------------------------
+    def calculate_remaining_lives(self, car_age: np.ndarray) -> Dict[str, np.ndarray]:
+        """Columnar ``calculate_remaining_life``."""
+        max_life = 15
+        remaining = max_life - car_age
+        remaining = np.where(remaining > 0, remaining, 0)
+        index = np.clip(np.trunc((remaining / max_life) * 100), 0, 100).astype(int)
+        label = np.select([index > 60, index > 30], ["High", "Medium"], "Low")
+        return {
+            "remaining_years": remaining,
+            "life_index_score": index,
+            "label": label.astype(object),
+        }
+
+    def calculate_deal_scores(
+        self,
+        est_values: np.ndarray,
+        asking_prices: np.ndarray,
+        confidence_scores: np.ndarray,
+        market_positions: np.ndarray,
+        ownership_risks: np.ndarray,
+        maintenance_risks: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Columnar ``calculate_deal_score``.
+
+        ``confidence_scores`` are the (rounded) report scores; the risk and
+        market position arrays hold the report labels.
+        """
+        has_asking = ~np.isnan(asking_prices) & (asking_prices != 0)
+        price_fairness = np.select(
+            [
+                asking_prices < est_values * 0.95,
+                asking_prices <= est_values * 1.05,
+                asking_prices > est_values * 1.15,
+            ],
+            [25, 10, -20],
+            0,
+        )
+        score = 50 + np.where(has_asking, price_fairness, 10)
+        score = score + (confidence_scores - 70) * 0.2
+        score = score + np.select(
+            [market_positions == "Undervalued", market_positions == "Overpriced"],
+            [15, -15],
+            0,
+        )
+        score = score + np.select(
+            [
+                (ownership_risks == "High") | (maintenance_risks == "High"),
+                (ownership_risks == "Low") & (maintenance_risks == "Low"),
+            ],
+            [-20, 10],
+            0,
+        )
+        return np.clip(np.trunc(score), 0, 100).astype(int)
+
+    def generate_recommendations(
+        self, deal_scores: np.ndarray, asking_prices: np.ndarray
+    ) -> np.ndarray:
+        """Columnar ``generate_recommendation``."""
+        has_asking = ~np.isnan(asking_prices) & (asking_prices != 0)
+        return np.select(
+            [
+                deal_scores >= 85,
+                deal_scores >= 70,
+                (deal_scores >= 50) & has_asking,
+                deal_scores >= 50,
+                deal_scores >= 35,
+            ],
+            ["Excellent Buy", "Good Buy", "Negotiate", "Fair Purchase", "Wait"],
+            "Avoid",
+        ).astype(object)
+
     def process(
         self,
         valuation_report: Dict[str, Any],
@@ -31,6 +31,8 @@ class ExperimentManager:
         )
         self.experiment_id = f"exp_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.results = []
+        # Training rows of the best run so far, for the explainer background
+        self.best_training_data = None
 
     def _build_preprocessor(self, features: list) -> ColumnTransformer:
         cat_features = [c for c in CATEGORICAL_FEATURES if c in features]
@@ -162,6 +164,10 @@ class ExperimentManager:
                         metadata,
                     )
 
+                    # Same pick as _promote_best_model (first of equal scores)
+                    is_best = not self.results or all_metrics["cv_r2_mean"] > max(
+                        r["CV_R2_Mean"] for r in self.results
+                    )
                     self.results.append(
                         {
                             "Model": model_name,
@@ -175,6 +181,8 @@ class ExperimentManager:
                             "Metadata": metadata,
                         }
                     )
+                    if is_best:
+                        self.best_training_data = X_train
 
                 except Exception as e:
                     logger.error(
@@ -219,16 +227,66 @@ class ExperimentManager:
         )
 
         self.registry.promote_to_production(
-            candidate_path=best_run["Path"], metadata=best_run["Metadata"]
+            candidate_path=best_run["Path"],
+            metadata=best_run["Metadata"],
+            write_artifacts=lambda staging_dir: self._save_production_artifacts(
+                best_run, staging_dir
+            ),
         )
 
+    def _save_production_artifacts(self, best_run, staging_dir):
+        """
+        Artifacts served alongside the promoted pipeline, written next to it
+        in the registry's staging directory.
+        """
         # Save the market statistics object for inference
         import joblib
 
-        stats_path = self.registry.production_dir / "market_stats.pkl"
+        stats_path = staging_dir / "market_stats.pkl"
         joblib.dump(self.stats, stats_path)
         logger.info(f"Saved market statistics to {stats_path}")
 
+        self._save_explainer_artifact(best_run, staging_dir)
+        self._save_alternatives_index(staging_dir)
+
+    def _save_explainer_artifact(self, best_run, staging_dir):
+        """
+        Persist the SHAP background, expected value and feature mapping next
+        to pipeline.pkl, so explainers start without touching training data.
+        """
+        import joblib
+
+        from src.explanation_engine import build_explainer_artifact
+        from src.inference_context import compute_model_version
+
+        pipeline_path = staging_dir / "pipeline.pkl"
+        artifact_path = staging_dir / "explainer.pkl"
+        try:
+            artifact = build_explainer_artifact(
+                joblib.load(pipeline_path),
+                self.best_training_data,
+                n_background=self.config.get("explainer_background_size", 50),
+                random_state=self.config["random_seed"],
+            )
+        except Exception as e:
+            # A previous production artifact is ignored by its pipeline_hash
+            logger.warning(f"Failed to build explainer artifact: {e}")
+            return
+
+        artifact["pipeline_hash"] = compute_model_version([pipeline_path])
+        joblib.dump(artifact, artifact_path)
+        logger.info(f"Saved explainer artifact to {artifact_path}")
+
+    def _save_alternatives_index(self, staging_dir):
+        """Rebuild the similar-car index served with the production model."""
+        from src.alternatives_index import build_alternatives_index
+
+        index_path = staging_dir / "alternatives_index.pkl"
+        try:
+            build_alternatives_index(index_path)
+        except Exception as e:
+            logger.warning(f"Failed to build alternatives index: {e}")
+
 
 if __name__ == "__main__":
     manager = ExperimentManager()
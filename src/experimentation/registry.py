@@ -1,9 +1,11 @@
 import json
 import joblib
+import os
 import shutil
 from pathlib import Path
 from datetime import datetime
-from src.utils import MODELS_DIR, logger
+from typing import Callable, Optional
+from src.utils import MODELS_DIR, REGISTRY_PATH, logger
 
 
 class ModelRegistry:
@@ -16,7 +18,7 @@ class ModelRegistry:
         self.production_dir = MODELS_DIR / "production"
         self.candidates_dir = MODELS_DIR / "candidates"
         self.archive_dir = MODELS_DIR / "archive"
-        self.registry_path = MODELS_DIR / "registry.json"
+        self.registry_path = REGISTRY_PATH
 
         for d in [self.production_dir, self.candidates_dir, self.archive_dir]:
             d.mkdir(parents=True, exist_ok=True)
@@ -33,8 +35,11 @@ class ModelRegistry:
             return json.load(f)
 
     def _save_registry(self, registry):
-        with open(self.registry_path, "w") as f:
+        # Written atomically: services watch this file for promotions
+        tmp_path = self.registry_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
             json.dump(registry, f, indent=4)
+        os.replace(tmp_path, self.registry_path)
 
     def save_candidate(
         self, experiment_id: str, model_name: str, pipeline, metadata: dict
@@ -51,27 +56,61 @@ class ModelRegistry:
         logger.info(f"Saved candidate {model_name} to {model_path}")
         return model_path
 
-    def promote_to_production(self, candidate_path: Path, metadata: dict):
-        # Archive current production if exists
+    def promote_to_production(
+        self,
+        candidate_path: Path,
+        metadata: dict,
+        write_artifacts: Optional[Callable[[Path], None]] = None,
+    ):
+        """
+        Make a candidate the production model.
+
+        The candidate (as pipeline.pkl), its metadata and the artifacts
+        served with it are first written to a staging directory:
+        ``write_artifacts(staging_dir)`` writes the latter (market
+        statistics, explainer, ...) next to the staged pipeline. Only once
+        all of them are complete does each replace its production file with
+        ``os.replace``, pipeline.pkl last, and then registry.json is updated.
+        A reader that sees the new pipeline therefore also sees its
+        artifacts, and a change to the registry always means a complete
+        production model. An artifact ``write_artifacts`` does not write
+        keeps its previous production file.
+        """
         registry = self._load_registry()
         prod_model_path = self.production_dir / "pipeline.pkl"
         prod_meta_path = self.production_dir / "metadata.json"
 
+        # Stage the new model and every artifact served with it
+        staging_dir = self.production_dir / ".staging"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        staging_dir.mkdir()
+        shutil.copy(str(candidate_path), str(staging_dir / prod_model_path.name))
+        with open(staging_dir / prod_meta_path.name, "w") as f:
+            json.dump(metadata, f, indent=4)
+        if write_artifacts is not None:
+            write_artifacts(staging_dir)
+
+        # Archive current production if exists
         if prod_model_path.exists():
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             archive_path = self.archive_dir / f"pipeline_{timestamp}.pkl"
-            shutil.move(str(prod_model_path), str(archive_path))
+            # Copy, not move: production files are replaced atomically below
+            shutil.copy(str(prod_model_path), str(archive_path))
             if prod_meta_path.exists():
-                shutil.move(
+                shutil.copy(
                     str(prod_meta_path),
                     str(self.archive_dir / f"metadata_{timestamp}.json"),
                 )
             logger.info(f"Archived previous production model to {archive_path}")
 
-        # Promote new
-        shutil.copy(str(candidate_path), str(prod_model_path))
-        with open(prod_meta_path, "w") as f:
-            json.dump(metadata, f, indent=4)
+        # Promote new: artifacts first, the pipeline last
+        staged = sorted(
+            (path for path in staging_dir.iterdir() if path.is_file()),
+            key=lambda path: path.name == prod_model_path.name,
+        )
+        for path in staged:
+            os.replace(path, self.production_dir / path.name)
+        shutil.rmtree(staging_dir, ignore_errors=True)
 
         # Update registry
         entry = {
@@ -1,11 +1,22 @@
 import abc
+import threading
+import time
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
-from typing import Dict, Tuple, Any
+from typing import Dict, List, Sequence, Tuple, Any, Optional
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+from src.compiled_pipeline import CompiledPipeline
 from src.utils import logger
+from src.valuation_rules import ValuationRules, feature_translations
 
 
 class BaseExplanationProvider(abc.ABC):
+    # Whether explain() accepts approximate=True
+    supports_approximate = False
+
     @abc.abstractmethod
     def explain(self, model, X: pd.DataFrame) -> Tuple[float, Dict[str, float]]:
         """
@@ -16,9 +27,439 @@ class BaseExplanationProvider(abc.ABC):
         """
         pass
 
+    def explain_batch(
+        self, model, X: pd.DataFrame, approximate: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        Explain every row of X.
+
+        The default calls ``explain`` once per row (ignoring ``approximate``);
+        providers that can attribute a whole matrix in one call should
+        override it.
+
+        Returns:
+            Tuple of (base values, shape (n,); contributions, shape
+            (n, n_features); feature names).
+        """
+        base_values = np.zeros(len(X))
+        rows = []
+        for i in range(len(X)):
+            base_values[i], contributions = self.explain(model, X.iloc[[i]])
+            rows.append(contributions)
+        feature_names = list(rows[0]) if rows else list(X.columns)
+        values = np.array(
+            [[row.get(f, 0.0) for f in feature_names] for row in rows], dtype=float
+        ).reshape(len(X), len(feature_names))
+        return base_values, values, feature_names
+
+
+def _output_owners(preprocessor: ColumnTransformer, feature_names: List[str]):
+    """
+    Map each ColumnTransformer output column to the raw feature it came from.
+
+    Returns:
+        Integer array (one entry per output column) of indices into
+        ``feature_names``.
+
+    Raises:
+        ValueError: If a transformer's outputs cannot be attributed to single
+            input columns (e.g. infrequent category grouping).
+    """
+    owners = []
+    for name, transformer, columns in preprocessor.transformers_:
+        if transformer == "drop" or len(columns) == 0:
+            continue
+        columns = [feature_names[c] if isinstance(c, int) else c for c in columns]
+        if isinstance(transformer, OneHotEncoder):
+            if getattr(transformer, "_infrequent_enabled", False):
+                raise ValueError(f"infrequent categories in {name}")
+            drop_idx = transformer.drop_idx_
+            for i, (column, categories) in enumerate(
+                zip(columns, transformer.categories_)
+            ):
+                width = len(categories)
+                if drop_idx is not None and drop_idx[i] is not None:
+                    width -= 1
+                owners.extend([feature_names.index(column)] * width)
+        elif transformer == "passthrough" or len(
+            transformer.get_feature_names_out(columns)
+        ) == len(columns):
+            owners.extend(feature_names.index(column) for column in columns)
+        else:
+            raise ValueError(f"cannot attribute outputs of {name} to its inputs")
+    return np.asarray(owners)
+
+
+def _split_pipeline(model):
+    """
+    Split a model into its ColumnTransformer (or None) and regressor.
+
+    Raises:
+        TypeError: If ``model`` is a Pipeline of another shape.
+    """
+    if not isinstance(model, Pipeline):
+        return None, model
+    if len(model.steps) != 2 or not isinstance(model.steps[0][1], ColumnTransformer):
+        raise TypeError("expected Pipeline([ColumnTransformer, regressor])")
+    return model.steps[0][1], model.steps[-1][1]
+
+
+def _fitted_feature_names(model) -> List[str]:
+    """Raw input columns of a model fitted on a DataFrame."""
+    feature_names = list(getattr(model, "feature_names_in_", []))
+    if not feature_names:
+        raise ValueError("model was not fitted on a DataFrame")
+    return feature_names
+
+
+def _feature_owners(
+    preprocessor: Optional[ColumnTransformer],
+    feature_names: List[str],
+    artifact: Optional[Dict[str, Any]] = None,
+) -> np.ndarray:
+    """Raw feature index of every column the regressor sees."""
+    if artifact is not None:
+        return np.asarray(artifact["feature_owners"])
+    if preprocessor is not None:
+        return _output_owners(preprocessor, feature_names)
+    return np.arange(len(feature_names))
+
+
+def _transform_input(
+    X: pd.DataFrame,
+    feature_names: List[str],
+    preprocessor: Optional[ColumnTransformer],
+    compiled_pipeline: Optional[CompiledPipeline] = None,
+) -> np.ndarray:
+    """Matrix the regressor sees for ``X``."""
+    X = X[feature_names]
+    if preprocessor is None:
+        return X.to_numpy(dtype=float)
+    if len(X) == 1 and compiled_pipeline is not None:
+        return compiled_pipeline.transform_record(X.iloc[0].to_dict())[None]
+    return preprocessor.transform(X)
+
+
+class _ContributionExplainer(abc.ABC):
+    """
+    Shared plumbing: pipeline split, input transform and one-hot aggregation.
+
+    Subclasses implement ``transformed_contributions`` on the matrix the
+    regressor sees and set ``expected_value``.
+    """
+
+    def _init_model(self, model, artifact: Optional[Dict[str, Any]] = None):
+        self.model = model
+        self.preprocessor, self.regressor = _split_pipeline(model)
+        self.feature_names = _fitted_feature_names(model)
+        self.compiled_pipeline = None
+        if self.preprocessor is not None:
+            self.compiled_pipeline = CompiledPipeline.compile(model)
+
+        owners = _feature_owners(self.preprocessor, self.feature_names, artifact)
+        # (n_outputs, n_features) 0/1 matrix summing outputs onto raw features
+        self._aggregation = np.zeros((len(owners), len(self.feature_names)))
+        self._aggregation[np.arange(len(owners)), owners] = 1.0
+
+    def transform(self, X: pd.DataFrame) -> np.ndarray:
+        """Matrix the regressor sees for ``X``."""
+        return _transform_input(
+            X, self.feature_names, self.preprocessor, self.compiled_pipeline
+        )
+
+    @abc.abstractmethod
+    def transformed_contributions(
+        self, X_transformed: np.ndarray, approximate: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Base values and per-column contributions over the transformed matrix.
+        """
+
+    def contributions(
+        self, X: pd.DataFrame, approximate: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        SHAP values of the raw features for every row of ``X``.
+
+        Args:
+            X: Model input rows.
+            approximate: Use Saabas path attribution (each split's change in
+                expected value credited to the split feature along the
+                decision path) instead of exact TreeSHAP. Contributions
+                still sum to the prediction.
+
+        Returns:
+            Tuple of (base values, shape (n,); contributions, shape
+            (n, len(feature_names))).
+        """
+        base_values, values = self.transformed_contributions(
+            self.transform(X), approximate
+        )
+        return base_values, values @ self._aggregation
+
+
+class TreeContributionExplainer(_ContributionExplainer):
+    """
+    Exact TreeSHAP for a tree regressor, behind an optional ColumnTransformer.
+
+    For a ``Pipeline([ColumnTransformer, regressor])`` the input is
+    transformed once, TreeSHAP runs on the regressor over the transformed
+    matrix, and the contributions of each one-hot block are summed back onto
+    the raw feature (brand, model, fuelType, ...). SHAP values are additive,
+    so the summed values are the exact SHAP values of the raw features.
+
+    XGBoost models use the booster's native TreeSHAP (``pred_contribs``);
+    other tree models go through ``shap.TreeExplainer``. With an explainer
+    artifact (see ``build_explainer_artifact``) the output-to-feature mapping
+    and expected value are read from it instead of being derived.
+    """
+
+    def __init__(self, model, shap_module=None, artifact=None):
+        self._init_model(model, artifact)
+
+        if hasattr(self.regressor, "get_booster"):
+            self._booster = self.regressor.get_booster()
+            self._tree_explainer = None
+        else:
+            if shap_module is None:
+                raise ImportError("shap is required for non-XGBoost tree models")
+            self._booster = None
+            self._tree_explainer = shap_module.TreeExplainer(self.regressor)
+
+        if artifact is not None and artifact["expected_value_source"] == "tree":
+            self.expected_value = float(artifact["expected_value"])
+        else:
+            # Expected value over the training distribution (the TreeSHAP bias)
+            probe = np.zeros((1, self._aggregation.shape[0]))
+            self.expected_value = float(self.transformed_contributions(probe)[0][0])
+
+    def transformed_contributions(
+        self, X_transformed: np.ndarray, approximate: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if self._booster is not None:
+            import xgboost
+
+            contribs = self._booster.predict(
+                xgboost.DMatrix(X_transformed),
+                pred_contribs=True,
+                approx_contribs=approximate,
+            )
+            return contribs[:, -1], contribs[:, :-1]
+
+        values = self._tree_explainer.shap_values(
+            X_transformed, approximate=approximate
+        )
+        base = np.ravel(self._tree_explainer.expected_value)[0]
+        return np.full(len(X_transformed), base), np.asarray(values)
+
+
+class KernelContributionExplainer(_ContributionExplainer):
+    """
+    KernelSHAP over the raw features, for models TreeSHAP cannot read.
+
+    Uses the background persisted in the explainer artifact, weighted by the
+    share of training rows each background row summarizes, and its expected
+    value, so results are deterministic across processes. It needs several hundred model
+    evaluations per background row and explained row, so expect
+    hundreds of milliseconds per car; ``approximate`` has no effect.
+    """
+
+    def __init__(self, model, shap_module, artifact):
+        self._init_model(model, artifact)
+        # Attribution is done directly on the raw features
+        self._aggregation = np.eye(len(self.feature_names))
+        from shap.utils._legacy import DenseData
+
+        background = DenseData(
+            artifact["background"][self.feature_names].to_numpy(),
+            self.feature_names,
+            None,
+            np.array(artifact["background_weights"], dtype=float),
+        )
+
+        def predict(data):
+            return model.predict(pd.DataFrame(data, columns=self.feature_names))
+
+        self._kernel = shap_module.KernelExplainer(predict, background)
+        self.expected_value = float(artifact["expected_value"])
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        return X[self.feature_names]
+
+    def transformed_contributions(
+        self, X_transformed: pd.DataFrame, approximate: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        values = self._kernel.shap_values(X_transformed, silent=True)
+        return np.full(len(X_transformed), self.expected_value), np.asarray(values)
+
+
+# ---------------------------------------------------------------------------
+# Explainer artifact
+# ---------------------------------------------------------------------------
+EXPLAINER_ARTIFACT_VERSION = 1
+
+
+def build_explainer_artifact(
+    model,
+    X: pd.DataFrame,
+    n_background: int = 50,
+    random_state: int = 42,
+    max_fit_rows: int = 10_000,
+) -> Dict[str, Any]:
+    """
+    Summarize the training data into what explainers need at serving time.
+
+    The background is k-means summarized in the model's transformed space;
+    each cluster is represented by its member closest to the centroid, so
+    background rows are real cars in raw feature form.
+
+    Args:
+        model: Fitted model or ``Pipeline([ColumnTransformer, regressor])``.
+        X: Training rows (model input columns).
+        n_background: Number of background rows (clusters).
+        random_state: k-means seed.
+        max_fit_rows: k-means is fitted on a random sample of at most this
+            many rows; every row is then assigned to its nearest cluster.
+
+    Returns:
+        Dict with the background rows and weights, the expected value (and
+        whether it is the TreeSHAP bias or the background mean), the raw
+        feature names and the transformed-column to raw-feature mapping.
+    """
+    from sklearn.cluster import KMeans
+
+    preprocessor, _ = _split_pipeline(model)
+    feature_names = _fitted_feature_names(model)
+    X = X[feature_names]
+    X_transformed = np.asarray(
+        _transform_input(X, feature_names, preprocessor), dtype=float
+    )
+
+    n_clusters = min(n_background, len(X))
+    rng = np.random.default_rng(random_state)
+    fit_rows = np.arange(len(X))
+    if len(X) > max_fit_rows:
+        fit_rows = np.sort(rng.choice(len(X), max_fit_rows, replace=False))
+    kmeans = KMeans(n_clusters=n_clusters, n_init=3, random_state=random_state)
+    kmeans.fit(X_transformed[fit_rows])
+    # Weights and representatives come from every row, not just the fit sample
+    distances = kmeans.transform(X_transformed)
+    labels = np.argmin(distances, axis=1)
+    distances = distances[np.arange(len(X)), labels]
+    counts = np.bincount(labels, minlength=n_clusters)
+    clusters = np.flatnonzero(counts)
+    medoids = [
+        np.flatnonzero(labels == c)[np.argmin(distances[labels == c])] for c in clusters
+    ]
+    background = X.iloc[medoids].reset_index(drop=True)
+    weights = counts[clusters] / len(X)
+
+    try:
+        tree = TreeContributionExplainer(model, _import_shap())
+        expected_value, source = tree.expected_value, "tree"
+    except Exception:
+        predictions = np.asarray(model.predict(background), dtype=float)
+        expected_value, source = float(predictions @ weights), "background"
+
+    transformed_names = [f"x{i}" for i in range(X_transformed.shape[1])]
+    if preprocessor is not None:
+        transformed_names = list(preprocessor.get_feature_names_out())
+
+    return {
+        "format_version": EXPLAINER_ARTIFACT_VERSION,
+        "feature_names": feature_names,
+        "transformed_feature_names": transformed_names,
+        "feature_owners": _feature_owners(preprocessor, feature_names),
+        "background": background,
+        "background_weights": weights,
+        "expected_value": float(expected_value),
+        "expected_value_source": source,
+    }
+
+
+def artifact_matches(artifact: Dict[str, Any], model) -> bool:
+    """Whether an explainer artifact was built for a model with this layout."""
+    if artifact.get("format_version") != EXPLAINER_ARTIFACT_VERSION:
+        return False
+    if artifact["feature_names"] != list(getattr(model, "feature_names_in_", [])):
+        return False
+    if isinstance(model, Pipeline):
+        n_outputs = len(model.steps[0][1].get_feature_names_out())
+        return n_outputs == len(artifact["feature_owners"])
+    return True
+
+
+def load_explainer_artifact(
+    path, model=None, pipeline_hash: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Load an explainer artifact, or return None if missing or stale.
+
+    Args:
+        path: Artifact file (``explainer.pkl`` next to ``pipeline.pkl``).
+        model: If given, the artifact is only returned if it matches it.
+        pipeline_hash: If given, the artifact is only returned if it was
+            recorded for a pipeline file with this hash.
+    """
+    import joblib
+
+    try:
+        artifact = joblib.load(path)
+    except FileNotFoundError:
+        return None
+    if model is not None and not artifact_matches(artifact, model):
+        logger.warning(f"Ignoring explainer artifact {path}: built for another model")
+        return None
+    if pipeline_hash is not None and artifact.get("pipeline_hash") != pipeline_hash:
+        logger.warning(f"Ignoring explainer artifact {path}: pipeline has changed")
+        return None
+    return artifact
+
+
+def _import_shap():
+    try:
+        import shap
+
+        return shap
+    except ImportError:
+        return None
+
+
+# Explainers only depend on the model artifact, so they are built once per
+# artifact hash and shared by every provider, request and thread. A few
+# versions are kept so a hot reload back to a recent model stays warm.
+EXPLAINER_CACHE_SIZE = 4
+_explainer_cache: "OrderedDict[str, Any]" = OrderedDict()
+_explainer_cache_lock = threading.Lock()
+
+# Cached in place of an explainer when the model is not supported
+_UNSUPPORTED = object()
+
+
+def clear_explainer_cache():
+    """Drop every cached explainer (e.g. after retraining in-process)."""
+    with _explainer_cache_lock:
+        _explainer_cache.clear()
+
 
 class ShapExplanationProvider(BaseExplanationProvider):
-    def __init__(self):
+    supports_approximate = True
+
+    def __init__(
+        self,
+        model=None,
+        model_version: Optional[str] = None,
+        artifact: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            model: The production model this provider serves.
+            model_version: Artifact hash of ``model``; its explainer is cached
+                under this key. Other models passed to ``explain`` are cached
+                per provider instance instead.
+            artifact: Explainer artifact persisted with ``model`` (see
+                ``build_explainer_artifact``).
+        """
         try:
             import shap
 
@@ -30,56 +471,243 @@ class ShapExplanationProvider(BaseExplanationProvider):
                 "SHAP is not available. Explanations will fallback to empty."
             )
 
-        self.explainer = None
+        self.model = model
+        self.model_version = model_version
+        self.artifact = artifact
+        self._local_model = None
+        self._local_explainer = None
+        self._lock = threading.Lock()
 
-    def _init_explainer(self, model, X: pd.DataFrame):
-        if self.explainer is not None:
-            return
+    def _build_explainer(self, model):
+        """
+        Build the explainer for ``model``, or return ``_UNSUPPORTED``.
 
+        TreeSHAP is used whenever the model allows it. Otherwise KernelSHAP
+        runs against the background persisted in the explainer artifact;
+        without one the model is not explained (a background sampled from
+        the request itself would be meaningless).
+        """
+        artifact = self.artifact if model is self.model else None
+        start = time.perf_counter()
         try:
-            self.explainer = self.shap.TreeExplainer(model)
-        except Exception:
-            background = self.shap.sample(X, min(50, len(X)))
-
-            def predict_wrapper(data):
-                if isinstance(data, np.ndarray):
-                    data = pd.DataFrame(data, columns=X.columns)
-                return model.predict(data)
-
-            self.explainer = self.shap.KernelExplainer(predict_wrapper, background)
-
-    def explain(self, model, X: pd.DataFrame) -> Tuple[float, Dict[str, float]]:
+            explainer = TreeContributionExplainer(model, self.shap, artifact)
+        except Exception as e:
+            if artifact is None:
+                logger.warning(f"TreeSHAP unsupported for this model: {e}")
+                return _UNSUPPORTED
+            logger.warning(
+                f"TreeSHAP unsupported for this model ({e}); using KernelSHAP "
+                "with the persisted background"
+            )
+            try:
+                explainer = KernelContributionExplainer(model, self.shap, artifact)
+            except Exception as e:
+                logger.warning(f"KernelSHAP unavailable: {e}")
+                return _UNSUPPORTED
+        logger.info(
+            f"Built SHAP explainer in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+        return explainer
+
+    def _get_explainer(self, model):
+        if self.model_version is not None and model is self.model:
+            key = self.model_version
+            with _explainer_cache_lock:
+                explainer = _explainer_cache.get(key)
+                if explainer is None:
+                    explainer = self._build_explainer(model)
+                    _explainer_cache[key] = explainer
+                    while len(_explainer_cache) > EXPLAINER_CACHE_SIZE:
+                        _explainer_cache.popitem(last=False)
+                else:
+                    _explainer_cache.move_to_end(key)
+            return explainer
+
+        with self._lock:
+            if self._local_model is not model:
+                self._local_explainer = self._build_explainer(model)
+                self._local_model = model
+            return self._local_explainer
+
+    def warm_up(self) -> None:
+        """Build (or fetch from the cache) the explainer for ``self.model``."""
+        if self.is_available and self.model is not None:
+            self._get_explainer(self.model)
+
+    def explain(
+        self, model, X: pd.DataFrame, approximate: bool = False
+    ) -> Tuple[float, Dict[str, float]]:
         if not self.is_available:
             return 0.0, {col: 0.0 for col in X.columns}
 
-        self._init_explainer(model, X)
+        explainer = self._get_explainer(model)
+        if explainer is _UNSUPPORTED:
+            return 0.0, {col: 0.0 for col in X.columns}
 
         try:
-            shap_values = self.explainer.shap_values(X)
-            if isinstance(shap_values, list):
-                shap_values = shap_values[0]
+            base_values, values = explainer.contributions(X, approximate)
+            contributions = dict(
+                zip(explainer.feature_names, values[0].astype(float).tolist())
+            )
+            return float(base_values[0]), contributions
 
-            base_value = self.explainer.expected_value
-            if isinstance(base_value, list) or isinstance(base_value, np.ndarray):
-                base_value = float(base_value[0])
-            else:
-                base_value = float(base_value)
+        except Exception as e:
+            logger.error(f"SHAP explanation failed: {e}")
+            return 0.0, {col: 0.0 for col in X.columns}
 
-            contributions = {}
-            for i, col in enumerate(X.columns):
-                contributions[col] = float(shap_values[0][i])
+    def explain_batch(
+        self, model, X: pd.DataFrame, approximate: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Explain every row of X with a single TreeSHAP call."""
+        empty = np.zeros(len(X)), np.zeros((len(X), X.shape[1])), list(X.columns)
+        if not self.is_available:
+            return empty
 
-            return base_value, contributions
+        explainer = self._get_explainer(model)
+        if explainer is _UNSUPPORTED:
+            return empty
 
+        try:
+            base_values, values = explainer.contributions(X, approximate)
+            return base_values, values, explainer.feature_names
         except Exception as e:
-            logger.error(f"SHAP explanation failed: {e}")
-            return 0.0, {col: 0.0 for col in X.columns}
+            logger.error(f"SHAP batch explanation failed: {e}")
+            return empty
+
+
+# Contributions smaller than this (in INR) are not reported as factors
+NEGLIGIBLE_CONTRIBUTION = 0.01
+
+
+def _top_k(values: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Column indices of the k largest entries of each row, largest first.
+
+    Entries below ``NEGLIGIBLE_CONTRIBUTION`` are not eligible; their slots
+    hold -inf in the returned values.
+
+    Returns:
+        Tuple of (indices, values), both of shape (n_rows, k).
+    """
+    masked = np.where(values >= NEGLIGIBLE_CONTRIBUTION, values, -np.inf)
+    k = min(k, masked.shape[1])
+    if k < masked.shape[1]:
+        idx = np.argpartition(-masked, k - 1, axis=1)[:, :k]
+    else:
+        idx = np.broadcast_to(np.arange(k), masked.shape).copy()
+    top = np.take_along_axis(masked, idx, axis=1)
+    order = np.argsort(-top, axis=1, kind="stable")
+    return np.take_along_axis(idx, order, axis=1), np.take_along_axis(
+        top, order, axis=1
+    )
+
+
+# Explanation levels, cheapest first:
+#   none   - no attribution (0 ms)
+#   approx - Saabas path attribution from the tree structure: ~2.7 ms per
+#            car, ~0.2 ms per car in batches (production XGBoost pipeline,
+#            1 CPU; see benchmarks/bench_explanation_levels.py)
+#   exact  - TreeSHAP: ~13 ms per car, ~10 ms per car in batches
+EXPLANATION_LEVELS = ("none", "approx", "exact")
+
+# Starting per-car latency estimates (ms); replaced by measurements as
+# explanations are served
+DEFAULT_LEVEL_LATENCY_MS = {"none": 0.0, "approx": 3.0, "exact": 15.0}
+LATENCY_EWMA_ALPHA = 0.2
+# Each time a level is skipped for a deadline, its estimate moves this far
+# back toward the default, so one slow sample (e.g. the first call, which
+# also builds the explainer) cannot disable a level for good
+LATENCY_DECAY_ALPHA = 0.05
 
 
 class ExplanationEngine:
-    def __init__(self, provider: BaseExplanationProvider, config: Dict[str, Any]):
+    """
+    Business-friendly explanations at a requested level of detail.
+
+    Every request picks a level from ``EXPLANATION_LEVELS``. With a deadline,
+    the level is degraded (exact -> approx -> none) to the most detailed one
+    whose expected latency fits in the remaining time. Expected latencies
+    are an exponentially weighted moving average of observed explanation
+    times per level; estimates above the default decay back toward it
+    while their level is being skipped, so the level is probed again.
+
+    With a provider that has no approximate mode, "approx" runs (and is
+    reported and timed) as "exact".
+    """
+
+    def __init__(
+        self,
+        provider: BaseExplanationProvider,
+        config: Dict[str, Any],
+        rules: Optional[ValuationRules] = None,
+    ):
         self.provider = provider
-        self.translation_dict = config.get("feature_translation_dictionary", {})
+        # Compiled rules (e.g. from the shared inference context) carry the
+        # display names; a bare config only needs its translation section
+        self.translation_dict = (
+            rules.translations if rules is not None else feature_translations(config)
+        )
+        self._latency_ms = dict(DEFAULT_LEVEL_LATENCY_MS)
+        self._latency_lock = threading.Lock()
+
+    def expected_latency_ms(self, level: str) -> float:
+        """Current latency estimate for one explanation at ``level``."""
+        return self._latency_ms[level]
+
+    def _record_latency(self, level: str, elapsed_ms: float) -> None:
+        with self._latency_lock:
+            estimate = self._latency_ms[level]
+            self._latency_ms[level] = estimate + LATENCY_EWMA_ALPHA * (
+                elapsed_ms - estimate
+            )
+
+    def _decay_latency(self, level: str) -> None:
+        with self._latency_lock:
+            estimate = self._latency_ms[level]
+            default = DEFAULT_LEVEL_LATENCY_MS[level]
+            if estimate > default:
+                self._latency_ms[level] = estimate + LATENCY_DECAY_ALPHA * (
+                    default - estimate
+                )
+
+    def _runnable_level(self, level: str) -> str:
+        """Level that actually runs when ``level`` is requested."""
+        if level == "approx" and not self.provider.supports_approximate:
+            return "exact"
+        return level
+
+    def resolve_level(
+        self, level: str = "exact", deadline: Optional[float] = None
+    ) -> str:
+        """
+        Level to explain at, given the requested level and an optional deadline.
+
+        Args:
+            level: Requested level (one of ``EXPLANATION_LEVELS``).
+            deadline: Absolute ``time.perf_counter()`` time the explanation
+                should finish by.
+
+        Returns:
+            The level that will run: "approx" becomes "exact" when the
+            provider has no approximate mode.
+
+        Raises:
+            ValueError: If ``level`` is unknown.
+        """
+        if level not in EXPLANATION_LEVELS:
+            raise ValueError(
+                f"Unknown explanation level '{level}'. "
+                f"Expected one of {EXPLANATION_LEVELS}"
+            )
+        if deadline is None:
+            return self._runnable_level(level)
+        remaining_ms = (deadline - time.perf_counter()) * 1000
+        candidates = EXPLANATION_LEVELS[EXPLANATION_LEVELS.index(level) :: -1]
+        for candidate in dict.fromkeys(map(self._runnable_level, candidates)):
+            if self._latency_ms[candidate] <= remaining_ms:
+                return candidate
+            self._decay_latency(candidate)
+        return "none"
 
     def _translate_feature_name(self, feature: str) -> str:
         return self.translation_dict.get(feature, feature.replace("_", " ").title())
@@ -91,12 +719,89 @@ class ExplanationEngine:
         else:
             return f"{translated_name} reduces the market value."
 
-    def explain_prediction(self, model, X: pd.DataFrame) -> Dict[str, Any]:
+    def explain_prediction(
+        self,
+        model,
+        X: pd.DataFrame,
+        level: str = "exact",
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """
         Generate business-friendly explanation of a prediction.
+
+        Args:
+            model: Model that made the prediction.
+            X: One-row model input.
+            level: Requested explanation level.
+            deadline: Optional ``time.perf_counter()`` deadline; the level is
+                degraded to meet it (see ``resolve_level``).
+
+        Returns:
+            Explanation dict; ``level`` holds the level actually used.
         """
-        base_value, contributions = self.provider.explain(model, X)
+        level = self.resolve_level(level, deadline)
+        if level == "none":
+            return {"level": "none"}
+
+        start = time.perf_counter()
+        if level == "approx":
+            base_value, contributions = self.provider.explain(
+                model, X, approximate=True
+            )
+        else:
+            base_value, contributions = self.provider.explain(model, X)
+        self._record_latency(level, (time.perf_counter() - start) * 1000)
+        return self._build_explanation(X, base_value, contributions, level)
+
+    def explain_predictions(
+        self, model, X: pd.DataFrame, levels: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        ``explain_prediction`` for every row of X, with one provider call per
+        level.
+
+        Args:
+            model: Model that made the predictions.
+            X: Model input, one row per car.
+            levels: Explanation level per row, already resolved (see
+                ``resolve_level``).
 
+        Returns:
+            Explanation dicts in row order, equal to what
+            ``explain_prediction`` returns for each row.
+        """
+        explanations: List[Dict[str, Any]] = [{"level": "none"}] * len(X)
+        levels = np.asarray([self._runnable_level(lvl) for lvl in levels], dtype=object)
+        for level in ("approx", "exact"):
+            rows = np.flatnonzero(levels == level)
+            if len(rows) == 0:
+                continue
+            start = time.perf_counter()
+            base_values, values, feature_names = self.provider.explain_batch(
+                model,
+                X.iloc[rows],
+                approximate=level == "approx",
+            )
+            self._record_latency(
+                level, (time.perf_counter() - start) * 1000 / len(rows)
+            )
+            for j, row in enumerate(rows):
+                contributions = dict(
+                    zip(feature_names, values[j].astype(float).tolist())
+                )
+                explanations[row] = self._build_explanation(
+                    X.iloc[[row]], float(base_values[j]), contributions, level
+                )
+        return explanations
+
+    def _build_explanation(
+        self,
+        X: pd.DataFrame,
+        base_value: float,
+        contributions: Dict[str, float],
+        level: str,
+    ) -> Dict[str, Any]:
+        """Explanation dict for one row's contributions."""
         # Sort contributions by absolute magnitude
         sorted_contribs = sorted(
             contributions.items(), key=lambda x: abs(x[1]), reverse=True
@@ -106,7 +811,7 @@ class ExplanationEngine:
         negative_factors = []
 
         for feature, contrib in sorted_contribs:
-            if abs(contrib) < 0.01:  # Ignore negligible contributions
+            if abs(contrib) < NEGLIGIBLE_CONTRIBUTION:
                 continue
 
             translated_name = self._translate_feature_name(feature)
@@ -127,14 +832,64 @@ class ExplanationEngine:
         negative_factors = negative_factors[:3]
 
         if not positive_factors and not negative_factors:
-            return self._generate_heuristic_explanations(X, base_value)
+            explanation = self._generate_heuristic_explanations(X, base_value)
+            explanation["level"] = level
+            return explanation
 
         return {
             "base_value": base_value,
             "top_positive_factors": positive_factors,
             "top_negative_factors": negative_factors,
             "raw_contributions": contributions,
+            "level": level,
+        }
+
+    def explain_batch(
+        self, model, X: pd.DataFrame, top_k: int = 3, level: str = "exact"
+    ) -> Dict[str, Any]:
+        """
+        Explain every row of X in one provider call, as columnar arrays.
+
+        The top positive and negative factors per row are selected with
+        ``np.argpartition`` over the contribution matrix. Rows without
+        factors are not given heuristic explanations.
+
+        Returns:
+            Dict of arrays with one entry per row:
+                - base_value: shape (n,)
+                - feature_names: raw feature names (columns of contributions)
+                - contributions: shape (n, n_features)
+                - top_positive_features / top_negative_features: translated
+                  names, shape (n, top_k), None where a row has fewer factors
+                - top_positive_contributions / top_negative_contributions:
+                  shape (n, top_k), NaN where a row has fewer factors
+        """
+        if level not in ("approx", "exact"):
+            raise ValueError(
+                f"Batch explanations need level 'approx' or 'exact', got '{level}'"
+            )
+        base_values, values, feature_names = self.provider.explain_batch(
+            model, X, approximate=level == "approx"
+        )
+        display_names = np.array(
+            [self._translate_feature_name(f) for f in feature_names] + [None],
+            dtype=object,
+        )
+
+        result = {
+            "base_value": base_values,
+            "feature_names": list(feature_names),
+            "contributions": values,
         }
+        for side, sign in [("positive", 1.0), ("negative", -1.0)]:
+            idx, top = _top_k(sign * values, top_k)
+            valid = np.isfinite(top)
+            # The trailing None in display_names fills empty slots
+            result[f"top_{side}_features"] = display_names[
+                np.where(valid, idx, len(feature_names))
+            ]
+            result[f"top_{side}_contributions"] = np.where(valid, sign * top, np.nan)
+        return result
 
     def _generate_heuristic_explanations(
         self, X: pd.DataFrame, base_value: float
@@ -1,17 +1,137 @@
+from typing import Any, Callable, Dict, Mapping
+
 import pandas as pd
 import numpy as np
-from src.market_statistics import MarketStatistics
-from src.utils import CURRENT_YEAR, PREMIUM_BRANDS
+from src.market_statistics import MarketStatistics, vehicle_segment, vehicle_segments
+from src.utils import CURRENT_YEAR, PREMIUM_BRANDS, logger
+
+OWNER_RISK_MAP = {
+    "First Owner": 1.0,
+    "Second Owner": 0.8,
+    "Third Owner": 0.6,
+    "Fourth & Above Owner": 0.4,
+    "Test Drive Car": 0.9,
+}
+SELLER_TRUST_MAP = {"Trustmark Dealer": 1.0, "Dealer": 0.8, "Individual": 0.5}
+
+# String columns stripped of surrounding whitespace after engineering
+STRIPPED_COLUMNS = [
+    "brand",
+    "model",
+    "transmission",
+    "fuel_type",
+    "fuelType",
+    "variant",
+    "base_model",
+]
+
+
+def _strip_strings(column: pd.Series, factorized=None) -> np.ndarray:
+    """``column.astype(str).str.strip()``, stripping each distinct value once."""
+    codes, uniques = pd.factorize(column) if factorized is None else factorized
+    stripped = pd.Series(uniques, dtype=object).astype(str).str.strip().to_numpy()
+    result = np.append(stripped, "")[codes]
+    # Missing values keep their own spelling ('nan', 'None')
+    missing = codes < 0
+    if missing.any():
+        result[missing] = column[missing].astype(str).to_numpy()
+    return result
+
+
+# Scalar MarketStatistics accessor of each ``MarketStatistics.lookup`` table
+RECORD_LOOKUPS = {
+    "brand_popularity": MarketStatistics.get_brand_popularity,
+    "variant_popularity": MarketStatistics.get_variant_popularity,
+    "fuel_demand": MarketStatistics.get_fuel_demand,
+    "transmission_popularity": MarketStatistics.get_transmission_popularity,
+    "brand_stability": MarketStatistics.get_brand_stability,
+    "brand_retention_score": MarketStatistics.get_brand_retention_score,
+    "brand_annual_depreciation_rate": (
+        MarketStatistics.get_brand_annual_depreciation_rate
+    ),
+}
+
+# Feature helpers taking either a column (pd.Series) or a single value, so
+# engineer_features and engineer_record share one implementation
+
+
+def _replace_zero(values, replacement):
+    if isinstance(values, pd.Series):
+        return values.replace(0, replacement)
+    return replacement if values == 0 else values
+
+
+def _fillna(values, default):
+    if isinstance(values, pd.Series):
+        return values.fillna(default)
+    return default if pd.isna(values) else values
+
+
+def _clip(values, lower=None, upper=None):
+    if isinstance(values, pd.Series):
+        return values.clip(lower=lower, upper=upper)
+    if lower is not None and values < lower:
+        return lower
+    if upper is not None and values > upper:
+        return upper
+    return values
+
+
+def _ratio(numerator, denominator, default: float):
+    """``numerator / denominator``; a zero denominator or NaN gives ``default``."""
+    return _fillna(numerator / _replace_zero(denominator, np.nan), default)
+
+
+def _map(values, mapping: Mapping[str, float], default: float):
+    if isinstance(values, pd.Series):
+        return values.map(mapping).fillna(default)
+    return mapping.get(values, default)
+
+
+def _isin(values, choices) -> Any:
+    if isinstance(values, pd.Series):
+        return values.isin(choices).astype(int)
+    return 1 if values in choices else 0
+
+
+def _segments(engine_liters):
+    if isinstance(engine_liters, pd.Series):
+        return vehicle_segments(engine_liters)
+    return vehicle_segment(engine_liters)
 
 
 class MarketFeatureEngineer:
     """
     Intelligent Feature Engineering & Market Intelligence Layer.
     Transforms raw vehicle information into market-aware features while preserving raw columns.
+
+    With ``batch_invariant=True`` every feature depends only on its own row and
+    the fitted MarketStatistics: the scarcity normalizer and fuel efficiency
+    medians come from training time instead of the batch, and engine size units
+    are detected per row. A car then gets the same features whether it is
+    scored alone or inside any batch. Statistics pickled before the normalizers
+    existed fall back to the batch-derived values with a warning.
     """
 
-    def __init__(self, market_stats: MarketStatistics):
+    def __init__(self, market_stats: MarketStatistics, batch_invariant: bool = False):
         self.stats = market_stats
+        self.batch_invariant = batch_invariant
+        if batch_invariant and not market_stats.has_normalizers:
+            logger.warning(
+                "MarketStatistics has no training-time normalizers (pickled by an "
+                "older version); scarcity and fuel efficiency scores will depend "
+                "on the batch. Re-run training to make them batch-invariant."
+            )
+            self.batch_invariant = False
+
+    def _lookup(self, name: str, factorized, index: pd.Index) -> pd.Series:
+        """Map ``pd.factorize`` output through a MarketStatistics table."""
+        codes, uniques = factorized
+        # Missing keys (code -1) take the default in the last slot
+        values = np.append(
+            self.stats.lookup(name, uniques), self.stats.LOOKUP_DEFAULTS[name]
+        )
+        return pd.Series(values[codes], index=index)
 
     def engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -19,189 +139,204 @@ class MarketFeatureEngineer:
         Preserves all original raw features.
         """
         df = df.copy()
+        # Each key column is factorized once and looked up per distinct value
+        factorized = {}
+
+        def lookup(name: str, column: str) -> pd.Series:
+            if column not in factorized:
+                factorized[column] = pd.factorize(df[column])
+            return self._lookup(name, factorized[column], df.index)
+
+        self._engineer(df, lookup)
+
+        # Strip whitespace from string columns to prevent trailing space bugs
+        for col in STRIPPED_COLUMNS:
+            if col in df.columns:
+                df[col] = _strip_strings(df[col], factorized.get(col))
+
+        return df
+
+    def engineer_record(self, record: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Single-record counterpart of ``engineer_features`` on plain scalars.
+
+        Gives the same values as passing the record through
+        ``engineer_features`` as a one-row frame, without the pandas overhead
+        that dominates real-time (batch size 1) valuations.
+        """
+        r = dict(record)
+        stats = self.stats
+        self._engineer(r, lambda name, key: RECORD_LOOKUPS[name](stats, r[key]))
+
+        for col in STRIPPED_COLUMNS:
+            if col in r:
+                r[col] = str(r[col]).strip()
 
+        return r
+
+    def _engineer(self, f, lookup: Callable[[str, str], Any]) -> None:
+        """
+        Add every engineered feature to ``f``: a DataFrame, or a record dict
+        treated as a one-row batch.
+
+        Args:
+            f: Features; read and written by column name.
+            lookup: ``lookup(name, column)`` gives MarketStatistics table
+                ``name`` for the keys in ``f[column]``.
+        """
         # -----------------------------------------------------
         # 1. Base Transformations (if missing)
         # -----------------------------------------------------
-        if "car_age" not in df.columns:
-            df["car_age"] = CURRENT_YEAR - df["year"]
-            df["car_age"] = df["car_age"].clip(lower=0)
+        if "car_age" not in f:
+            f["car_age"] = _clip(CURRENT_YEAR - f["year"], lower=0)
 
         # -----------------------------------------------------
         # 2. Vehicle Features
         # -----------------------------------------------------
-        df["km_per_year"] = df["km_driven"] / df["car_age"].replace(0, 0.5)
+        f["km_per_year"] = f["km_driven"] / _replace_zero(f["car_age"], 0.5)
 
         # Vehicle Segment based on engine size (fallback mapping)
         engine_col = (
             "engineSize"
-            if "engineSize" in df.columns
-            else ("engine_cc" if "engine_cc" in df.columns else None)
+            if "engineSize" in f
+            else ("engine_cc" if "engine_cc" in f else None)
         )
         if engine_col:
-            engine_liters = (
-                df[engine_col] if df[engine_col].max() < 10 else df[engine_col] / 1000
-            )
-            conditions = [
-                engine_liters < 1.1,
-                engine_liters < 1.5,
-                engine_liters < 2.0,
-                engine_liters >= 2.0,
-            ]
-            choices = [
-                "A-Segment/Hatchback",
-                "B-Segment/Compact",
-                "C-Segment/Sedan",
-                "D-Segment/SUV/Luxury",
-            ]
-            df["vehicle_segment"] = np.select(conditions, choices, default="Unknown")
+            engine_liters = self._engine_liters(f[engine_col])
+            f["vehicle_segment"] = _segments(engine_liters)
         else:
             engine_liters = None
-            df["vehicle_segment"] = "Unknown"
+            f["vehicle_segment"] = "Unknown"
 
-        df["luxury_brand_flag"] = df["brand"].apply(
-            lambda x: 1 if x in PREMIUM_BRANDS else 0
-        )
+        f["luxury_brand_flag"] = _isin(f["brand"], PREMIUM_BRANDS)
 
         # Engine Performance Score (Power to displacement ratio)
-        if "max_power_bhp" in df.columns and engine_liters is not None:
-            df["engine_performance_score"] = df[
-                "max_power_bhp"
-            ] / engine_liters.replace(0, np.nan)
-            df["engine_performance_score"] = df["engine_performance_score"].fillna(0)
+        if "max_power_bhp" in f and engine_liters is not None:
+            f["engine_performance_score"] = _ratio(
+                f["max_power_bhp"], engine_liters, 0.0
+            )
         else:
-            df["engine_performance_score"] = 0.0
+            f["engine_performance_score"] = 0.0
 
         # Fuel Efficiency Score (mpg / median_mpg of fuel_type)
-        if "mpg" in df.columns or "mileage_kmpl" in df.columns:
-            mpg_col = "mpg" if "mpg" in df.columns else "mileage_kmpl"
-            fuel_medians = df.groupby("fuel_type")[mpg_col].transform("median")
-            df["fuel_efficiency_score"] = df[mpg_col] / fuel_medians.replace(0, np.nan)
-            df["fuel_efficiency_score"] = df["fuel_efficiency_score"].fillna(1.0)
+        if "mpg" in f or "mileage_kmpl" in f:
+            mpg_col = "mpg" if "mpg" in f else "mileage_kmpl"
+            f["fuel_efficiency_score"] = _ratio(
+                f[mpg_col], self._fuel_medians(f, mpg_col), 1.0
+            )
         else:
-            df["fuel_efficiency_score"] = 1.0
+            f["fuel_efficiency_score"] = 1.0
 
         # -----------------------------------------------------
         # 3. Ownership Features
         # -----------------------------------------------------
-        owner_risk_map = {
-            "First Owner": 1.0,
-            "Second Owner": 0.8,
-            "Third Owner": 0.6,
-            "Fourth & Above Owner": 0.4,
-            "Test Drive Car": 0.9,
-        }
-        if "owner" in df.columns:
-            df["owner_risk_score"] = df["owner"].map(owner_risk_map).fillna(0.7)
+        if "owner" in f:
+            f["owner_risk_score"] = _map(f["owner"], OWNER_RISK_MAP, 0.7)
         else:
-            df["owner_risk_score"] = 0.7
+            f["owner_risk_score"] = 0.7
 
-        seller_trust_map = {"Trustmark Dealer": 1.0, "Dealer": 0.8, "Individual": 0.5}
-        if "seller_type" in df.columns:
-            df["seller_type_score"] = (
-                df["seller_type"].map(seller_trust_map).fillna(0.5)
-            )
+        if "seller_type" in f:
+            f["seller_type_score"] = _map(f["seller_type"], SELLER_TRUST_MAP, 0.5)
         else:
-            df["seller_type_score"] = 0.5
+            f["seller_type_score"] = 0.5
 
         # -----------------------------------------------------
         # 4. Market Features
         # -----------------------------------------------------
-        df["brand_popularity"] = df["brand"].apply(self.stats.get_brand_popularity)
-        if "variant" in df.columns:
-            df["variant_popularity"] = df["variant"].apply(
-                self.stats.get_variant_popularity
-            )
+        f["brand_popularity"] = lookup("brand_popularity", "brand")
+        if "variant" in f:
+            f["variant_popularity"] = lookup("variant_popularity", "variant")
         else:
-            df["variant_popularity"] = 0.0
+            f["variant_popularity"] = 0.0
 
-        df["fuel_demand_score"] = df["fuel_type"].apply(self.stats.get_fuel_demand)
-        df["transmission_popularity"] = df["transmission"].apply(
-            self.stats.get_transmission_popularity
-        )
+        f["fuel_demand_score"] = lookup("fuel_demand", "fuel_type")
+        f["transmission_popularity"] = lookup("transmission_popularity", "transmission")
 
-        # Configuration Scarcity Score
-        # Inverse of variant popularity, meaning rare variants get higher scores
-        df["configuration_scarcity_score"] = 1.0 / (df["variant_popularity"] + 1e-5)
-        # Normalize to 0-1 within the current dataset
-        max_scarcity = df["configuration_scarcity_score"].max()
-        if max_scarcity > 0:
-            df["configuration_scarcity_score"] = (
-                df["configuration_scarcity_score"] / max_scarcity
-            )
-        else:
-            df["configuration_scarcity_score"] = 0.0
+        f["configuration_scarcity_score"] = self._configuration_scarcity(
+            f["variant_popularity"]
+        )
 
         # Market Stability Score
-        df["market_stability_score"] = (
-            df["brand"].apply(self.stats.get_brand_stability).fillna(0.5)
-        )
+        f["market_stability_score"] = _fillna(lookup("brand_stability", "brand"), 0.5)
 
         # Market Liquidity Score (How easily a vehicle might sell based on popularity combos)
-        df["market_liquidity_score"] = (
-            (df["brand_popularity"] * 0.4)
-            + (df["variant_popularity"] * 0.3)
-            + (df["fuel_demand_score"] * 0.3)
+        f["market_liquidity_score"] = (
+            (f["brand_popularity"] * 0.4)
+            + (f["variant_popularity"] * 0.3)
+            + (f["fuel_demand_score"] * 0.3)
         )
 
         # -----------------------------------------------------
         # 5. Depreciation Features
         # -----------------------------------------------------
-        df["brand_resale_retention_score"] = df["brand"].apply(
-            self.stats.get_brand_retention_score
-        )
-        df["historical_brand_depreciation"] = df["brand"].apply(
-            self.stats.get_brand_annual_depreciation_rate
+        f["brand_resale_retention_score"] = lookup("brand_retention_score", "brand")
+        f["historical_brand_depreciation"] = lookup(
+            "brand_annual_depreciation_rate", "brand"
         )
 
         # Age-based expected depreciation
-        df["age_based_depreciation"] = (
-            df["car_age"] * df["historical_brand_depreciation"]
+        f["age_based_depreciation"] = _clip(
+            f["car_age"] * f["historical_brand_depreciation"], upper=0.95
         )
-        df["age_based_depreciation"] = df["age_based_depreciation"].clip(upper=0.95)
 
         # Usage-Based expected depreciation
         # Using 150,000 km as a theoretical maximum healthy life baseline for severe penalty
-        df["usage_based_depreciation"] = df["km_driven"] / 150000.0
-        df["usage_based_depreciation"] = df["usage_based_depreciation"].clip(upper=1.0)
+        f["usage_based_depreciation"] = _clip(f["km_driven"] / 150000.0, upper=1.0)
 
         # Data-driven Remaining Life Index
         # Integrates retention score with age and usage penalties
-        df["remaining_life_index"] = (
-            (1.0 - df["age_based_depreciation"])
+        f["remaining_life_index"] = _clip(
+            (1.0 - f["age_based_depreciation"])
             * (
-                1.0 - df["usage_based_depreciation"] * 0.5
+                1.0 - f["usage_based_depreciation"] * 0.5
             )  # usage has a softer penalty than pure age
-            * df["brand_resale_retention_score"]
-        )
-        df["remaining_life_index"] = df["remaining_life_index"].clip(
-            lower=0.0, upper=1.0
+            * f["brand_resale_retention_score"],
+            lower=0.0,
+            upper=1.0,
         )
 
         # -----------------------------------------------------
         # 6. Backward Compatibility Aliases
         # -----------------------------------------------------
-        if "selling_price" in df.columns:
-            df["price_inr"] = df["selling_price"]
-        df["mileage"] = df["km_driven"]
+        if "selling_price" in f:
+            f["price_inr"] = f["selling_price"]
+        f["mileage"] = f["km_driven"]
 
-        if "mileage_kmpl" in df.columns:
-            df["mpg"] = df["mileage_kmpl"].fillna(0)
+        if "mileage_kmpl" in f:
+            f["mpg"] = _fillna(f["mileage_kmpl"], 0.0)
 
-        df["engineSize"] = engine_liters if engine_liters is not None else 0.0
-        df["fuelType"] = df["fuel_type"]
+        f["engineSize"] = engine_liters if engine_liters is not None else 0.0
+        f["fuelType"] = f["fuel_type"]
 
-        # Strip whitespace from string columns to prevent trailing space bugs
-        for col in [
-            "brand",
-            "model",
-            "transmission",
-            "fuel_type",
-            "fuelType",
-            "variant",
-            "base_model",
-        ]:
-            if col in df.columns:
-                df[col] = df[col].astype(str).str.strip()
+    def _engine_liters(self, engine):
+        """Engine capacity in liters from a column given in liters or cc."""
+        if isinstance(engine, pd.Series) and not self.batch_invariant:
+            # Unit detected for the whole batch
+            return engine if engine.max() < 10 else engine / 1000
+        if isinstance(engine, pd.Series):
+            return engine.where(engine < 10, engine / 1000)
+        return engine if engine < 10 else engine / 1000
 
-        return df
+    def _fuel_medians(self, f, mpg_col: str):
+        """Median fuel efficiency of each car's fuel type."""
+        fuel = f["fuel_type"]
+        if self.batch_invariant:
+            if isinstance(fuel, pd.Series):
+                return fuel.map(self.stats.fuel_efficiency_medians)
+            return self.stats.fuel_efficiency_medians.get(fuel, np.nan)
+        if isinstance(fuel, pd.Series):
+            return f.groupby("fuel_type")[mpg_col].transform("median")
+        # The median of a one-row batch; a missing fuel type has none
+        return np.nan if pd.isna(fuel) else f[mpg_col]
+
+    def _configuration_scarcity(self, variant_popularity):
+        """Inverse of variant popularity, meaning rare variants get higher scores."""
+        scarcity = 1.0 / (variant_popularity + 1e-5)
+        if self.batch_invariant:
+            # Normalize with the training-time maximum; unseen variants clip to 1
+            return _clip(
+                scarcity / self.stats.configuration_scarcity_normalizer, upper=1.0
+            )
+        # Normalize to 0-1 within the current batch
+        maximum = scarcity.max() if isinstance(scarcity, pd.Series) else scarcity
+        return scarcity / maximum if maximum > 0 else 0.0
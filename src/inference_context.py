@@ -0,0 +1,306 @@
+"""
+Inference Context
+=================
+
+Process-wide, long-lived bundle of everything needed to serve a valuation:
+
+    - the production model pipeline
+    - the fitted MarketStatistics and its MarketFeatureEngineer
+    - the CompiledPipeline single-record fast path (when supported)
+    - the parsed valuation config and its compiled ValuationRules
+    - the explainer artifact (SHAP background and expected value), if present
+    - the alternatives index (similar-car lookup), if present
+    - the explanation, valuation and decision intelligence engines
+
+Artifacts are loaded once per production model version and shared by the
+FastAPI service, the Streamlit app and batch prediction. The context is
+reloaded only when the production artifacts or the valuation config on
+disk change.
+
+Long-running services can instead turn request-time reloading off
+(``set_auto_reload(False)``) and swap new versions in from the background
+with ``reload_inference_context`` (see ``src.model_reloader``): a request
+keeps the context it started with, so it sees one consistent model.
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import joblib
+
+from src.alternatives_index import AlternativesIndex, load_alternatives_index
+from src.compiled_pipeline import CompiledPipeline
+from src.decision_intelligence import DecisionIntelligenceEngine
+from src.explanation_engine import (
+    ExplanationEngine,
+    ShapExplanationProvider,
+    load_explainer_artifact,
+)
+from src.feature_engineering import MarketFeatureEngineer
+from src.market_statistics import MarketStatistics
+from src.utils import (
+    ALTERNATIVES_INDEX_PATH,
+    EXPLAINER_ARTIFACT_PATH,
+    MARKET_STATS_PATH,
+    PIPELINE_PATH,
+    VALUATION_CONFIG_PATH,
+    load_model,
+    logger,
+)
+from src.valuation_intelligence import ValuationIntelligenceEngine
+from src.valuation_rules import ValuationRules, load_valuation_rules
+
+
+def _artifact_signature(paths) -> Tuple:
+    """Cheap change detector for on-disk artifacts (size + mtime)."""
+    signature = []
+    for path in paths:
+        stat = Path(path).stat()
+        signature.append((str(path), stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+def compute_model_version(paths) -> str:
+    """
+    Content hash identifying a set of production artifacts.
+
+    Args:
+        paths: Artifact files that together make up a model version.
+
+    Returns:
+        First 12 hex characters of the SHA-256 over all artifact bytes.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+class InferenceContext:
+    """
+    Immutable-by-convention container for loaded production artifacts.
+
+    All engines are constructed once here and are safe to share across
+    threads; per-request state lives only in the arguments passed to them.
+    """
+
+    def __init__(
+        self,
+        pipeline,
+        market_stats: MarketStatistics,
+        config: Dict[str, Any],
+        version: str = "unversioned",
+        knowledge_engine=None,
+        explainer_artifact: Optional[Dict[str, Any]] = None,
+        rules: Optional[ValuationRules] = None,
+        alternatives_index: Optional[AlternativesIndex] = None,
+    ):
+        self.pipeline = pipeline
+        self.market_stats = market_stats
+        self.config = config
+        self.rules = rules if rules is not None else ValuationRules.compile(config)
+        self.version = version
+        self.alternatives_index = alternatives_index
+
+        self.feature_engineer = MarketFeatureEngineer(
+            market_stats, batch_invariant=True
+        )
+        self.compiled_pipeline = CompiledPipeline.compile(pipeline)
+        self.shap_provider = ShapExplanationProvider(
+            pipeline, version, explainer_artifact
+        )
+        self.explanation_engine = ExplanationEngine(
+            self.shap_provider, config, self.rules
+        )
+        self.valuation_engine = ValuationIntelligenceEngine(
+            config=config,
+            rules=self.rules,
+            explanation_engine=self.explanation_engine,
+        )
+        self.decision_engine = DecisionIntelligenceEngine(
+            market_stats=market_stats, alternatives_index=alternatives_index
+        )
+        self.knowledge_engine = None
+        self._lock = threading.Lock()
+        self.bind_knowledge_engine(knowledge_engine)
+
+    @classmethod
+    def load(
+        cls,
+        pipeline_path: Path = PIPELINE_PATH,
+        stats_path: Path = MARKET_STATS_PATH,
+        config_path: Path = VALUATION_CONFIG_PATH,
+        knowledge_engine=None,
+        explainer_path: Path = EXPLAINER_ARTIFACT_PATH,
+        alternatives_path: Path = ALTERNATIVES_INDEX_PATH,
+    ) -> "InferenceContext":
+        """
+        Load all production artifacts from disk.
+
+        The explainer artifact is optional; it is ignored if it was not
+        recorded for this pipeline file. The alternatives index is optional
+        too; without it decision reports carry no alternatives.
+
+        Raises:
+            FileNotFoundError: If the pipeline or market statistics are missing.
+            ValuationConfigError: If the valuation config fails validation.
+        """
+        pipeline = load_model(pipeline_path)
+        try:
+            stats = joblib.load(stats_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Missing market_stats.pkl at {stats_path}. Run Experiment Manager first."
+            )
+
+        config, rules = load_valuation_rules(config_path)
+
+        explainer_artifact = load_explainer_artifact(
+            explainer_path, pipeline, compute_model_version([pipeline_path])
+        )
+
+        alternatives_index = load_alternatives_index(alternatives_path)
+
+        version = compute_model_version([pipeline_path, stats_path, config_path])
+        logger.info(f"Inference context loaded (model version {version})")
+        return cls(
+            pipeline,
+            stats,
+            config,
+            version,
+            knowledge_engine,
+            explainer_artifact,
+            rules,
+            alternatives_index,
+        )
+
+    def warm_up(self) -> None:
+        """Build the lazily created explainer now, before serving requests."""
+        self.shap_provider.warm_up()
+
+    def bind_knowledge_engine(self, knowledge_engine) -> None:
+        """Attach the VehicleKnowledgeEngine used for brand knowledge lookups."""
+        if knowledge_engine is None or knowledge_engine is self.knowledge_engine:
+            return
+        with self._lock:
+            self.knowledge_engine = knowledge_engine
+            self.valuation_engine.knowledge_engine = knowledge_engine
+            self.decision_engine = DecisionIntelligenceEngine(
+                knowledge_engine=knowledge_engine,
+                market_stats=self.market_stats,
+                alternatives_index=self.alternatives_index,
+            )
+
+
+# ---------------------------------------------------------------------------
+# Process-wide singleton
+# ---------------------------------------------------------------------------
+# Files whose change (size or mtime) makes get_inference_context reload
+RELOAD_PATHS = (PIPELINE_PATH, MARKET_STATS_PATH, VALUATION_CONFIG_PATH)
+
+_context: Optional[InferenceContext] = None
+_context_signature: Optional[Tuple] = None
+_context_lock = threading.Lock()
+_auto_reload = True
+
+
+def set_auto_reload(enabled: bool) -> None:
+    """
+    Turn reloading on artifact changes in ``get_inference_context`` on or off.
+
+    When off, the loaded context is served until ``reload_inference_context``
+    swaps in a new one.
+    """
+    global _auto_reload
+    _auto_reload = enabled
+
+
+def get_inference_context(
+    knowledge_engine=None, reload: bool = False
+) -> InferenceContext:
+    """
+    Return the shared InferenceContext, loading it on first use.
+
+    The context is rebuilt only when the production pipeline, market
+    statistics or valuation config change on disk (or when ``reload`` is set), unless
+    auto-reload is off (see ``set_auto_reload``).
+
+    Args:
+        knowledge_engine: Optional VehicleKnowledgeEngine to bind to the engines.
+        reload: Force a reload from disk.
+
+    Returns:
+        The process-wide InferenceContext.
+    """
+    global _context, _context_signature
+
+    context = _context
+    signature = _context_signature
+    if _auto_reload or reload or context is None:
+        signature = _artifact_signature(RELOAD_PATHS)
+    if context is None or reload or signature != _context_signature:
+        with _context_lock:
+            if _context is None or reload or signature != _context_signature:
+                previous = _context
+                _context = InferenceContext.load(
+                    knowledge_engine=knowledge_engine
+                    or (previous.knowledge_engine if previous else None)
+                )
+                _context_signature = signature
+            context = _context
+
+    context.bind_knowledge_engine(knowledge_engine)
+    return context
+
+
+def reload_inference_context(knowledge_engine=None) -> InferenceContext:
+    """
+    Load the production artifacts into a new context and swap it in.
+
+    The new context is loaded and warmed up while the current one keeps
+    serving; the swap itself is a single reference assignment.
+
+    Args:
+        knowledge_engine: VehicleKnowledgeEngine to bind; defaults to the
+            one bound to the current context.
+
+    Returns:
+        The new process-wide InferenceContext.
+    """
+    global _context, _context_signature
+
+    signature = _artifact_signature(RELOAD_PATHS)
+    previous = _context
+    context = InferenceContext.load(
+        knowledge_engine=knowledge_engine
+        or (previous.knowledge_engine if previous else None)
+    )
+    context.warm_up()
+    with _context_lock:
+        _context = context
+        _context_signature = signature
+    return context
+
+
+def loaded_model_version() -> Optional[str]:
+    """
+    Version of the loaded context, without loading anything.
+
+    Returns:
+        The version, or None if no context is loaded or (with auto-reload
+        on) the production artifacts on disk changed since it was loaded.
+    """
+    context = _context
+    if context is None:
+        return None
+    if not _auto_reload:
+        return context.version
+    try:
+        signature = _artifact_signature(RELOAD_PATHS)
+    except FileNotFoundError:
+        return None
+    return context.version if signature == _context_signature else None
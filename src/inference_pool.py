@@ -0,0 +1,112 @@
+"""
+Inference Pool
+==============
+
+Bounded worker pool that runs CPU-bound valuations off the asyncio event
+loop.
+
+FastAPI endpoints ``await pool.run(fn, ...)``. The call runs on one of
+``max_workers`` threads, so the event loop keeps serving /health and the
+knowledge endpoints while a valuation is in progress. At most
+``max_workers + max_queue`` calls may be in flight (running or waiting
+for a thread). Beyond that ``run`` raises ``InferencePoolSaturated``
+right away, and the API turns it into a 429, so a burst is shed instead
+of queueing into unbounded latency.
+
+Threads (not processes) are used because the InferenceContext is shared
+and thread-safe, and the heavy parts (XGBoost, numpy, TreeSHAP) release
+the GIL.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_MAX_QUEUE = 32
+
+
+def default_workers() -> int:
+    return min(4, os.cpu_count() or 1)
+
+
+class InferencePoolSaturated(RuntimeError):
+    """Raised when the pool already holds its maximum number of calls."""
+
+
+class InferencePool:
+    """
+    Thread pool with a hard cap on running plus queued calls.
+
+    Args:
+        max_workers: Calls run concurrently (defaults to min(4, CPUs)).
+        max_queue: Calls allowed to wait for a free worker.
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, max_queue: int = DEFAULT_MAX_QUEUE
+    ):
+        if max_workers is None:
+            max_workers = default_workers()
+        if max_workers < 1 or max_queue < 0:
+            raise ValueError("max_workers must be >= 1 and max_queue >= 0")
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="inference"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run ``fn(*args, **kwargs)`` on a worker thread and await its result.
+
+        Raises:
+            InferencePoolSaturated: If the pool is full.
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise InferencePoolSaturated(
+                    f"Inference pool full ({self._in_flight} calls in flight)"
+                )
+            self._in_flight += 1
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._release(None)
+            raise
+        # Released when the call finishes, even if the awaiting request is
+        # cancelled, so the cap counts the work actually running
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -1,7 +1,19 @@
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Any, Optional
 
 
+class _ConfigNode:
+    """One level of the VehicleKnowledgeEngine configuration index."""
+
+    __slots__ = ("children", "options", "record")
+
+    def __init__(self, record: Optional[Dict[str, Any]] = None):
+        self.children: Dict[Any, "_ConfigNode"] = {}
+        self.options: list = []
+        self.record = record
+
+
 class VehicleKnowledgeEngine:
     """
     Vehicle Knowledge Base
@@ -10,6 +22,16 @@ class VehicleKnowledgeEngine:
     combinations of Brand -> Base Model -> Year -> Variant -> Fuel -> Transmission.
     """
 
+    # Lookup order of the configuration index
+    INDEX_LEVELS = [
+        "brand",
+        "base_model",
+        "year",
+        "variant",
+        "fuelType",
+        "transmission",
+    ]
+
     BRAND_KNOWLEDGE = {
         "Maruti Suzuki": {
             "reliability": 0.85,
@@ -196,6 +218,14 @@ class VehicleKnowledgeEngine:
     def __init__(self, df: pd.DataFrame):
         self._build_knowledge_base(df)
 
+    @classmethod
+    def from_knowledge_base(cls, kb: pd.DataFrame) -> "VehicleKnowledgeEngine":
+        """Restore an engine from a previously built ``kb`` (e.g. a snapshot)."""
+        engine = cls.__new__(cls)
+        engine.kb = kb
+        engine._build_index()
+        return engine
+
     def get_brand_knowledge(self, brand: str) -> Dict[str, Any]:
         """Returns market knowledge about a brand."""
         return self.BRAND_KNOWLEDGE.get(
@@ -242,58 +272,83 @@ class VehicleKnowledgeEngine:
 
         # Sort for deterministic ordering in UI
         self.kb = self.kb.sort_values(by=required_cols)
+        self._build_index()
+
+    def _build_index(self):
+        """
+        Builds the nested Brand -> Base Model -> Year -> Variant -> Fuel ->
+        Transmission index used by the cascade lookups.
+
+        Each node keeps its children presorted and the first knowledge base
+        row (in ``self.kb`` order) that reaches it. Rows are inserted along
+        the path until the first missing key, mirroring the boolean-mask
+        lookups where NaN never matches.
+        """
+        self._index = _ConfigNode()
+        for record in self.kb.to_dict("records"):
+            node = self._index
+            for col in self.INDEX_LEVELS:
+                key = record[col]
+                if pd.isna(key):
+                    break
+                child = node.children.get(key)
+                if child is None:
+                    child = node.children[key] = _ConfigNode(record)
+                node = child
+
+        # Presort children for the UI (years newest first)
+        stack = [(self._index, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth == len(self.INDEX_LEVELS):
+                continue
+            if self.INDEX_LEVELS[depth] == "year":
+                node.options = sorted([int(y) for y in node.children], reverse=True)
+            else:
+                node.options = sorted(node.children)
+            stack.extend((child, depth + 1) for child in node.children.values())
+
+    def _lookup(self, *path) -> Optional["_ConfigNode"]:
+        """Walk the configuration index; returns None for unknown paths."""
+        node = self._index
+        for key in path:
+            node = node.children.get(key)
+            if node is None:
+                return None
+        return node
+
+    def _options(self, *path) -> list:
+        node = self._lookup(*path)
+        return list(node.options) if node is not None else []
 
     def get_brands(self) -> List[str]:
         """Get list of all valid brands."""
-        return sorted(self.kb["brand"].dropna().unique().tolist())
+        return self._options()
 
     def get_models(self, brand: str) -> List[str]:
         """Get valid base models for a brand."""
-        subset = self.kb[self.kb["brand"] == brand]
-        return sorted(subset["base_model"].dropna().unique().tolist())
+        return self._options(brand)
 
     def get_years(self, brand: str, base_model: str) -> List[int]:
         """Get valid manufacturing years for a brand + base_model combination."""
-        subset = self.kb[
-            (self.kb["brand"] == brand) & (self.kb["base_model"] == base_model)
-        ]
-        # Return years sorted descending (newest first)
-        years = subset["year"].dropna().unique().tolist()
-        return sorted([int(y) for y in years], reverse=True)
+        # Years are sorted descending (newest first)
+        return self._options(brand, base_model)
 
     def get_variants(self, brand: str, base_model: str, year: int) -> List[str]:
         """Get valid variants for a brand + base_model + year combination."""
-        subset = self.kb[
-            (self.kb["brand"] == brand)
-            & (self.kb["base_model"] == base_model)
-            & (self.kb["year"] == year)
-        ]
-        return sorted(subset["variant"].dropna().unique().tolist())
+        return self._options(brand, base_model, year)
 
     def get_fuel_types(
         self, brand: str, base_model: str, year: int, variant: str
     ) -> List[str]:
         """Get valid fuel types for the selected configuration."""
-        subset = self.kb[
-            (self.kb["brand"] == brand)
-            & (self.kb["base_model"] == base_model)
-            & (self.kb["year"] == year)
-            & (self.kb["variant"] == variant)
-        ]
-        return sorted(subset["fuelType"].dropna().unique().tolist())
+        return self._options(brand, base_model, year, variant)
 
     def get_transmissions(
         self, brand: str, base_model: str, year: int, variant: str, fuel: str
     ) -> List[str]:
         """Get valid transmissions for the selected configuration."""
-        subset = self.kb[
-            (self.kb["brand"] == brand)
-            & (self.kb["base_model"] == base_model)
-            & (self.kb["year"] == year)
-            & (self.kb["variant"] == variant)
-            & (self.kb["fuelType"] == fuel)
-        ]
-        return sorted(subset["transmission"].dropna().unique().tolist())
+        return self._options(brand, base_model, year, variant, fuel)
 
     def get_specs(
         self,
@@ -307,19 +362,11 @@ class VehicleKnowledgeEngine:
         """
         Get automatically populated specifications for a completed valid configuration.
         """
-        subset = self.kb[
-            (self.kb["brand"] == brand)
-            & (self.kb["base_model"] == base_model)
-            & (self.kb["year"] == year)
-            & (self.kb["variant"] == variant)
-            & (self.kb["fuelType"] == fuel)
-            & (self.kb["transmission"] == transmission)
-        ]
-
-        if len(subset) == 0:
+        node = self._lookup(brand, base_model, year, variant, fuel, transmission)
+        if node is None:
             return None
 
-        row = subset.iloc[0]
+        row = node.record
         conf_count = int(row["confidence_count"])
         if conf_count >= 10:
             conf_level = "High Confidence"
@@ -328,21 +375,64 @@ class VehicleKnowledgeEngine:
         else:
             conf_level = "Low Confidence"
 
+        # Records hold Python floats; np.round keeps numpy's rounding semantics
         return {
             "engineSize": (
-                round(row["engineSize"], 1) if pd.notna(row["engineSize"]) else 0.0
+                np.round(row["engineSize"], 1) if pd.notna(row["engineSize"]) else 0.0
             ),
             "max_power_bhp": (
-                round(row["max_power_bhp"], 1)
+                np.round(row["max_power_bhp"], 1)
                 if pd.notna(row["max_power_bhp"])
                 else 0.0
             ),
-            "mileage": round(row["mileage"], 1) if pd.notna(row["mileage"]) else 0.0,
+            "mileage": np.round(row["mileage"], 1) if pd.notna(row["mileage"]) else 0.0,
             "seats": int(row["seats"]) if pd.notna(row["seats"]) else 5,
             "confidence_count": conf_count,
             "confidence_level": conf_level,
         }
 
+    def get_specs_batch(self, configs: pd.DataFrame) -> pd.DataFrame:
+        """
+        Resolve specifications for many configurations in a single join.
+
+        Args:
+            configs: DataFrame with brand, base_model, year, variant, fuelType
+                and transmission columns.
+
+        Returns:
+            DataFrame aligned with ``configs.index`` holding the same fields as
+            ``get_specs`` plus a boolean ``found`` column. Rows with
+            ``found=False`` do not exist in the market and carry placeholder specs.
+        """
+        keys = ["brand", "base_model", "year", "variant", "fuelType", "transmission"]
+
+        # Mirror get_specs: NaN keys never match, and the first row wins.
+        kb = self.kb.dropna(subset=keys).drop_duplicates(subset=keys)
+        spec_cols = ["engineSize", "max_power_bhp", "mileage", "seats"]
+        kb = kb[keys + spec_cols + ["confidence_count"]].assign(found=True)
+        merged = configs[keys].merge(kb, on=keys, how="left", sort=False)
+        merged.index = configs.index
+
+        found = merged["found"].notna()
+        conf_count = merged["confidence_count"].fillna(0).astype(int)
+
+        return pd.DataFrame(
+            {
+                "engineSize": merged["engineSize"].round(1).fillna(0.0),
+                "max_power_bhp": merged["max_power_bhp"].round(1).fillna(0.0),
+                "mileage": merged["mileage"].round(1).fillna(0.0),
+                "seats": merged["seats"].fillna(5).astype(int),
+                "confidence_count": conf_count,
+                "confidence_level": np.select(
+                    [conf_count >= 10, conf_count >= 3],
+                    ["High Confidence", "Medium Confidence"],
+                    default="Low Confidence",
+                ),
+                "found": found,
+            },
+            index=configs.index,
+        )
+
     def get_variant_label(
         self, brand: str, base_model: str, year: int, variant: str
     ) -> str:
@@ -350,19 +440,14 @@ class VehicleKnowledgeEngine:
         Returns an enriched variant label including fuel, transmission, and engine size.
         E.g., "Dzire VDI (1.2L Diesel Manual)"
         """
-        subset = self.kb[
-            (self.kb["brand"] == brand)
-            & (self.kb["base_model"] == base_model)
-            & (self.kb["year"] == year)
-            & (self.kb["variant"] == variant)
-        ]
-        if len(subset) == 0:
+        node = self._lookup(brand, base_model, year, variant)
+        if node is None:
             return variant
 
         # Taking the first/most common specs for this variant to build the label
-        row = subset.iloc[0]
+        row = node.record
         engine = (
-            f"{round(row['engineSize'], 1)}L " if pd.notna(row["engineSize"]) else ""
+            f"{np.round(row['engineSize'], 1)}L " if pd.notna(row["engineSize"]) else ""
         )
         fuel = str(row["fuelType"])
         trans = str(row["transmission"])
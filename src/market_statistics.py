@@ -1,6 +1,72 @@
+import bisect
+from typing import List
+
 import pandas as pd
 import numpy as np
 
+# Upper bounds (inclusive, years) of the depreciation curve age buckets; the
+# last bucket is open-ended. Same buckets as the retention age groups.
+DEPRECIATION_AGE_BUCKETS = (2, 4, 7, 10)
+# Fewest listings in an age bucket for its median price to enter a curve
+MIN_CURVE_SAMPLES = 10
+# Annual depreciation used where no curve has data (ForecastEngine's heuristic)
+DEFAULT_ANNUAL_DEPRECIATION = 0.12
+MAX_ANNUAL_DEPRECIATION = 0.5
+
+SEGMENT_CHOICES = [
+    "A-Segment/Hatchback",
+    "B-Segment/Compact",
+    "C-Segment/Sedan",
+    "D-Segment/SUV/Luxury",
+]
+# Engine capacity (liters) below which a car falls in each segment but the last
+SEGMENT_UPPER_LITERS = (1.1, 1.5, 2.0)
+
+
+def vehicle_segments(engine_liters) -> np.ndarray:
+    """Vehicle segment per car from engine capacity in liters."""
+    engine_liters = np.asarray(engine_liters, dtype=float)
+    conditions = [engine_liters < bound for bound in SEGMENT_UPPER_LITERS]
+    conditions.append(engine_liters >= SEGMENT_UPPER_LITERS[-1])
+    return np.select(conditions, SEGMENT_CHOICES, default="Unknown")
+
+
+def vehicle_segment(engine_liters: float) -> str:
+    """Scalar ``vehicle_segments`` for one car."""
+    if pd.isna(engine_liters):
+        return "Unknown"
+    return SEGMENT_CHOICES[bisect.bisect_right(SEGMENT_UPPER_LITERS, engine_liters)]
+
+
+def _age_buckets(car_ages) -> np.ndarray:
+    return np.searchsorted(DEPRECIATION_AGE_BUCKETS, car_ages, side="left")
+
+
+def _depreciation_curve(group: pd.DataFrame) -> np.ndarray:
+    """
+    Annual depreciation rate per age bucket from median listing prices.
+
+    The rate of a bucket is the compound annual drop in median price to the
+    next bucket (the last bucket reuses the previous rate); buckets without
+    enough listings (or with no price drop) are NaN.
+    """
+    n_buckets = len(DEPRECIATION_AGE_BUCKETS) + 1
+    stats = group.groupby("bucket").agg(
+        price=("price", "median"), age=("car_age", "median"), count=("price", "size")
+    )
+    stats = stats[stats["count"] >= MIN_CURVE_SAMPLES].reindex(range(n_buckets))
+    price = stats["price"].to_numpy(dtype=float)
+    age = stats["age"].to_numpy(dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        years = age[1:] - age[:-1]
+        retention = (price[1:] / price[:-1]) ** (1.0 / years)
+        rates = np.where((years > 0) & (price[:-1] > 0), 1.0 - retention, np.nan)
+    curve = np.append(rates, rates[-1])
+    # Prices rising with age reflect a shift in model mix, not appreciation
+    curve[curve <= 0] = np.nan
+    return np.minimum(curve, MAX_ANNUAL_DEPRECIATION)
+
 
 class MarketStatistics:
     """
@@ -9,8 +75,37 @@ class MarketStatistics:
     from the raw training dataset to be consumed by the Feature Engineering layer.
     """
 
+    # Batch-invariant normalizers (see _compute_normalizers). Class-level
+    # defaults keep statistics pickled before they existed loadable.
+    configuration_scarcity_normalizer = None
+    fuel_efficiency_medians = None
+    # Depreciation curves (see _compute_depreciation_curves); None when
+    # pickled before they existed.
+    brand_depreciation_curves = None
+    segment_depreciation_curves = None
+    global_depreciation_curve = None
+
+    # Statistic -> default for unseen keys, as returned by the get_* accessors
+    LOOKUP_DEFAULTS = {
+        "brand_popularity": 0.0,
+        "variant_popularity": 0.0,
+        "fuel_demand": 0.0,
+        "transmission_popularity": 0.0,
+        "brand_stability": 0.5,
+        "brand_retention_score": 0.5,
+        "brand_annual_depreciation_rate": 0.10,
+        # Curves: NaN row for unseen keys, filled from coarser curves
+        "brand_depreciation_curves": np.nan,
+        "segment_depreciation_curves": np.nan,
+    }
+
+    # Lazily built {statistic: (key index, values + default)}; not pickled
+    _lookup_tables = None
+
     def __init__(self, df: pd.DataFrame):
         self._compute_statistics(df)
+        self._compute_normalizers(df)
+        self._compute_depreciation_curves(df)
 
     def _compute_statistics(self, df: pd.DataFrame):
         # We need a car_age proxy if not provided
@@ -106,6 +201,189 @@ class MarketStatistics:
             if pd.isna(self.brand_annual_depreciation_rate[k]):
                 self.brand_annual_depreciation_rate[k] = median_dep_rate
 
+    def _compute_normalizers(self, df: pd.DataFrame):
+        """
+        Fix the normalizers MarketFeatureEngineer otherwise takes from the batch.
+
+        The configuration scarcity normalizer is the largest scarcity among the
+        training rows; fuel efficiency medians are per fuel type over the
+        training rows, using the same mpg column the engineer reads.
+        """
+        if "variant" in df.columns and len(df):
+            min_popularity = (
+                df["variant"].map(self.variant_popularity).fillna(0.0).min()
+            )
+        else:
+            min_popularity = 0.0
+        self.configuration_scarcity_normalizer = 1.0 / (min_popularity + 1e-5)
+
+        mpg_col = "mpg" if "mpg" in df.columns else "mileage_kmpl"
+        if mpg_col in df.columns:
+            self.fuel_efficiency_medians = (
+                df.groupby("fuel_type")[mpg_col].median().to_dict()
+            )
+        else:
+            self.fuel_efficiency_medians = {}
+
+    def _compute_depreciation_curves(self, df: pd.DataFrame):
+        """
+        Annual depreciation rate per brand x age bucket (and per vehicle
+        segment x age bucket when engine capacity is known), plus a global
+        curve over all listings that backs missing cells.
+        """
+        frame = pd.DataFrame(
+            {
+                "brand": df["brand"].to_numpy(),
+                "car_age": df["car_age"].to_numpy(dtype=float),
+                "bucket": _age_buckets(df["car_age"].to_numpy()),
+                "price": df["selling_price"].to_numpy(dtype=float),
+            }
+        )
+
+        global_curve = _depreciation_curve(frame)
+        self.global_depreciation_curve = np.where(
+            np.isnan(global_curve), DEFAULT_ANNUAL_DEPRECIATION, global_curve
+        )
+        self.brand_depreciation_curves = {
+            brand: _depreciation_curve(group)
+            for brand, group in frame.groupby("brand", sort=False)
+        }
+
+        engine_col = "engineSize" if "engineSize" in df.columns else "engine_cc"
+        if engine_col in df.columns:
+            engine = df[engine_col].to_numpy(dtype=float)
+            frame["segment"] = vehicle_segments(
+                np.where(engine < 10, engine, engine / 1000)
+            )
+            self.segment_depreciation_curves = {
+                segment: _depreciation_curve(group)
+                for segment, group in frame.groupby("segment", sort=False)
+            }
+        else:
+            self.segment_depreciation_curves = {}
+
+    @property
+    def has_depreciation_curves(self) -> bool:
+        """False for statistics pickled before the curves were added."""
+        return self.brand_depreciation_curves is not None
+
+    def depreciation_rates(
+        self, brands, car_ages, horizon: int, segments=None
+    ) -> np.ndarray:
+        """
+        Annual depreciation rate for each car over the next ``horizon`` years.
+
+        The rate for forecast year h comes from the age bucket the car is in
+        during that year: the brand curve, else the segment curve (if
+        ``segments`` is given), else the global curve.
+
+        Returns:
+            Array of shape (len(brands), horizon).
+        """
+        rates = self.lookup("brand_depreciation_curves", brands)
+        if segments is not None and self.segment_depreciation_curves:
+            segment_rates = self.lookup("segment_depreciation_curves", segments)
+            rates = np.where(np.isnan(rates), segment_rates, rates)
+        rates = np.where(np.isnan(rates), self.global_depreciation_curve, rates)
+
+        ages = np.asarray(car_ages, dtype=float)[:, None] + np.arange(horizon)
+        return np.take_along_axis(rates, _age_buckets(ages), axis=1)
+
+    def retention_forecast(
+        self, brands, car_ages, horizon: int, segments=None
+    ) -> np.ndarray:
+        """
+        Share of today's value each car retains after 1..``horizon`` years.
+
+        Returns:
+            Array of shape (len(brands), horizon).
+        """
+        rates = self.depreciation_rates(brands, car_ages, horizon, segments)
+        return np.cumprod(1.0 - rates, axis=1)
+
+    @property
+    def has_normalizers(self) -> bool:
+        """False for statistics pickled before the normalizers were added."""
+        return (
+            self.configuration_scarcity_normalizer is not None
+            and self.fuel_efficiency_medians is not None
+        )
+
+    def backfill(self, df: pd.DataFrame) -> List[str]:
+        """
+        Compute the statistics an older pickle lacks from ``df``.
+
+        Every table the pickle has is kept as is, since the production
+        pipeline was trained on features looked up from them.
+
+        Args:
+            df: The training dataset (``prepare_data`` output).
+
+        Returns:
+            Names of the statistics that were filled in.
+        """
+        filled = []
+        if not self.has_normalizers:
+            self._compute_normalizers(df)
+            # Every training row's variant is a key of variant_popularity, so
+            # the training-time maximum scarcity follows from the table alone
+            if self.variant_popularity:
+                min_popularity = min(self.variant_popularity.values())
+                self.configuration_scarcity_normalizer = 1.0 / (min_popularity + 1e-5)
+            filled += ["configuration_scarcity_normalizer", "fuel_efficiency_medians"]
+        if not self.has_depreciation_curves:
+            if "car_age" not in df.columns:
+                # The proxy _compute_statistics adds to the training frame
+                from datetime import datetime
+
+                df = df.assign(car_age=(datetime.now().year - df["year"]).clip(lower=0))
+            self._compute_depreciation_curves(df)
+            filled += [
+                "brand_depreciation_curves",
+                "segment_depreciation_curves",
+                "global_depreciation_curve",
+            ]
+        return filled
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_lookup_tables", None)
+        return state
+
+    def lookup(self, name: str, keys) -> np.ndarray:
+        """
+        Vectorized ``get_*`` accessor.
+
+        Args:
+            name: Statistic name (a key of ``LOOKUP_DEFAULTS``).
+            keys: Array-like of brands, variants, fuels or transmissions.
+
+        Returns:
+            Float array of the statistic for each key, with the accessor's
+            default for unseen keys (one row per key for the curves).
+        """
+        if self._lookup_tables is None:
+            self._lookup_tables = {}
+        table = self._lookup_tables.get(name)
+        if table is None:
+            mapping = getattr(self, name)
+            values = np.asarray(list(mapping.values()), dtype=float)
+            # The default sits in the last slot, where get_indexer's -1 points
+            width = (
+                (len(DEPRECIATION_AGE_BUCKETS) + 1,) if name.endswith("_curves") else ()
+            )
+            values = np.concatenate(
+                [
+                    values.reshape((len(mapping),) + width),
+                    np.full((1,) + width, self.LOOKUP_DEFAULTS[name]),
+                ]
+            )
+            table = (pd.Index(list(mapping.keys()), dtype=object), values)
+            self._lookup_tables[name] = table
+
+        index, values = table
+        return values[index.get_indexer(keys)]
+
     # Accessors with safe defaults
     def get_brand_popularity(self, brand: str) -> float:
         return self.brand_popularity.get(brand, 0.0)
@@ -127,3 +405,37 @@ class MarketStatistics:
 
     def get_brand_annual_depreciation_rate(self, brand: str) -> float:
         return self.brand_annual_depreciation_rate.get(brand, 0.10)
+
+
+def backfill_market_statistics(path=None) -> List[str]:
+    """
+    Add the statistics missing from a saved MarketStatistics (see
+    ``MarketStatistics.backfill``), computed from the current dataset, and
+    save it back atomically.
+
+    Returns:
+        Names of the statistics that were filled in.
+    """
+    import os
+
+    import joblib
+
+    from src.data_processing import prepare_data
+    from src.utils import MARKET_STATS_PATH, logger
+
+    path = MARKET_STATS_PATH if path is None else path
+    stats = joblib.load(path)
+    filled = stats.backfill(prepare_data())
+    if filled:
+        tmp_path = path.with_suffix(".pkl.tmp")
+        joblib.dump(stats, tmp_path)
+        os.replace(tmp_path, path)
+        logger.info(f"Backfilled {filled} in {path}")
+    else:
+        logger.info(f"{path} already has every statistic")
+    return filled
+
+
+if __name__ == "__main__":
+    # Upgrade the production statistics in place: python -m src.market_statistics
+    backfill_market_statistics()
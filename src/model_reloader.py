@@ -0,0 +1,129 @@
+"""
+Model Reloader
+==============
+
+Zero-downtime pickup of newly promoted production models.
+
+``ModelRegistry.promote_to_production`` updates ``models/registry.json``
+after every production artifact is in place, so a change to the registry
+means a complete new model version is on disk. The reloader polls the
+registry from a background thread and, on a change, loads the pipeline,
+market statistics and explainers into a new InferenceContext while the
+current one keeps serving, then swaps it in (``reload_inference_context``).
+
+    reloader = ModelReloader(poll_seconds=5, on_swap=lambda context: ...)
+    reloader.start()
+
+While the reloader runs, ``get_inference_context`` no longer reloads on
+request paths, so a promotion never stalls a request.
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from src.inference_context import (
+    InferenceContext,
+    loaded_model_version,
+    reload_inference_context,
+    set_auto_reload,
+)
+from src.utils import REGISTRY_PATH, logger
+
+
+def _registry_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = Path(path).stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class ModelReloader:
+    """
+    Polls the model registry and hot-swaps the production InferenceContext.
+
+    Args:
+        registry_path: The registry manifest to watch.
+        poll_seconds: Seconds between checks.
+        on_swap: Called with the new context after each swap.
+    """
+
+    def __init__(
+        self,
+        registry_path: Path = REGISTRY_PATH,
+        poll_seconds: float = 5.0,
+        on_swap: Optional[Callable[[InferenceContext], None]] = None,
+    ):
+        if poll_seconds <= 0:
+            raise ValueError("poll_seconds must be > 0")
+        self.registry_path = Path(registry_path)
+        self.poll_seconds = poll_seconds
+        self.on_swap = on_swap
+        self._seen = _registry_signature(self.registry_path)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reloads = 0
+        self._failures = 0
+
+    def check(self) -> bool:
+        """
+        Reload if the registry changed since the last successful check.
+
+        A failed load is logged and retried at the next check; the current
+        model keeps serving meanwhile.
+
+        Returns:
+            True if a new context was swapped in.
+        """
+        signature = _registry_signature(self.registry_path)
+        if signature == self._seen:
+            return False
+
+        previous = loaded_model_version()
+        try:
+            context = reload_inference_context()
+        except Exception as e:
+            self._failures += 1
+            logger.error(f"Model reload failed, still serving {previous}: {e}")
+            return False
+
+        self._seen = signature
+        self._reloads += 1
+        logger.info(f"Swapped in model version {context.version} (was {previous})")
+        if self.on_swap is not None:
+            self.on_swap(context)
+        return True
+
+    def start(self) -> None:
+        """Start polling in a daemon thread; turns request-time reloads off."""
+        if self._thread is not None:
+            return
+        set_auto_reload(False)
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="model-reloader", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and turn request-time reloads back on."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        set_auto_reload(True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            try:
+                self.check()
+            except Exception as e:  # keep polling whatever on_swap does
+                logger.error(f"Model reloader check failed: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "poll_seconds": self.poll_seconds,
+            "reloads": self._reloads,
+            "failures": self._failures,
+        }
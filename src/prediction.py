@@ -8,9 +8,10 @@ Consolidated from train_model, evaluate_model, and predict.
 
 import json
 import warnings
+import time
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
 import matplotlib
 
@@ -22,7 +23,6 @@ from sklearn.model_selection import train_test_split, RandomizedSearchCV
 from sklearn.pipeline import Pipeline
 from sklearn.tree import DecisionTreeRegressor
 from sklearn.metrics import r2_score, mean_absolute_error, mean_squared_error
-from sklearn.neighbors import NearestNeighbors
 
 try:
     import xgboost  # noqa: F401
@@ -50,6 +50,7 @@ from src.utils import (
     RANDOM_STATE,
     TEST_SIZE,
     PIPELINE_PATH,
+    EXPLAINER_ARTIFACT_PATH,
     METADATA_PATH,
     IMAGES_DIR,
     CURRENT_YEAR,
@@ -65,6 +66,9 @@ from src.data_processing import (
     prepare_features,
     create_features,
 )
+from src.alternatives_index import build_alternatives_index
+from src.explanation_engine import TreeContributionExplainer, load_explainer_artifact
+from src.inference_context import InferenceContext, get_inference_context
 
 warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -338,20 +342,11 @@ def run_training_pipeline() -> Tuple[Pipeline, pd.DataFrame, dict]:
     tuned_metrics = evaluate_model(y_test, y_pred_tuned)
     logger.info(f"Tuned model metrics: {tuned_metrics}")
 
-    # Step 6: Train Recommender Model
+    # Step 6: Build the alternatives index
     logger.info("=" * 60)
-    logger.info("STEP 5: Train Recommendation Engine")
+    logger.info("STEP 5: Build Alternatives Index")
     logger.info("=" * 60)
-
-    # We use the preprocessor to transform all data for the nearest neighbors
-    X_transformed = preprocessor.transform(X)
-    recommender = NearestNeighbors(
-        n_neighbors=4, metric="minkowski"
-    )  # 4 because 1 is the query itself
-    recommender.fit(X_transformed)
-
-    # Save the recommender
-    # save_model(recommender, RECOMMENDER_PATH)
+    build_alternatives_index()
 
     # Step 7: Save the model
     logger.info("=" * 60)
@@ -702,6 +697,7 @@ def plot_feature_importance(pipeline: Pipeline, feature_names: list) -> None:
 def generate_shap_plots(
     pipeline: Pipeline,
     X_sample: pd.DataFrame,
+    artifact: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
     Generate SHAP explainability plots.
@@ -709,6 +705,10 @@ def generate_shap_plots(
     Args:
         pipeline: Trained sklearn Pipeline.
         X_sample: Sample of original feature data for explanation.
+        artifact: Explainer artifact persisted with the pipeline (loaded from
+            the production directory if omitted). Supplies the feature names,
+            expected value and KernelExplainer background, so plots do not
+            depend on the sampled rows.
     """
     if not SHAP_AVAILABLE:
         logger.warning("SHAP not installed. Skipping explainability plots.")
@@ -716,6 +716,9 @@ def generate_shap_plots(
 
     logger.info("Generating SHAP plots (this may take a moment)...")
 
+    if artifact is None:
+        artifact = load_explainer_artifact(EXPLAINER_ARTIFACT_PATH, pipeline)
+
     regressor = pipeline.named_steps["regressor"]
     preprocessor = pipeline.named_steps["preprocessor"]
 
@@ -723,24 +726,33 @@ def generate_shap_plots(
     X_transformed = preprocessor.transform(X_sample)
 
     # Get feature names
-    try:
-        feature_names = list(preprocessor.get_feature_names_out())
-    except AttributeError:
-        feature_names = [f"feature_{i}" for i in range(X_transformed.shape[1])]
+    if artifact is not None:
+        feature_names = list(artifact["transformed_feature_names"])
+    else:
+        try:
+            feature_names = list(preprocessor.get_feature_names_out())
+        except AttributeError:
+            feature_names = [f"feature_{i}" for i in range(X_transformed.shape[1])]
 
-    # Use TreeExplainer for tree models, otherwise KernelExplainer
+    # TreeSHAP for tree models, otherwise KernelExplainer
     try:
-        explainer = shap.TreeExplainer(regressor)
-        shap_values = explainer.shap_values(X_transformed)
+        explainer = TreeContributionExplainer(pipeline, shap, artifact)
+        _, shap_values = explainer.transformed_contributions(X_transformed)
+        expected_value = explainer.expected_value
     except Exception:
         try:
-            # Subsample for KernelExplainer (slow on large datasets)
-            background = shap.sample(X_transformed, min(50, len(X_transformed)))
+            if artifact is not None:
+                background = preprocessor.transform(artifact["background"])
+            else:
+                # Subsample for KernelExplainer (slow on large datasets)
+                logger.warning(
+                    "No explainer artifact; sampling the SHAP background from X_sample"
+                )
+                background = shap.sample(X_transformed, min(50, len(X_transformed)))
             explainer = shap.KernelExplainer(regressor.predict, background)
-            shap_values = explainer.shap_values(
-                X_transformed[: min(100, len(X_transformed))]
-            )
             X_transformed = X_transformed[: min(100, len(X_transformed))]
+            shap_values = explainer.shap_values(X_transformed)
+            expected_value = float(np.ravel(explainer.expected_value)[0])
         except Exception as e:
             logger.error(f"SHAP computation failed: {e}")
             return
@@ -780,11 +792,7 @@ def generate_shap_plots(
     try:
         explanation = shap.Explanation(
             values=shap_values[0],
-            base_values=(
-                explainer.expected_value
-                if isinstance(explainer.expected_value, float)
-                else explainer.expected_value[0]
-            ),
+            base_values=expected_value,
             data=X_transformed[0] if hasattr(X_transformed, "__getitem__") else None,
             feature_names=feature_names,
         )
@@ -858,7 +866,7 @@ if __name__ == "__main__":
     run_evaluation(pipeline, X, y, df)
 
 
-def create_input_dataframe(
+def create_input_record(
     brand: str,
     model: str,
     year: int,
@@ -867,9 +875,9 @@ def create_input_dataframe(
     fuel_type: str,
     mpg: float,
     engine_size: float,
-) -> pd.DataFrame:
+) -> Dict[str, Any]:
     """
-    Create a properly formatted DataFrame from user inputs for prediction.
+    Create the prediction input for one car as a plain record.
 
     Args:
         brand: Car brand (e.g., 'BMW', 'Audi').
@@ -882,33 +890,124 @@ def create_input_dataframe(
         engine_size: Engine size in litres.
 
     Returns:
-        DataFrame with one row formatted for the prediction pipeline.
+        Dict with the columns of ``create_input_dataframe``.
     """
     car_age = CURRENT_YEAR - year
     km_driven = mileage * 1.60934
     km_per_year = km_driven / max(car_age, 0.5)
     premium_brand_flag = 1 if brand in PREMIUM_BRANDS else 0
 
-    input_data = pd.DataFrame(
+    return {
+        "brand": brand.strip(),
+        "model": model.strip(),
+        "year": year,
+        "car_age": max(0, car_age),
+        "transmission": transmission.strip(),
+        "mileage": mileage,
+        "km_driven": km_driven,
+        "fuelType": fuel_type.strip(),
+        "fuel_type": fuel_type.strip(),
+        "mpg": mpg,
+        "engineSize": engine_size,
+        "engine_cc": engine_size * 1000.0,
+        "km_per_year": km_per_year,
+        "premium_brand_flag": premium_brand_flag,
+    }
+
+
+def create_input_dataframe(
+    brand: str,
+    model: str,
+    year: int,
+    transmission: str,
+    mileage: int,
+    fuel_type: str,
+    mpg: float,
+    engine_size: float,
+) -> pd.DataFrame:
+    """
+    Create a properly formatted DataFrame from user inputs for prediction.
+
+    Args:
+        brand: Car brand (e.g., 'BMW', 'Audi').
+        model: Car model (e.g., 'X5', 'A3').
+        year: Manufacturing year.
+        transmission: Transmission type ('Manual', 'Automatic', 'Semi-Auto').
+        mileage: Odometer reading in miles.
+        fuel_type: Fuel type ('Petrol', 'Diesel', 'Hybrid', 'Electric').
+        mpg: Miles per gallon.
+        engine_size: Engine size in litres.
+
+    Returns:
+        DataFrame with one row formatted for the prediction pipeline.
+    """
+    record = create_input_record(
+        brand, model, year, transmission, mileage, fuel_type, mpg, engine_size
+    )
+    return pd.DataFrame({key: [value] for key, value in record.items()})
+
+
+def create_input_frame(cars: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorized counterpart of ``create_input_dataframe`` for many cars.
+
+    Args:
+        cars: DataFrame with brand, model, year, transmission, mileage,
+            fuel_type, mpg and engine_size columns.
+
+    Returns:
+        DataFrame with one row per car formatted for the prediction pipeline.
+    """
+    car_age = CURRENT_YEAR - cars["year"]
+    km_driven = cars["mileage"] * 1.60934
+    fuel_type = cars["fuel_type"].str.strip()
+
+    return pd.DataFrame(
         {
-            "brand": [brand.strip()],
-            "model": [model.strip()],
-            "year": [year],
-            "car_age": [max(0, car_age)],
-            "transmission": [transmission.strip()],
-            "mileage": [mileage],
-            "km_driven": [km_driven],
-            "fuelType": [fuel_type.strip()],
-            "fuel_type": [fuel_type.strip()],
-            "mpg": [mpg],
-            "engineSize": [engine_size],
-            "engine_cc": [engine_size * 1000.0],
-            "km_per_year": [km_per_year],
-            "premium_brand_flag": [premium_brand_flag],
-        }
+            "brand": cars["brand"].str.strip(),
+            "model": cars["model"].str.strip(),
+            "year": cars["year"],
+            "car_age": car_age.clip(lower=0),
+            "transmission": cars["transmission"].str.strip(),
+            "mileage": cars["mileage"],
+            "km_driven": km_driven,
+            "fuelType": fuel_type,
+            "fuel_type": fuel_type,
+            "mpg": cars["mpg"],
+            "engineSize": cars["engine_size"],
+            "engine_cc": cars["engine_size"] * 1000.0,
+            "km_per_year": km_driven / car_age.clip(lower=0.5),
+            "premium_brand_flag": cars["brand"].isin(PREMIUM_BRANDS).astype(int),
+        },
+        index=cars.index,
     )
 
-    return input_data
+
+def _build_result(
+    report: Dict[str, Any],
+    decision_report: Dict[str, Any],
+    input_summary: Dict[str, Any],
+    original_price: float,
+    depreciation_rate: float,
+    model_version: str,
+) -> Dict[str, Any]:
+    """Reconstruct the prediction result, maintaining backward compatibility for the UI."""
+    return {
+        "predicted_price": report["estimated_market_value"],
+        "predicted_price_raw": round(report["estimated_market_value_raw"], 2),
+        "price_range": f"{report['estimated_market_range']['lower_bound']} - {report['estimated_market_range']['upper_bound']}",
+        "original_price": format_price_inr(original_price),
+        "depreciation_percent": f"{depreciation_rate * 100:.0f}%",
+        "confidence": f"{report['confidence']['score']:.0f}%",
+        "recommendations": decision_report.get(
+            "alternatives", []
+        ),  # Use new alternatives
+        # New Valuation & Decision Intelligence fields
+        "valuation_report": report,
+        "decision_report": decision_report,
+        "input_summary": input_summary,
+        "model_version": model_version,
+    }
 
 
 def predict_price(
@@ -923,68 +1022,161 @@ def predict_price(
     pipeline=None,
     asking_price: float = None,
     knowledge_engine=None,
+    context: InferenceContext = None,
+    explanation_level: str = "exact",
+    deadline_ms: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Make a price prediction for a used car using the production Model Registry.
-    """
-    if pipeline is None:
-        pipeline = load_model(PIPELINE_PATH)
 
-    # Load market statistics to initialize Feature Engineer
-    import joblib
-    from src.utils import MODELS_DIR
+    Artifacts and engines come from the shared InferenceContext, so nothing is
+    re-loaded from disk per call.
 
-    stats_path = MODELS_DIR / "production" / "market_stats.pkl"
-    try:
-        stats = joblib.load(stats_path)
-    except FileNotFoundError:
-        raise FileNotFoundError(
-            f"Missing market_stats.pkl at {stats_path}. Run Experiment Manager first."
-        )
-
-    from src.feature_engineering import MarketFeatureEngineer
+    ``explanation_level`` is "none", "approx" or "exact" (see
+    ``src.explanation_engine.EXPLANATION_LEVELS``). With ``deadline_ms``, a
+    latency budget counted from this call, the explanation is degraded to a
+    cheaper level when the budget left is too small for the requested one.
+    """
+    deadline = None
+    if deadline_ms is not None:
+        deadline = time.perf_counter() + deadline_ms / 1000
+    if context is None:
+        context = get_inference_context(knowledge_engine)
+    else:
+        context.bind_knowledge_engine(knowledge_engine)
+    if pipeline is None:
+        pipeline = context.pipeline
 
-    engineer = MarketFeatureEngineer(stats)
+    engineer = context.feature_engineer
 
-    # 1. Create base input dataframe
-    input_df = create_input_dataframe(
+    # 1. Create base input record (single-record path, no DataFrames)
+    input_record = create_input_record(
         brand, model, year, transmission, mileage, fuel_type, mpg, engine_size
     )
 
     # 2. Engineer full market features
-    input_features_df = engineer.engineer_features(input_df)
+    input_features = engineer.engineer_record(input_record)
+
+    # 3. Generate Comprehensive Report
+    compiled = context.compiled_pipeline if pipeline is context.pipeline else None
+    report = context.valuation_engine.generate_record_report(
+        pipeline,
+        input_record,
+        input_features,
+        compiled_pipeline=compiled,
+        explanation_level=explanation_level,
+        deadline=deadline,
+    )
 
-    # 3. Instantiate Engines
-    from src.explanation_engine import ShapExplanationProvider, ExplanationEngine
-    from src.valuation_intelligence import ValuationIntelligenceEngine
-    from src.decision_intelligence import DecisionIntelligenceEngine
+    result = _finish_record_result(
+        context,
+        report,
+        brand,
+        model,
+        year,
+        transmission,
+        mileage,
+        fuel_type,
+        mpg,
+        engine_size,
+        asking_price,
+    )
+    logger.info(
+        f"Valuation Generated: {result['predicted_price']} for {brand} {model} ({year})"
+    )
+    return result
 
-    # We load the config and engines
-    shap_provider = ShapExplanationProvider()
 
-    import json
+def predict_prices(
+    cars: List[Dict[str, Any]],
+    context: InferenceContext = None,
+    explanation_levels: Optional[Sequence[str]] = None,
+    deadlines: Optional[Sequence[Optional[float]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    ``predict_price`` for a handful of cars, sharing one model call.
 
-    with open("src/valuation_config.json", "r") as f:
-        config = json.load(f)
+    Each car goes through the single-record path (no DataFrames) but the
+    model runs once on all feature vectors, and explanations take one
+    provider call per level. Results equal ``predict_price`` per car. Used
+    to serve micro-batches of concurrent requests; ``predict_price_batch``
+    is faster for large batches.
 
-    explanation_engine = ExplanationEngine(shap_provider, config)
+    Args:
+        cars: Dicts of ``predict_price`` arguments (brand, model, year,
+            transmission, mileage, fuel_type, mpg, engine_size and optional
+            asking_price).
+        context: Shared InferenceContext (optional, defaults to the process-wide one).
+        explanation_levels: Requested explanation level per car (default "exact").
+        deadlines: Optional ``time.perf_counter()`` deadline per car.
 
-    valuation_engine = ValuationIntelligenceEngine(
-        config_path="src/valuation_config.json",
-        explanation_engine=explanation_engine,
-        knowledge_engine=knowledge_engine,
+    Returns:
+        List of result dicts, in the order of ``cars``.
+    """
+    if context is None:
+        context = get_inference_context()
+
+    input_records = [
+        create_input_record(
+            car["brand"],
+            car["model"],
+            car["year"],
+            car["transmission"],
+            car["mileage"],
+            car["fuel_type"],
+            car["mpg"],
+            car["engine_size"],
+        )
+        for car in cars
+    ]
+    feature_records = [
+        context.feature_engineer.engineer_record(record) for record in input_records
+    ]
+    reports = context.valuation_engine.generate_record_reports(
+        context.pipeline,
+        input_records,
+        feature_records,
+        compiled_pipeline=context.compiled_pipeline,
+        explanation_levels=explanation_levels,
+        deadlines=deadlines,
     )
+    return [
+        _finish_record_result(
+            context,
+            report,
+            car["brand"],
+            car["model"],
+            car["year"],
+            car["transmission"],
+            car["mileage"],
+            car["fuel_type"],
+            car["mpg"],
+            car["engine_size"],
+            car.get("asking_price"),
+        )
+        for car, report in zip(cars, reports)
+    ]
 
-    decision_engine = DecisionIntelligenceEngine(knowledge_engine=knowledge_engine)
 
-    # 4. Generate Comprehensive Report
-    report = valuation_engine.generate_valuation_report(
-        model_pipeline=pipeline, input_data=input_df, input_features=input_features_df
-    )
-
-    # 5. Original Price Simulation (kept for backward compatibility of UI)
+def _finish_record_result(
+    context: InferenceContext,
+    report: Dict[str, Any],
+    brand: str,
+    model: str,
+    year: int,
+    transmission: str,
+    mileage: int,
+    fuel_type: str,
+    mpg: float,
+    engine_size: float,
+    asking_price: Optional[float],
+) -> Dict[str, Any]:
+    """Decision report and result dict for one valued car."""
+    # 4. Original Price Simulation (kept for backward compatibility of UI)
     car_age = CURRENT_YEAR - year
-    depreciation_rate = stats.get_brand_annual_depreciation_rate(brand) * car_age
+    depreciation_rate = (
+        context.market_stats.get_brand_annual_depreciation_rate(brand) * car_age
+    )
     depreciation_rate = max(0.1, min(depreciation_rate, 0.75))
     original_price = report["estimated_market_value_raw"] / (1 - depreciation_rate)
 
@@ -1000,72 +1192,147 @@ def predict_price(
         "engineSize": engine_size,
     }
 
-    # 6. Generate Decision Report
-    decision_report = decision_engine.generate_decision_report(
+    # 5. Generate Decision Report
+    decision_report = context.decision_engine.generate_decision_report(
         valuation_report=report,
         input_summary=input_summary,
         asking_price=asking_price,
         current_recommendations=[],
     )
 
-    # Reconstruct result maintaining backward compatibility for the UI
-    result = {
-        "predicted_price": report["estimated_market_value"],
-        "predicted_price_raw": round(report["estimated_market_value_raw"], 2),
-        "price_range": f"{report['estimated_market_range']['lower_bound']} - {report['estimated_market_range']['upper_bound']}",
-        "original_price": format_price_inr(original_price),
-        "depreciation_percent": f"{depreciation_rate * 100:.0f}%",
-        "confidence": f"{report['confidence']['score']:.0f}%",
-        "recommendations": decision_report.get(
-            "alternatives", []
-        ),  # Use new alternatives
-        # New Valuation & Decision Intelligence fields
-        "valuation_report": report,
-        "decision_report": decision_report,
-        "input_summary": input_summary,
-    }
+    return _build_result(
+        report,
+        decision_report,
+        input_summary,
+        original_price,
+        depreciation_rate,
+        context.version,
+    )
 
-    logger.info(
-        f"Valuation Generated: {result['predicted_price']} for {brand} {model} ({year})"
+
+def predict_price_batch(
+    cars: pd.DataFrame,
+    asking_prices: Optional[pd.Series] = None,
+    context: InferenceContext = None,
+) -> List[Dict[str, Any]]:
+    """
+    Value many cars with a single feature-engineering and model pass.
+
+    Produces the same result structure as ``predict_price`` for every row,
+    except that SHAP explanations are skipped.
+
+    Args:
+        cars: DataFrame with brand, model, year, transmission, mileage,
+            fuel_type, mpg and engine_size columns.
+        asking_prices: Optional seller asking price per row (aligned to ``cars``).
+        context: Shared InferenceContext (optional, defaults to the process-wide one).
+
+    Returns:
+        List of result dicts, in the order of ``cars``.
+    """
+    if context is None:
+        context = get_inference_context()
+    if len(cars) == 0:
+        return []
+
+    stats = context.market_stats
+    valuation_engine = context.valuation_engine
+
+    # 1. Vectorized feature engineering and inference
+    input_df = create_input_frame(cars)
+    input_features_df = context.feature_engineer.engineer_features(input_df)
+    predictions, _ = valuation_engine.predict(
+        context.pipeline, input_df, input_features_df
     )
-    return result
+    predictions = np.maximum(0.0, predictions.astype(float))
+    reports = valuation_engine.build_valuation_reports(
+        predictions, input_df, input_features_df
+    )
+
+    # 2. Original price simulation
+    car_age = CURRENT_YEAR - cars["year"]
+    depreciation_rates = (
+        cars["brand"].map(stats.get_brand_annual_depreciation_rate) * car_age
+    ).clip(lower=0.1, upper=0.75)
+    original_prices = predictions / (1 - depreciation_rates.to_numpy())
+
+    if asking_prices is None:
+        asking_prices = pd.Series(None, index=cars.index, dtype=object)
+
+    # 3. Per-row report dicts from the columnar valuation and decision reports
+    summary_df = pd.DataFrame(
+        {
+            "brand": cars["brand"],
+            "model": cars["model"],
+            "year": cars["year"],
+            "car_age": car_age,
+            "transmission": cars["transmission"],
+            "mileage": cars["mileage"],
+            "fuelType": cars["fuel_type"],
+            "mpg": cars["mpg"],
+            "engineSize": cars["engine_size"],
+        }
+    )
+    decision_reports = context.decision_engine.generate_decision_reports(
+        reports, summary_df, asking_prices.astype(float).to_numpy()
+    )
+    rows = zip(
+        summary_df.to_dict("records"), original_prices, depreciation_rates.to_numpy()
+    )
+
+    results = []
+    for i, (summary, original, dep_rate) in enumerate(rows):
+        results.append(
+            _build_result(
+                reports.report(i),
+                decision_reports.report(i),
+                summary,
+                original,
+                dep_rate,
+                context.version,
+            )
+        )
 
+    logger.info(f"Batch valuation generated for {len(results)} cars")
+    return results
 
-def batch_predict(input_data: pd.DataFrame, pipeline=None) -> pd.DataFrame:
+
+def batch_predict(
+    input_data: pd.DataFrame,
+    pipeline=None,
+    context: InferenceContext = None,
+    explain: bool = False,
+    top_k: int = 3,
+    explanation_level: str = "exact",
+) -> pd.DataFrame:
     """
     Make predictions for multiple cars at once.
 
     Args:
         input_data: DataFrame with columns matching the training features.
         pipeline: Pre-loaded pipeline (optional).
+        context: Shared InferenceContext (optional, defaults to the process-wide one).
+        explain: Also add the top SHAP factors per car, computed for the whole
+            batch in one call.
+        top_k: Number of positive and negative factors per car when explaining.
+        explanation_level: "exact" (TreeSHAP) or "approx" (path attribution).
 
     Returns:
         Input DataFrame with added 'predicted_price_inr' and
-        'predicted_price_formatted' columns.
+        'predicted_price_formatted' columns. With ``explain``, also
+        'explanation_base_value' and 'top_{positive,negative}_{i}_feature' /
+        'top_{positive,negative}_{i}_contribution' columns for i = 1..top_k
+        (None / NaN where a car has fewer factors).
     """
+    if context is None:
+        context = get_inference_context()
     if pipeline is None:
-        pipeline = load_model(PIPELINE_PATH)
-
-    # Load market statistics to initialize Feature Engineer
-    import joblib
-    from src.utils import MODELS_DIR
-
-    stats_path = MODELS_DIR / "production" / "market_stats.pkl"
-    try:
-        stats = joblib.load(stats_path)
-    except FileNotFoundError:
-        raise FileNotFoundError(
-            f"Missing market_stats.pkl at {stats_path}. Run Experiment Manager first."
-        )
-
-    from src.feature_engineering import MarketFeatureEngineer
-
-    engineer = MarketFeatureEngineer(stats)
+        pipeline = context.pipeline
 
     input_data = input_data.copy()
 
     # Engineer full market features
-    input_features_df = engineer.engineer_features(input_data)
+    input_features_df = context.feature_engineer.engineer_features(input_data)
 
     predictions = pipeline.predict(input_features_df)
 
@@ -1074,4 +1341,22 @@ def batch_predict(input_data: pd.DataFrame, pipeline=None) -> pd.DataFrame:
         format_price_inr
     )
 
+    if explain:
+        model_input = input_features_df
+        if hasattr(pipeline, "feature_names_in_"):
+            model_input = input_features_df[list(pipeline.feature_names_in_)]
+        explanation = context.explanation_engine.explain_batch(
+            pipeline, model_input, top_k=top_k, level=explanation_level
+        )
+        columns = {"explanation_base_value": explanation["base_value"]}
+        for side in ["positive", "negative"]:
+            features = explanation[f"top_{side}_features"]
+            contributions = explanation[f"top_{side}_contributions"]
+            for i in range(features.shape[1]):
+                columns[f"top_{side}_{i + 1}_feature"] = features[:, i]
+                columns[f"top_{side}_{i + 1}_contribution"] = contributions[:, i]
+        input_data = pd.concat(
+            [input_data, pd.DataFrame(columns, index=input_data.index)], axis=1
+        )
+
     return input_data
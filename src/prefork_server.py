@@ -0,0 +1,177 @@
+"""
+Pre-fork API Server
+===================
+
+Multi-worker serving that loads read-only artifacts once.
+
+``uvicorn --workers N`` starts N fresh interpreters, each loading the
+production pipeline, market statistics, dataset snapshot and knowledge
+base on its own. Here the parent process loads them once
+(``api.load_artifacts``), moves every live object into the GC's permanent
+generation (``gc.freeze``) so collections in the workers do not write to
+those pages, binds the listening socket and forks the workers. Workers share the
+parent's pages copy-on-write and accept connections on the shared socket.
+A worker that exits is replaced by a new fork of the (still loaded) parent.
+
+The parent logs every worker's resident (RSS), unique (USS) and
+proportional (PSS) memory once the workers are up, and then every
+``--report-seconds``. Each worker also reports its own figures on
+GET /health.
+
+A model promoted while serving is hot-reloaded by each worker on its own
+(see ``src.model_reloader``), so the new version is not shared.
+
+Usage:
+    python -m src.prefork_server --workers 4 --host 0.0.0.0 --port 8000
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Ensure project root is on the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import uvicorn
+
+import src.api as api
+from src.inference_context import get_inference_context
+from src.utils import logger, process_memory
+
+
+def memory_report(pids: List[int]) -> List[Dict[str, float]]:
+    """``process_memory`` of each pid, with the pid."""
+    return [dict(process_memory(pid), pid=pid) for pid in pids]
+
+
+def _log_memory(workers: List[int]) -> None:
+    report = memory_report(workers)
+    for entry in report:
+        logger.info(
+            f"worker {entry['pid']}: rss={entry.get('rss_mb', 0):.1f} MB "
+            f"uss={entry.get('uss_mb', 0):.1f} MB pss={entry.get('pss_mb', 0):.1f} MB"
+        )
+    parent = process_memory()
+    total_pss = parent.get("pss_mb", 0) + sum(e.get("pss_mb", 0) for e in report)
+    logger.info(
+        f"parent {os.getpid()}: rss={parent.get('rss_mb', 0):.1f} MB; "
+        f"total pss={total_pss:.1f} MB across {len(report)} workers"
+    )
+
+
+def preload() -> None:
+    """Load and warm every read-only artifact, then freeze it for the GC."""
+    api.load_artifacts()
+    if api.pipeline is not None:
+        get_inference_context().warm_up()
+    gc.collect()
+    gc.freeze()
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _fork_worker(sock: socket.socket, log_level: str) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # Worker: uvicorn installs its own shutdown handlers
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    status = 0
+    try:
+        server = uvicorn.Server(uvicorn.Config(api.app, log_level=log_level))
+        server.run(sockets=[sock])
+    except BaseException as e:
+        logger.error(f"Worker {os.getpid()} failed: {e}")
+        status = 1
+    finally:
+        os._exit(status)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 2,
+    log_level: str = "info",
+    report_seconds: float = 0.0,
+    startup_seconds: float = 5.0,
+) -> None:
+    """
+    Load artifacts, fork ``workers`` API workers and supervise them.
+
+    Args:
+        host, port: Address of the shared listening socket.
+        workers: Number of worker processes.
+        log_level: uvicorn log level of the workers.
+        report_seconds: Seconds between memory reports (0: only once,
+            ``startup_seconds`` after the workers are forked).
+        startup_seconds: Wait before the first memory report.
+    """
+    start = time.perf_counter()
+    preload()
+    sock = bind_socket(host, port)
+    logger.info(
+        f"Artifacts loaded in {time.perf_counter() - start:.1f} s; "
+        f"forking {workers} workers on {host}:{port}"
+    )
+
+    children = {_fork_worker(sock, log_level) for _ in range(workers)}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    next_report = time.monotonic() + startup_seconds
+    while not stopping:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            pid = 0
+        if pid in children:
+            children.discard(pid)
+            logger.warning(f"Worker {pid} exited ({status}); forking a new one")
+            children.add(_fork_worker(sock, log_level))
+        if next_report is not None and time.monotonic() >= next_report:
+            _log_memory(sorted(children))
+            next_report = time.monotonic() + report_seconds if report_seconds else None
+        time.sleep(0.2)
+
+    for pid in children:
+        os.kill(pid, signal.SIGTERM)
+    for pid in children:
+        os.waitpid(pid, 0)
+    sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-fork DRIVEIQ API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--report-seconds", type=float, default=0.0)
+    args = parser.parse_args()
+    serve(args.host, args.port, args.workers, args.log_level, args.report_seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Request Coalescer
+=================
+
+Micro-batching for concurrent single-item requests.
+
+Requests that arrive within ``window_ms`` of the first request of a batch
+(or until ``max_batch`` requests are waiting) are handed to one call of a
+batch handler, and each caller gets back its own result:
+
+    coalescer = RequestCoalescer(value_cars, window_ms=5, max_batch=32)
+    result = await coalescer.submit(car)
+
+The handler is a blocking function from a list of items to a list of the
+same length. An entry that is an exception instance is raised in that
+caller only; if the handler itself raises, every caller in the batch gets
+the error. The handler runs through ``runner`` (an async callable taking
+``fn, *args``), e.g. ``InferencePool.run``, so batches respect the same
+worker limits as single requests.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+
+
+class RequestCoalescer:
+    """
+    Collects concurrent requests into batches for a vectorized handler.
+
+    Args:
+        handler: Blocking ``items -> results`` function, one result (or
+            exception instance) per item.
+        window_ms: How long the first request of a batch waits for others.
+        max_batch: Batch size that is flushed without waiting.
+        runner: Async ``(fn, *args) -> result`` used to call the handler;
+            defaults to the event loop's default executor.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Sequence[Any]],
+        window_ms: float = 5.0,
+        max_batch: int = 32,
+        runner: Optional[Callable[..., Awaitable[Any]]] = None,
+    ):
+        if window_ms < 0 or max_batch < 1:
+            raise ValueError("window_ms must be >= 0 and max_batch >= 1")
+        self.handler = handler
+        self.window_ms = window_ms
+        self.max_batch = max_batch
+        self.runner = runner or _run_in_default_executor
+        self._pending: List[tuple] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+        self._batches = 0
+        self._requests = 0
+
+    async def submit(self, item: Any) -> Any:
+        """Queue ``item`` for the next batch and await its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_ms / 1000, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self._batches += 1
+        self._requests += len(batch)
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        # Keep a reference until the batch is done
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[tuple]) -> None:
+        try:
+            results = await self.runner(self.handler, [item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch handler returned {len(results)} results "
+                    f"for {len(batch)} items"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():  # caller went away
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        return {
+            "window_ms": self.window_ms,
+            "max_batch": self.max_batch,
+            "batches": self._batches,
+            "requests": self._requests,
+            "mean_batch_size": round(self._requests / max(self._batches, 1), 2),
+        }
+
+
+async def _run_in_default_executor(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
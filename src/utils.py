@@ -9,6 +9,7 @@ DRIVEIQ 2.0: Updated for native Indian market data (INR, kilometers, kmpl).
 
 import joblib
 import logging
+from typing import Dict, Optional
 from pathlib import Path
 from datetime import datetime
 
@@ -74,9 +75,15 @@ TARGET_COLUMN = "price_inr"
 
 # Model save paths
 MODEL_PATH = MODELS_DIR / "model.pkl"
+REGISTRY_PATH = MODELS_DIR / "registry.json"
 PIPELINE_PATH = MODELS_DIR / "production" / "pipeline.pkl"
-RECOMMENDER_PATH = MODELS_DIR / "recommender.pkl"
+ALTERNATIVES_INDEX_PATH = MODELS_DIR / "production" / "alternatives_index.pkl"
 METADATA_PATH = MODELS_DIR / "production" / "metadata.json"
+MARKET_STATS_PATH = MODELS_DIR / "production" / "market_stats.pkl"
+EXPLAINER_ARTIFACT_PATH = MODELS_DIR / "production" / "explainer.pkl"
+VALUATION_CONFIG_PATH = PROJECT_ROOT / "src" / "valuation_config.json"
+SNAPSHOT_DIR = MODELS_DIR / "snapshots"
+SOURCE_CACHE_DIR = MODELS_DIR / "source_cache"
 
 
 # ---------------------------------------------------------------------------
@@ -158,3 +165,36 @@ def get_data_dir() -> Path:
         raise FileNotFoundError(
             "No data directory found. Ensure CSV files are in 'data/raw/'."
         )
+
+
+# /proc/<pid>/smaps_rollup fields, in kB
+SMAPS_FIELDS = {
+    "Rss": "rss_mb",
+    "Pss": "pss_mb",
+    "Private_Clean": "uss_mb",
+    "Private_Dirty": "uss_mb",
+}
+
+
+def process_memory(pid: Optional[int] = None) -> Dict[str, float]:
+    """
+    Resident, unique and proportional memory of a process, in MB.
+
+    USS counts the pages only this process maps: what it really costs.
+    RSS also counts pages shared with the parent and sibling workers.
+
+    Returns:
+        ``rss_mb``, ``uss_mb`` and ``pss_mb``, or an empty dict where
+        ``/proc/<pid>/smaps_rollup`` is unavailable (non-Linux).
+    """
+    path = f"/proc/{pid or 'self'}/smaps_rollup"
+    memory = {"rss_mb": 0.0, "uss_mb": 0.0, "pss_mb": 0.0}
+    try:
+        with open(path) as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in SMAPS_FIELDS:
+                    memory[SMAPS_FIELDS[name]] += int(value.split()[0]) / 1024
+    except (FileNotFoundError, PermissionError, ProcessLookupError):
+        return {}
+    return {key: round(value, 1) for key, value in memory.items()}
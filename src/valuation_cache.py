@@ -0,0 +1,147 @@
+"""
+Valuation Cache
+===============
+
+Size-bounded LRU cache of valuation results with a TTL.
+
+Traffic is dominated by a few popular configurations at similar mileages,
+so results are keyed on the configuration, the mileage bucket and the
+production model version:
+
+    cache = ValuationCache(max_entries=4096, ttl_seconds=600, mileage_bucket_km=1000)
+    cache.sync_version(context.version)
+    key = cache.key(context.version, car_fields)
+    result = cache.get(key)
+
+Bucketing is opt-in (the default width of 1 km keys on exact mileage).
+With wider buckets, cars in the same bucket share one entry, so callers
+value a miss they will store at ``bucket_mileage(mileage)`` (the bucket
+midpoint): an entry then does not depend on which request filled it.
+
+``sync_version`` drops every entry when the production model version
+changes, e.g. after the registry promotes a new model. Entries are also
+dropped ``ttl_seconds`` after they were stored, and the least recently
+used entry is evicted once ``max_entries`` are held.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+
+class ValuationCache:
+    """
+    Thread-safe LRU/TTL cache for valuation results.
+
+    Args:
+        max_entries: Entries held before the least recently used is evicted.
+        ttl_seconds: Seconds an entry is served after it was stored.
+        mileage_bucket_km: Width of a mileage bucket; 1 (the default) keys
+            on exact mileage.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl_seconds: float = 600.0,
+        mileage_bucket_km: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1 or ttl_seconds <= 0 or mileage_bucket_km < 1:
+            raise ValueError(
+                "max_entries and mileage_bucket_km must be >= 1 and ttl_seconds > 0"
+            )
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.mileage_bucket_km = mileage_bucket_km
+        self.clock = clock
+        self.version: Optional[str] = None
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def bucket_mileage(self, mileage: int) -> int:
+        """Representative mileage (the midpoint) of the bucket ``mileage`` is in."""
+        if self.mileage_bucket_km == 1:
+            return int(mileage)
+        bucket = int(mileage) // self.mileage_bucket_km
+        return bucket * self.mileage_bucket_km + self.mileage_bucket_km // 2
+
+    def key(self, version: str, fields: Mapping[str, Any]) -> Tuple:
+        """
+        Cache key for a car.
+
+        Args:
+            version: Production model version the result is computed with.
+            fields: Everything the result depends on, including ``mileage``.
+                Names are used as given: the knowledge engine matches them
+                exactly, so folding case or spacing would let an unknown
+                configuration hit a known one.
+        """
+        fields = dict(fields, mileage=self.bucket_mileage(fields["mileage"]))
+        return (version,) + tuple(sorted(fields.items()))
+
+    def sync_version(self, version: str) -> None:
+        """Drop every entry if the production model version changed."""
+        with self._lock:
+            if version == self.version:
+                return
+            if self.version is not None:
+                self._invalidations += 1
+            self.version = version
+            self._entries.clear()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Cached result for ``key``, or None (a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.clock() - entry[0] >= self.ttl_seconds:
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Tuple, value: Any) -> None:
+        """Store a result; ignored if it was computed with an outdated version."""
+        with self._lock:
+            if key[0] != self.version:
+                return
+            self._entries[key] = (self.clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "mileage_bucket_km": self.mileage_bucket_km,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "miss_ratio": round(self._misses / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "invalidations": self._invalidations,
+        }
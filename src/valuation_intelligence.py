@@ -1,10 +1,161 @@
-import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
 import pandas as pd
 
 from src.utils import format_price_inr
 from src.knowledge_engine import VehicleKnowledgeEngine
 from src.explanation_engine import ExplanationEngine
+from src.compiled_pipeline import CompiledPipeline
+from src.valuation_rules import (
+    CONFIDENCE_LABELS,
+    MARKET_POSITIONS,
+    RISK_LEVELS,
+    ValuationRules,
+    load_valuation_rules,
+)
+
+
+def _first(data: Union[pd.DataFrame, Mapping[str, Any]], key: str, default: Any):
+    """First value of ``key`` in a one-row DataFrame or a record dict."""
+    if isinstance(data, pd.DataFrame):
+        return data[key].iloc[0] if key in data.columns else default
+    return data.get(key, default)
+
+
+def _column(data: pd.DataFrame, key: str, default: Any) -> np.ndarray:
+    """Column ``key`` as an array, or ``default`` for every row (cf. ``_first``)."""
+    if key in data.columns:
+        return data[key].to_numpy()
+    return np.full(len(data), default)
+
+
+# Python's min(a, b) / max(a, b) (including their NaN behaviour), elementwise
+def _py_min(a, b):
+    return np.where(b < a, b, a)
+
+
+def _py_max(a, b):
+    return np.where(b > a, b, a)
+
+
+def _labels(labels: Tuple[str, ...], codes: np.ndarray) -> np.ndarray:
+    """Object array of ``labels[code]`` per row."""
+    return np.array(labels, dtype=object)[codes]
+
+
+RISK_TYPES = {
+    "Ownership Risk": "ownership_risk",
+    "Market Risk": "market_risk",
+    "Maintenance Risk": "maintenance_risk",
+}
+
+# Input fields read by ``_generate_ai_summary``
+SUMMARY_FIELDS = ("brand", "model", "year", "mileage")
+
+
+class ValuationReportBatch:
+    """
+    Columnar valuation reports for N cars.
+
+    Every report field is an array; the per-car report dicts of
+    ``ValuationIntelligenceEngine.build_valuation_report`` (including the
+    formatted prices and AI summary) are only built by ``report`` /
+    ``reports``.
+    """
+
+    def __init__(
+        self,
+        engine: "ValuationIntelligenceEngine",
+        input_data: pd.DataFrame,
+        predicted_price: np.ndarray,
+        confidence_score: np.ndarray,
+        confidence_label: np.ndarray,
+        lower_bound: np.ndarray,
+        upper_bound: np.ndarray,
+        risks: Dict[str, np.ndarray],
+        market_position: np.ndarray,
+        recommendation: np.ndarray,
+    ):
+        self._engine = engine
+        self._input_data = input_data
+        self.predicted_price = predicted_price
+        self.confidence_score = confidence_score
+        self.confidence_label = confidence_label
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+        self.risks = risks
+        self.market_position = market_position
+        self.recommendation = recommendation
+
+    def __len__(self) -> int:
+        return len(self.predicted_price)
+
+    def rounded_confidence_score(self) -> np.ndarray:
+        """``round(score, 1)`` per row, as in the report dicts."""
+        # Python's round() on the (few) distinct scores, for exact parity
+        uniques, inverse = np.unique(self.confidence_score, return_inverse=True)
+        return np.array([round(float(u), 1) for u in uniques])[inverse]
+
+    def to_frame(self) -> pd.DataFrame:
+        """All report fields as columns (no formatting)."""
+        return pd.DataFrame(
+            {
+                "estimated_market_value_raw": self.predicted_price,
+                "lower_raw": self.lower_bound,
+                "upper_raw": self.upper_bound,
+                "confidence_score": self.confidence_score,
+                "confidence_label": self.confidence_label,
+                **{name: levels for name, levels in self.risks.items()},
+                "market_position": self.market_position,
+                "recommendation": self.recommendation,
+            },
+            index=self._input_data.index,
+        )
+
+    def report(self, i: int) -> Dict[str, Any]:
+        """Report dict for row ``i``, as ``build_valuation_report`` returns it."""
+        predicted_price = float(self.predicted_price[i])
+        lower_bound = float(self.lower_bound[i])
+        upper_bound = float(self.upper_bound[i])
+        confidence_label = str(self.confidence_label[i])
+        market_position = str(self.market_position[i])
+        input_data = {
+            key: self._input_data[key].iat[i]
+            for key in SUMMARY_FIELDS
+            if key in self._input_data.columns
+        }
+
+        return {
+            "estimated_market_value": format_price_inr(predicted_price),
+            "estimated_market_value_raw": predicted_price,
+            "estimated_market_range": {
+                "lower_bound": format_price_inr(lower_bound),
+                "upper_bound": format_price_inr(upper_bound),
+                "lower_raw": lower_bound,
+                "upper_raw": upper_bound,
+            },
+            "confidence": {
+                "score": round(float(self.confidence_score[i]), 1),
+                "label": confidence_label,
+            },
+            "market_position": market_position,
+            "risk_assessment": {
+                name: str(levels[i]) for name, levels in self.risks.items()
+            },
+            "recommendation": str(self.recommendation[i]),
+            "ai_summary": self._engine._generate_ai_summary(
+                input_data, predicted_price, confidence_label, market_position, [], []
+            ),
+            "explanation": {
+                "major_positive_factors": [],
+                "major_negative_factors": [],
+                "level": "none",
+            },
+        }
+
+    def reports(self) -> List[Dict[str, Any]]:
+        """Report dicts for every row."""
+        return [self.report(i) for i in range(len(self))]
 
 
 class ValuationIntelligenceEngine:
@@ -13,9 +164,15 @@ class ValuationIntelligenceEngine:
         config_path: str = "src/valuation_config.json",
         explanation_engine: Optional[ExplanationEngine] = None,
         knowledge_engine: Optional[VehicleKnowledgeEngine] = None,
+        config: Optional[Dict[str, Any]] = None,
+        rules: Optional[ValuationRules] = None,
     ):
-        with open(config_path, "r") as f:
-            self.config = json.load(f)
+        # Already-compiled rules or an already-parsed config (e.g. from the
+        # shared inference context) take precedence over re-reading the file.
+        if config is None:
+            config, rules = load_valuation_rules(config_path)
+        self.config = config
+        self.rules = rules if rules is not None else ValuationRules.compile(config)
 
         self.explanation_engine = explanation_engine
         self.knowledge_engine = knowledge_engine
@@ -29,33 +186,24 @@ class ValuationIntelligenceEngine:
         confidence = 100.0
 
         # 1. Age penalty (older cars are harder to price accurately)
-        car_age = input_features.get("car_age", pd.Series([0])).iloc[0]
+        car_age = _first(input_features, "car_age", 0)
         if car_age > 10:
             confidence -= (car_age - 10) * 1.5
 
         # 2. Scarcity penalty (rare configurations have lower confidence)
-        scarcity = input_features.get(
-            "configuration_scarcity_score", pd.Series([0.0])
-        ).iloc[0]
+        scarcity = _first(input_features, "configuration_scarcity_score", 0.0)
         if scarcity > 0.7:
             confidence -= (scarcity - 0.7) * 20
 
         # 3. Liquidity penalty (hard to sell cars have volatile prices)
-        liquidity = input_features.get("market_liquidity_score", pd.Series([1.0])).iloc[
-            0
-        ]
+        liquidity = _first(input_features, "market_liquidity_score", 1.0)
         if liquidity < 0.3:
             confidence -= (0.3 - liquidity) * 20
 
         return max(min(confidence, 98.0), 50.0)
 
     def _get_confidence_label(self, confidence_score: float) -> str:
-        thresh = self.config["confidence_thresholds"]
-        if confidence_score >= thresh["high_min"]:
-            return "High"
-        elif confidence_score >= thresh["medium_min"]:
-            return "Medium"
-        return "Low"
+        return self.rules.confidence_label(confidence_score)
 
     def _calculate_dynamic_range(
         self, predicted_price: float, confidence: float, input_features: pd.DataFrame
@@ -72,9 +220,7 @@ class ValuationIntelligenceEngine:
         variance += confidence_penalty
 
         # Market stability modifier
-        stability = input_features.get("market_stability_score", pd.Series([0.5])).iloc[
-            0
-        ]
+        stability = _first(input_features, "market_stability_score", 0.5)
         variance += (1.0 - stability) * 0.05
 
         # Max cap variance to 25%
@@ -94,12 +240,10 @@ class ValuationIntelligenceEngine:
         """
         Provide risk assessment mapping based on realistic market heuristics.
         """
-        risk_config = self.config["risk_thresholds"]
-
-        car_age = input_data.get("car_age", pd.Series([5])).iloc[0]
-        mileage = input_data.get("mileage", pd.Series([50000])).iloc[0]
-        engine_size = input_data.get("engine_size", pd.Series([1.2])).iloc[0]
-        brand = input_data.get("brand", pd.Series(["Unknown"])).iloc[0]
+        car_age = _first(input_data, "car_age", 5)
+        mileage = _first(input_data, "mileage", 50000)
+        engine_size = _first(input_data, "engine_size", 1.2)
+        brand = _first(input_data, "brand", "Unknown")
 
         # Get Brand Knowledge
         brand_info = {}
@@ -123,10 +267,8 @@ class ValuationIntelligenceEngine:
 
         # 2. Market Risk
         # Based on brand liquidity, popularity, and stability
-        stability = input_features.get("market_stability_score", pd.Series([0.5])).iloc[
-            0
-        ]
-        popularity = input_features.get("brand_popularity", pd.Series([0.5])).iloc[0]
+        stability = _first(input_features, "market_stability_score", 0.5)
+        popularity = _first(input_features, "brand_popularity", 0.5)
         # High liquidity + High stability + High popularity = Low Market Risk
         market_strength = (liquidity * 0.5) + (stability * 0.3) + (popularity * 0.2)
         market_risk_score = max(0.0, 1.0 - market_strength)
@@ -152,17 +294,11 @@ class ValuationIntelligenceEngine:
         )  # High reliability reduces the final score
         maintenance_risk_score = min(1.0, max(0.0, maintenance_risk_score))
 
-        def _get_level(score, r_type):
-            if score >= risk_config[r_type]["high_min"]:
-                return "High"
-            elif score >= risk_config[r_type]["medium_min"]:
-                return "Medium"
-            return "Low"
-
+        level = self.rules.risk_level
         return {
-            "Ownership Risk": _get_level(owner_risk_score, "ownership_risk"),
-            "Market Risk": _get_level(market_risk_score, "market_risk"),
-            "Maintenance Risk": _get_level(maintenance_risk_score, "maintenance_risk"),
+            "Ownership Risk": level(owner_risk_score, "ownership_risk"),
+            "Market Risk": level(market_risk_score, "market_risk"),
+            "Maintenance Risk": level(maintenance_risk_score, "maintenance_risk"),
         }
 
     def _get_market_position(self, input_features: pd.DataFrame) -> str:
@@ -173,9 +309,7 @@ class ValuationIntelligenceEngine:
         # But we can assess if the CAR's intrinsic value makes it a premium-priced car relative to its baseline.
         # Let's interpret 'Market Position' as how well the car retains its value compared to an average car.
 
-        retention = input_features.get(
-            "brand_resale_retention_score", pd.Series([1.0])
-        ).iloc[0]
+        retention = _first(input_features, "brand_resale_retention_score", 1.0)
 
         # If retention > 1.0, it retains better.
         # To match the prompt's thresholds (-0.05, +0.05, +0.15), we map this.
@@ -184,17 +318,7 @@ class ValuationIntelligenceEngine:
         # Market Position without an asking price is essentially "Value Retention".
         # For the sake of the interface, we'll map brand retention to market position.
 
-        offset = 1.0 - retention
-        thresh = self.config["market_position_thresholds"]
-
-        if offset < thresh["undervalued_max"]:
-            return "Undervalued"
-        elif offset <= thresh["fairly_priced_max"]:
-            return "Fairly Priced"
-        elif offset <= thresh["slightly_overpriced_max"]:
-            return "Slightly Overpriced"
-        else:
-            return "Overpriced"
+        return self.rules.market_position(1.0 - retention)
 
     def _get_recommendation(
         self, market_position: str, confidence_label: str, risks: Dict[str, str]
@@ -202,22 +326,169 @@ class ValuationIntelligenceEngine:
         """
         Generate recommendations using multiple factors.
         """
-        ownership_risk = risks.get("Ownership Risk", "Low")
+        # Precomputed from recommendation_matrix (first matching rule wins,
+        # "Fair Purchase" as the fallback)
+        return self.rules.recommendation(
+            market_position, confidence_label, risks.get("Ownership Risk", "Low")
+        )
 
-        matrix = self.config["recommendation_matrix"]
+    # ------------------------------------------------------------------
+    # Columnar counterparts of the single-car helpers above
+    # ------------------------------------------------------------------
+    def _calculate_confidences(self, input_features: pd.DataFrame) -> np.ndarray:
+        """Columnar ``_calculate_confidence``."""
+        car_age = _column(input_features, "car_age", 0)
+        scarcity = _column(input_features, "configuration_scarcity_score", 0.0)
+        liquidity = _column(input_features, "market_liquidity_score", 1.0)
+
+        confidence = 100.0 - np.where(car_age > 10, (car_age - 10) * 1.5, 0.0)
+        confidence = confidence - np.where(scarcity > 0.7, (scarcity - 0.7) * 20, 0.0)
+        confidence = confidence - np.where(liquidity < 0.3, (0.3 - liquidity) * 20, 0.0)
+        return _py_max(_py_min(confidence, 98.0), 50.0).astype(float)
+
+    def _calculate_dynamic_ranges(
+        self,
+        predicted_prices: np.ndarray,
+        confidences: np.ndarray,
+        input_features: pd.DataFrame,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Columnar ``_calculate_dynamic_range``."""
+        variance = 0.03 + (100 - confidences) / 100.0 * 0.20
+        stability = _column(input_features, "market_stability_score", 0.5)
+        variance = variance + (1.0 - stability) * 0.05
+        variance = _py_min(variance, 0.25)
+        return predicted_prices * (1 - variance), predicted_prices * (1 + variance)
+
+    def _brand_knowledge_columns(self, brands: np.ndarray):
+        """Reliability, liquidity and premium flag per row, one lookup per brand."""
+        codes, uniques = pd.factorize(brands, use_na_sentinel=False)
+        info = [
+            (
+                self.knowledge_engine.get_brand_knowledge(b)
+                if self.knowledge_engine
+                else {}
+            )
+            for b in uniques
+        ]
+        reliability = np.array([i.get("reliability", 0.65) for i in info], dtype=float)
+        liquidity = np.array([i.get("liquidity", 0.50) for i in info], dtype=float)
+        premium = np.array([bool(i.get("premium", False)) for i in info])
+        return reliability[codes], liquidity[codes], premium[codes]
 
-        for rec, rules in matrix.items():
-            if (
-                market_position in rules["market_position"]
-                and confidence_label in rules["confidence"]
-            ):
-                max_risk = rules["max_ownership_risk"]
-                # Risk check: Low < Medium < High
-                risk_levels = {"Low": 1, "Medium": 2, "High": 3}
-                if risk_levels[ownership_risk] <= risk_levels[max_risk]:
-                    return rec
+    def _assess_risks_columns(
+        self,
+        input_features: pd.DataFrame,
+        input_data: pd.DataFrame,
+        confidence_labels: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """Columnar ``_assess_risks``: risk name -> RISK_LEVELS index per row."""
+        car_age = _column(input_data, "car_age", 5)
+        mileage = _column(input_data, "mileage", 50000)
+        engine_size = _column(input_data, "engine_size", 1.2)
+        brands = _column(input_data, "brand", "Unknown")
+        reliability, liquidity, is_premium = self._brand_knowledge_columns(brands)
+
+        # 1. Ownership Risk
+        base_owner_risk = np.where(car_age <= 3, 0.2, np.where(car_age <= 7, 0.4, 0.6))
+        penalty = np.where(
+            confidence_labels == "Low Confidence",
+            0.2,
+            np.where(confidence_labels == "Medium Confidence", 0.1, 0.0),
+        )
+        owner_risk_score = _py_min(1.0, base_owner_risk + penalty)
 
-        return "Fair Purchase"  # Fallback
+        # 2. Market Risk
+        stability = _column(input_features, "market_stability_score", 0.5)
+        popularity = _column(input_features, "brand_popularity", 0.5)
+        market_strength = (liquidity * 0.5) + (stability * 0.3) + (popularity * 0.2)
+        market_risk_score = _py_max(0.0, 1.0 - market_strength)
+
+        # 3. Maintenance Risk
+        age_factor = _py_min(1.0, car_age / 15.0)
+        mileage_factor = _py_min(1.0, mileage / 150000.0)
+        complexity_penalty = np.where(engine_size > 1.6, 0.15, 0.0)
+        premium_penalty = np.where(is_premium, 0.2, 0.0)
+        maintenance_risk_score = (
+            (age_factor * 0.4)
+            + (mileage_factor * 0.4)
+            + complexity_penalty
+            + premium_penalty
+        )
+        maintenance_risk_score = maintenance_risk_score * (1.5 - reliability)
+        maintenance_risk_score = _py_min(1.0, _py_max(0.0, maintenance_risk_score))
+
+        scores = {
+            "Ownership Risk": owner_risk_score,
+            "Market Risk": market_risk_score,
+            "Maintenance Risk": maintenance_risk_score,
+        }
+        return {
+            name: self.rules.risk_codes(scores[name], risk_type)
+            for name, risk_type in RISK_TYPES.items()
+        }
+
+    def _get_market_positions(self, input_features: pd.DataFrame) -> np.ndarray:
+        """Columnar ``_get_market_position`` (MARKET_POSITIONS index per row)."""
+        retention = _column(input_features, "brand_resale_retention_score", 1.0)
+        return self.rules.market_position_codes(1.0 - retention)
+
+    def build_valuation_reports(
+        self,
+        predicted_prices: np.ndarray,
+        input_data: pd.DataFrame,
+        input_features: pd.DataFrame,
+    ) -> ValuationReportBatch:
+        """
+        Columnar ``build_valuation_report`` for N cars (no explanations).
+
+        Args:
+            predicted_prices: Already-clipped prediction per row.
+            input_data: N-row model input frame.
+            input_features: N-row engineered feature frame (same order).
+        """
+        predicted_prices = np.asarray(predicted_prices, dtype=float)
+        confidence_scores = self._calculate_confidences(input_features)
+        confidence_codes = self.rules.confidence_codes(confidence_scores)
+        confidence_labels = _labels(CONFIDENCE_LABELS, confidence_codes)
+        lower_bounds, upper_bounds = self._calculate_dynamic_ranges(
+            predicted_prices, confidence_scores, input_features
+        )
+        risk_codes = self._assess_risks_columns(
+            input_features, input_data, confidence_labels
+        )
+        position_codes = self._get_market_positions(input_features)
+        recommendations = self.rules.lookup_recommendations(
+            position_codes, confidence_codes, risk_codes["Ownership Risk"]
+        )
+        risks = {
+            name: _labels(RISK_LEVELS, codes) for name, codes in risk_codes.items()
+        }
+        market_positions = _labels(MARKET_POSITIONS, position_codes)
+        return ValuationReportBatch(
+            self,
+            input_data,
+            predicted_prices,
+            confidence_scores,
+            confidence_labels,
+            lower_bounds,
+            upper_bounds,
+            risks,
+            market_positions,
+            recommendations,
+        )
+
+    def generate_valuation_reports(
+        self, model_pipeline, input_data: pd.DataFrame, input_features: pd.DataFrame
+    ) -> ValuationReportBatch:
+        """
+        Predict and build columnar valuation reports for every row.
+
+        Equivalent to ``generate_valuation_report`` per row without an
+        explanation engine.
+        """
+        predictions, _ = self.predict(model_pipeline, input_data, input_features)
+        predictions = np.maximum(0.0, predictions.astype(float))
+        return self.build_valuation_reports(predictions, input_data, input_features)
 
     def _generate_ai_summary(
         self,
@@ -235,10 +506,10 @@ class ValuationIntelligenceEngine:
         3. Key negative valuation factors.
         4. Overall market conclusion.
         """
-        brand = input_data.get("brand", pd.Series(["Unknown"])).iloc[0]
-        model = input_data.get("model", pd.Series(["Unknown"])).iloc[0]
-        year = input_data.get("year", pd.Series([2023])).iloc[0]
-        mileage = input_data.get("mileage", pd.Series([50000])).iloc[0]
+        brand = _first(input_data, "brand", "Unknown")
+        model = _first(input_data, "model", "Unknown")
+        year = _first(input_data, "year", 2023)
+        mileage = _first(input_data, "mileage", 50000)
 
         price_str = format_price_inr(predicted_price)
 
@@ -273,11 +544,14 @@ class ValuationIntelligenceEngine:
 
         return summary
 
-    def generate_valuation_report(
+    def predict(
         self, model_pipeline, input_data: pd.DataFrame, input_features: pd.DataFrame
-    ) -> Dict[str, Any]:
+    ) -> Tuple[np.ndarray, pd.DataFrame]:
         """
-        Generate a complete structured valuation report.
+        Run the model on every row, selecting the columns it was trained on.
+
+        Returns:
+            Tuple of (raw predictions, DataFrame that was fed to the model).
         """
         # Determine the correct dataframe to pass based on expected features
         if hasattr(model_pipeline, "feature_names_in_"):
@@ -294,24 +568,177 @@ class ValuationIntelligenceEngine:
             predict_df = input_features
 
         try:
-            predicted_price = model_pipeline.predict(predict_df)[0]
+            predictions = model_pipeline.predict(predict_df)
         except ValueError as e:
             if "features as input" in str(e):
                 # Fallback to base input data
                 predict_df = input_data
-                predicted_price = model_pipeline.predict(predict_df)[0]
+                predictions = model_pipeline.predict(predict_df)
             else:
                 raise e
 
-        predicted_price = max(0.0, float(predicted_price))
+        return np.asarray(predictions), predict_df
+
+    def generate_valuation_report(
+        self,
+        model_pipeline,
+        input_data: pd.DataFrame,
+        input_features: pd.DataFrame,
+        explanation_level: str = "exact",
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate a complete structured valuation report.
+
+        ``explanation_level`` and ``deadline`` are passed to
+        ``ExplanationEngine.explain_prediction``.
+        """
+        # 1. Prediction
+        predictions, predict_df = self.predict(
+            model_pipeline, input_data, input_features
+        )
+        predicted_price = max(0.0, float(predictions[0]))
 
         # 2. Explainability
         explanation = {}
         if self.explanation_engine:
             explanation = self.explanation_engine.explain_prediction(
-                model_pipeline, predict_df
+                model_pipeline, predict_df, explanation_level, deadline
+            )
+
+        return self.build_valuation_report(
+            predicted_price, input_data, input_features, explanation
+        )
+
+    def generate_record_report(
+        self,
+        model_pipeline,
+        input_data: Mapping[str, Any],
+        input_features: Mapping[str, Any],
+        compiled_pipeline: Optional[CompiledPipeline] = None,
+        explanation_level: str = "exact",
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Single-record counterpart of ``generate_valuation_report`` on dicts.
+
+        With a compiled pipeline the model is fed a feature vector directly;
+        a one-row model input frame is only built for the explanation engine.
+        Without one (or if features are missing) the DataFrame path is used.
+        """
+        if compiled_pipeline is None or not compiled_pipeline.accepts(input_features):
+            return self.generate_valuation_report(
+                model_pipeline,
+                pd.DataFrame([input_data]),
+                pd.DataFrame([input_features]),
+                explanation_level,
+                deadline,
+            )
+
+        predicted_price = max(0.0, compiled_pipeline.predict_record(input_features))
+
+        explanation = {}
+        if self.explanation_engine:
+            explanation = self.explanation_engine.explain_prediction(
+                model_pipeline,
+                compiled_pipeline.input_frame(input_features),
+                explanation_level,
+                deadline,
             )
 
+        return self.build_valuation_report(
+            predicted_price, input_data, input_features, explanation
+        )
+
+    def generate_record_reports(
+        self,
+        model_pipeline,
+        input_records: Sequence[Mapping[str, Any]],
+        feature_records: Sequence[Mapping[str, Any]],
+        compiled_pipeline: Optional[CompiledPipeline] = None,
+        explanation_levels: Optional[Sequence[str]] = None,
+        deadlines: Optional[Sequence[Optional[float]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        ``generate_record_report`` for many records, with one model call and
+        one explanation provider call per level.
+
+        Args:
+            model_pipeline: Production pipeline.
+            input_records: Input record per car.
+            feature_records: Engineered feature record per car (same order).
+            compiled_pipeline: Compiled form of ``model_pipeline``; without
+                one (or if features are missing) each record is reported
+                on its own.
+            explanation_levels: Requested level per car (default "exact").
+            deadlines: Optional ``time.perf_counter()`` deadline per car.
+        """
+        n = len(input_records)
+        if explanation_levels is None:
+            explanation_levels = ["exact"] * n
+        if deadlines is None:
+            deadlines = [None] * n
+        if compiled_pipeline is None or not all(
+            compiled_pipeline.accepts(features) for features in feature_records
+        ):
+            return [
+                self.generate_record_report(
+                    model_pipeline, data, features, compiled_pipeline, level, deadline
+                )
+                for data, features, level, deadline in zip(
+                    input_records, feature_records, explanation_levels, deadlines
+                )
+            ]
+
+        predictions = np.maximum(
+            0.0, compiled_pipeline.predict_records(feature_records)
+        )
+
+        explanations = [{}] * n
+        if self.explanation_engine:
+            levels = [
+                self.explanation_engine.resolve_level(level, deadline)
+                for level, deadline in zip(explanation_levels, deadlines)
+            ]
+            explained = [i for i, level in enumerate(levels) if level != "none"]
+            explanations = [{"level": "none"}] * n
+            if explained:
+                frame = compiled_pipeline.input_frames(
+                    [feature_records[i] for i in explained]
+                )
+                for i, explanation in zip(
+                    explained,
+                    self.explanation_engine.explain_predictions(
+                        model_pipeline, frame, [levels[i] for i in explained]
+                    ),
+                ):
+                    explanations[i] = explanation
+
+        return [
+            self.build_valuation_report(
+                float(predictions[i]),
+                input_records[i],
+                feature_records[i],
+                explanations[i],
+            )
+            for i in range(n)
+        ]
+
+    def build_valuation_report(
+        self,
+        predicted_price: float,
+        input_data: Union[pd.DataFrame, Mapping[str, Any]],
+        input_features: Union[pd.DataFrame, Mapping[str, Any]],
+        explanation: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the valuation report for an already-predicted price.
+
+        ``input_data`` and ``input_features`` may be one-row DataFrames or plain
+        record dicts, which lets batch callers skip per-row DataFrame slicing.
+        """
+        explanation = explanation or {}
+
         # 3. Confidence & Ranges
         confidence_score = self._calculate_confidence(input_features, predicted_price)
         confidence_label = self._get_confidence_label(confidence_score)
@@ -361,5 +788,6 @@ class ValuationIntelligenceEngine:
             "explanation": {
                 "major_positive_factors": pos_factors,
                 "major_negative_factors": neg_factors,
+                "level": explanation.get("level", "none"),
             },
         }
@@ -0,0 +1,301 @@
+"""
+Valuation Rules
+===============
+
+Compiled, validated form of ``valuation_config.json``.
+
+``ValuationRules.compile(config)`` checks the config schema once (at
+startup) and turns it into an immutable rule table:
+
+    - threshold tuples for confidence, market position and each risk type
+    - a precomputed (market_position, confidence, ownership_risk) ->
+      recommendation lookup covering every combination, built by walking
+      ``recommendation_matrix`` in order exactly as the per-call search did
+
+so evaluating a rule is a couple of comparisons or one dict lookup. The
+columnar valuation path uses the same table as an integer-coded array.
+"""
+
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Union
+
+import numpy as np
+
+MARKET_POSITIONS = ("Undervalued", "Fairly Priced", "Slightly Overpriced", "Overpriced")
+CONFIDENCE_LABELS = ("High", "Medium", "Low")
+RISK_LEVELS = ("Low", "Medium", "High")
+RISK_TYPES = ("ownership_risk", "market_risk", "maintenance_risk")
+FALLBACK_RECOMMENDATION = "Fair Purchase"
+
+
+class ValuationConfigError(ValueError):
+    """Raised when a valuation config does not match the expected schema."""
+
+
+def _section(config: Mapping[str, Any], key: str, where: str = "") -> Mapping:
+    value = config.get(key) if isinstance(config, Mapping) else None
+    if not isinstance(value, Mapping):
+        raise ValuationConfigError(f"'{where}{key}' must be an object")
+    return value
+
+
+def _number(section: Mapping[str, Any], key: str, where: str) -> float:
+    value = section.get(key)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValuationConfigError(f"'{where}.{key}' must be a number, got {value!r}")
+    return float(value)
+
+
+def _labels(rules: Mapping[str, Any], key: str, allowed: Tuple[str, ...], where: str):
+    values = rules.get(key)
+    if not isinstance(values, list) or not values:
+        raise ValuationConfigError(f"'{where}.{key}' must be a non-empty list")
+    unknown = [v for v in values if v not in allowed]
+    if unknown:
+        raise ValuationConfigError(
+            f"'{where}.{key}' has unknown values {unknown}; expected {list(allowed)}"
+        )
+    return frozenset(values)
+
+
+def _bounds(section: Mapping[str, Any], where: str) -> Tuple[float, float]:
+    """(high_min, medium_min) of a High/Medium/Low threshold section."""
+    high = _number(section, "high_min", where)
+    medium = _number(section, "medium_min", where)
+    if medium > high:
+        raise ValuationConfigError(f"'{where}': medium_min must not exceed high_min")
+    return high, medium
+
+
+def feature_translations(config: Mapping[str, Any]) -> Mapping[str, str]:
+    """
+    Validated ``feature_translation_dictionary`` (feature -> display name).
+
+    Raises:
+        ValuationConfigError: If it is not an object.
+    """
+    translations = config.get("feature_translation_dictionary", {})
+    if not isinstance(translations, Mapping):
+        raise ValuationConfigError("'feature_translation_dictionary' must be an object")
+    return translations
+
+
+class ValuationRules:
+    """
+    Immutable rule table compiled from a valuation config dict.
+
+    Use ``ValuationRules.compile(config)`` (or ``load_valuation_rules``)
+    rather than the constructor.
+    """
+
+    __slots__ = (
+        "confidence_bounds",
+        "market_position_bounds",
+        "risk_bounds",
+        "recommendations",
+        "recommendation_table",
+        "translations",
+    )
+
+    def __init__(
+        self,
+        confidence_bounds: Tuple[float, float],
+        market_position_bounds: Tuple[float, float, float],
+        risk_bounds: Mapping[str, Tuple[float, float]],
+        recommendations: Mapping[Tuple[str, str, str], str],
+        translations: Mapping[str, str],
+    ):
+        set_ = object.__setattr__
+        set_(self, "confidence_bounds", confidence_bounds)
+        set_(self, "market_position_bounds", market_position_bounds)
+        set_(self, "risk_bounds", MappingProxyType(dict(risk_bounds)))
+        set_(self, "recommendations", MappingProxyType(dict(recommendations)))
+        set_(self, "translations", MappingProxyType(dict(translations)))
+
+        # recommendation_table[position, confidence, ownership_risk] with the
+        # indices of MARKET_POSITIONS, CONFIDENCE_LABELS and RISK_LEVELS
+        table = np.empty(
+            (len(MARKET_POSITIONS), len(CONFIDENCE_LABELS), len(RISK_LEVELS)),
+            dtype=object,
+        )
+        for (position, confidence, risk), rec in recommendations.items():
+            table[
+                MARKET_POSITIONS.index(position),
+                CONFIDENCE_LABELS.index(confidence),
+                RISK_LEVELS.index(risk),
+            ] = rec
+        table.flags.writeable = False
+        set_(self, "recommendation_table", table)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ValuationRules is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ValuationRules is immutable")
+
+    @classmethod
+    def compile(cls, config: Mapping[str, Any]) -> "ValuationRules":
+        """
+        Validate a parsed valuation config and compile it.
+
+        Raises:
+            ValuationConfigError: If a section is missing or malformed.
+        """
+        if not isinstance(config, Mapping):
+            raise ValuationConfigError("Valuation config must be a JSON object")
+
+        confidence_bounds = _bounds(
+            _section(config, "confidence_thresholds"), "confidence_thresholds"
+        )
+
+        where = "market_position_thresholds"
+        positions = _section(config, where)
+        market_position_bounds = tuple(
+            _number(positions, key, where)
+            for key in [
+                "undervalued_max",
+                "fairly_priced_max",
+                "slightly_overpriced_max",
+            ]
+        )
+        if list(market_position_bounds) != sorted(market_position_bounds):
+            raise ValuationConfigError(f"'{where}' thresholds must be increasing")
+
+        risk_section = _section(config, "risk_thresholds")
+        risk_bounds = {
+            risk_type: _bounds(
+                _section(risk_section, risk_type, "risk_thresholds."),
+                f"risk_thresholds.{risk_type}",
+            )
+            for risk_type in RISK_TYPES
+        }
+
+        matrix = []
+        for rec, rules in _section(config, "recommendation_matrix").items():
+            where = f"recommendation_matrix.{rec}"
+            if not isinstance(rules, Mapping):
+                raise ValuationConfigError(f"'{where}' must be an object")
+            max_risk = rules.get("max_ownership_risk")
+            if max_risk not in RISK_LEVELS:
+                raise ValuationConfigError(
+                    f"'{where}.max_ownership_risk' must be one of {list(RISK_LEVELS)}"
+                )
+            matrix.append(
+                (
+                    rec,
+                    _labels(rules, "market_position", MARKET_POSITIONS, where),
+                    _labels(rules, "confidence", CONFIDENCE_LABELS, where),
+                    RISK_LEVELS.index(max_risk),
+                )
+            )
+
+        # First matching rule wins, as in the original sequential search
+        recommendations = {}
+        for position in MARKET_POSITIONS:
+            for confidence in CONFIDENCE_LABELS:
+                for risk_rank, risk in enumerate(RISK_LEVELS):
+                    recommendations[(position, confidence, risk)] = next(
+                        (
+                            rec
+                            for rec, rule_positions, rule_confidences, max_rank in matrix
+                            if position in rule_positions
+                            and confidence in rule_confidences
+                            and risk_rank <= max_rank
+                        ),
+                        FALLBACK_RECOMMENDATION,
+                    )
+
+        return cls(
+            confidence_bounds,
+            market_position_bounds,
+            risk_bounds,
+            recommendations,
+            feature_translations(config),
+        )
+
+    def confidence_label(self, score: float) -> str:
+        high, medium = self.confidence_bounds
+        if score >= high:
+            return "High"
+        elif score >= medium:
+            return "Medium"
+        return "Low"
+
+    def risk_level(self, score: float, risk_type: str) -> str:
+        high, medium = self.risk_bounds[risk_type]
+        if score >= high:
+            return "High"
+        elif score >= medium:
+            return "Medium"
+        return "Low"
+
+    def market_position(self, offset: float) -> str:
+        undervalued, fairly_priced, slightly_overpriced = self.market_position_bounds
+        if offset < undervalued:
+            return "Undervalued"
+        elif offset <= fairly_priced:
+            return "Fairly Priced"
+        elif offset <= slightly_overpriced:
+            return "Slightly Overpriced"
+        return "Overpriced"
+
+    def recommendation(
+        self, market_position: str, confidence_label: str, ownership_risk: str
+    ) -> str:
+        return self.recommendations.get(
+            (market_position, confidence_label, ownership_risk),
+            FALLBACK_RECOMMENDATION,
+        )
+
+    # Columnar counterparts, returning indices into the label tuples
+    def confidence_codes(self, scores: np.ndarray) -> np.ndarray:
+        high, medium = self.confidence_bounds
+        return np.select([scores >= high, scores >= medium], [0, 1], 2)
+
+    def risk_codes(self, scores: np.ndarray, risk_type: str) -> np.ndarray:
+        high, medium = self.risk_bounds[risk_type]
+        return np.select([scores >= high, scores >= medium], [2, 1], 0)
+
+    def market_position_codes(self, offsets: np.ndarray) -> np.ndarray:
+        undervalued, fairly_priced, slightly_overpriced = self.market_position_bounds
+        return np.select(
+            [
+                offsets < undervalued,
+                offsets <= fairly_priced,
+                offsets <= slightly_overpriced,
+            ],
+            [0, 1, 2],
+            3,
+        )
+
+    def lookup_recommendations(
+        self,
+        position_codes: np.ndarray,
+        confidence_codes: np.ndarray,
+        ownership_risk_codes: np.ndarray,
+    ) -> np.ndarray:
+        return self.recommendation_table[
+            position_codes, confidence_codes, ownership_risk_codes
+        ]
+
+
+def load_valuation_rules(
+    config_path: Union[str, Path],
+) -> Tuple[Dict[str, Any], ValuationRules]:
+    """
+    Read and compile a valuation config file.
+
+    Returns:
+        Tuple of (parsed config dict, compiled rules).
+
+    Raises:
+        ValuationConfigError: If the file is not valid JSON or fails validation.
+    """
+    with open(config_path, "r") as f:
+        try:
+            config = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValuationConfigError(f"{config_path}: {e}") from e
+    return config, ValuationRules.compile(config)
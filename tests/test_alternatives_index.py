@@ -0,0 +1,148 @@
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.alternatives_index import (
+    AlternativesIndex,
+    load_alternatives_index,
+    save_alternatives_index,
+)
+from src.decision_intelligence.alternatives_engine import AlternativesEngine
+
+
+@pytest.fixture
+def listings():
+    rows = []
+    for brand, model, engine, price in [
+        ("Maruti", "Swift", 1.2, 500000),
+        ("Maruti", "Baleno", 1.2, 560000),
+        ("Hyundai", "i20", 1.2, 600000),
+        ("Tata", "Tiago", 1.0, 380000),
+        ("Toyota", "Fortuner", 2.8, 3000000),
+    ]:
+        for year in (2016, 2018, 2020):
+            for listing in range(3):
+                rows.append(
+                    {
+                        "brand": brand,
+                        "base_model": model,
+                        "year": year,
+                        "variant": "Base",
+                        "fuelType": "Petrol",
+                        "transmission": "Manual",
+                        "price_inr": price * (1 + (year - 2018) * 0.1) + listing,
+                        "engineSize": engine,
+                        "max_power_bhp": engine * 70,
+                        "mpg": 20.0,
+                        "seats": 5.0,
+                        "km_driven": 40000.0,
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def index(listings):
+    return AlternativesIndex.build(listings, "test")
+
+
+def test_query_applies_budget_segment_and_exclusion(index):
+    results = index.query(
+        {"price": 500000, "year": 2018, "engineSize": 1.2},
+        k=3,
+        budget=550000,
+        segment="B-Segment/Compact",
+        exclude=("Maruti", "Swift VXI"),
+    )
+
+    assert results
+    assert all(r["price_raw"] <= 550000 for r in results)
+    assert all(r["segment"] == "B-Segment/Compact" for r in results)
+    assert ("Maruti", "Swift") not in {(r["brand"], r["model"]) for r in results}
+    # One configuration per model, nearest first
+    assert len({(r["brand"], r["model"]) for r in results}) == len(results)
+    assert [r["distance"] for r in results] == sorted(r["distance"] for r in results)
+
+
+def test_query_without_segment_searches_every_block(index):
+    results = index.query({"price": 3000000, "year": 2018, "engineSize": 2.8}, k=2)
+    assert results[0]["model"] == "Fortuner"
+    assert len(results) == 2
+
+
+def test_index_round_trip(index, tmp_path):
+    path = tmp_path / "alternatives_index.pkl"
+    save_alternatives_index(index, path)
+    loaded = load_alternatives_index(path)
+
+    query = {"price": 450000, "year": 2017, "engineSize": 1.1, "mpg": 21.0}
+    assert loaded.version == index.version
+    assert loaded.query(query) == index.query(query)
+
+
+def test_load_alternatives_index_ignores_missing_and_old_files(index, tmp_path):
+    assert load_alternatives_index(tmp_path / "missing.pkl") is None
+
+    path = tmp_path / "old.pkl"
+    index.format_version = 0
+    joblib.dump(index, path)
+    assert load_alternatives_index(path) is None
+
+
+def test_alternatives_engine_uses_index(index):
+    report = {"estimated_market_value_raw": 520000.0}
+    summary = {"brand": "Maruti", "model": "Swift", "year": 2018, "engineSize": 1.2}
+
+    assert AlternativesEngine(None).generate_alternatives(report, summary) == []
+
+    engine = AlternativesEngine(None, index)
+    alternatives = engine.process(report, summary)["alternatives"]
+    assert alternatives
+    assert all(a["price_raw"] <= 520000 * 1.1 for a in alternatives)
+    assert all(a["model"] != "Swift" for a in alternatives)
+    assert engine.process(report, summary, [{"model": "given"}]) == {
+        "alternatives": [{"model": "given"}]
+    }
+    assert np.isfinite([a["distance"] for a in alternatives]).all()
+
+
+def test_batch_alternatives_match_per_car_queries(index, monkeypatch):
+    from src.decision_intelligence import decision_engine
+    from src.decision_intelligence.decision_engine import DecisionReportBatch
+
+    rng = np.random.default_rng(0)
+    n = 40
+    summary = pd.DataFrame(
+        {
+            "brand": rng.choice(["Maruti", "Hyundai", "Toyota", "Kia"], n),
+            "model": rng.choice(["Swift VXI", "i20", "Fortuner", "Seltos"], n),
+            "year": rng.integers(2015, 2022, n),
+            "mpg": rng.choice([np.nan, 18.0, 22.0], n),
+            "engineSize": rng.choice([np.nan, 1.0, 1.2, 2.8, 5.0], n),
+        },
+        index=rng.permutation(n) + 100,
+    )
+    values = rng.uniform(3e5, 3.5e6, n)
+    values[[3, 17]] = 0.0
+    engine = AlternativesEngine(None, index)
+
+    expected = [
+        engine.generate_alternatives(
+            {"estimated_market_value_raw": float(values[i])},
+            summary.iloc[i].to_dict(),
+        )
+        for i in range(n)
+    ]
+    assert engine.generate_alternatives_batch(values, summary) == expected
+    assert expected[3] == [] and any(expected)
+    assert AlternativesEngine(None).generate_alternatives_batch(values, summary) == [
+        [] for _ in range(n)
+    ]
+
+    # Reports look alternatives up a block of cars at a time
+    monkeypatch.setattr(decision_engine, "ALTERNATIVES_BLOCK_SIZE", 16)
+    decisions = decision_engine.DecisionIntelligenceEngine(alternatives_index=index)
+    batch = DecisionReportBatch(decisions, values, {}, summary, *[None] * 7)
+    assert [batch._alternatives(i) for i in range(n)] == expected
+    assert sorted(batch._alternative_blocks) == [0, 1, 2]
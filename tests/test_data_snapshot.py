@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+import src.data_snapshot as data_snapshot
+from src.data_snapshot import compute_snapshot_key, load_dataset_snapshot
+
+
+@pytest.fixture
+def mock_df():
+    """Small engineered-like frame covering the knowledge base columns."""
+    return pd.DataFrame(
+        {
+            "brand": ["Maruti", "Maruti", "Audi"],
+            "base_model": ["Swift", "Swift", "A4"],
+            "variant": ["Dzire VDI", "VXI", "2.0 TDI"],
+            "year": [2018, 2019, 2017],
+            "fuelType": ["Diesel", "Petrol", "Diesel"],
+            "transmission": ["Manual", "Manual", "Automatic"],
+            "engineSize": [1.2, 1.2, 2.0],
+            "max_power_bhp": [74.0, 82.0, 174.3],
+            "mpg": [23.4, 21.2, 17.1],
+            "seats": [5.0, 5.0, 5.0],
+            "age_group": pd.Categorical(["5-7", "5-7", "8-10"], ordered=True),
+        }
+    )
+
+
+@pytest.fixture
+def builds(mock_df, monkeypatch):
+    """Count dataset rebuilds instead of running the real ETL chain."""
+    calls = []
+
+    def build():
+        calls.append(1)
+        return mock_df.copy()
+
+    monkeypatch.setattr(data_snapshot, "build_dataset", build)
+    return calls
+
+
+def test_snapshot_key_is_stable():
+    assert compute_snapshot_key() == compute_snapshot_key()
+
+
+def test_snapshot_round_trip(tmp_path, builds, mock_df):
+    df, engine = load_dataset_snapshot(tmp_path)
+    assert len(builds) == 1
+    assert [p.name for p in tmp_path.iterdir()] == [compute_snapshot_key()]
+
+    cached_df, cached_engine = load_dataset_snapshot(tmp_path)
+    assert len(builds) == 1
+    pd.testing.assert_frame_equal(cached_df, mock_df)
+    pd.testing.assert_frame_equal(cached_engine.kb, engine.kb)
+    assert cached_engine.get_years("Maruti", "Swift") == [2019, 2018]
+    assert cached_engine.get_specs(
+        "Audi", "A4", 2017, "2.0 TDI", "Diesel", "Automatic"
+    ) == engine.get_specs("Audi", "A4", 2017, "2.0 TDI", "Diesel", "Automatic")
+
+
+def test_snapshot_rebuilds_when_key_changes(tmp_path, builds, monkeypatch):
+    load_dataset_snapshot(tmp_path)
+    monkeypatch.setattr(data_snapshot, "compute_snapshot_key", lambda: "changed")
+    load_dataset_snapshot(tmp_path)
+
+    assert len(builds) == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["changed"]
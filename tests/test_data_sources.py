@@ -0,0 +1,95 @@
+import pandas as pd
+import pytest
+
+from src.data_processing import UNIFIED_COLUMNS, load_uk_archive
+from src.data_sources import DataSource, get_sources, load_sources, register_source
+
+LOADED = []
+
+
+def load_listings(filepath, schema, brand="Test"):
+    """Minimal loader that records which files it parsed."""
+    LOADED.append(filepath.name)
+    df = pd.read_csv(filepath).rename(columns=schema)
+    df["brand"] = brand
+    return df
+
+
+@pytest.fixture
+def feeds(tmp_path):
+    LOADED.clear()
+    for name, price in [("a", 100), ("b", 200)]:
+        pd.DataFrame({"Price": [price, price + 1]}).to_csv(
+            tmp_path / f"{name}.csv", index=False
+        )
+    return [
+        DataSource(name, f"{name}.csv", load_listings, {"Price": "selling_price"})
+        for name in ["a", "b"]
+    ]
+
+
+def test_default_sources():
+    names = [s.name for s in get_sources()]
+    assert names == ["cardekho_v3", "kasliwal_train"]
+    assert get_sources(["uk_archive_vw"])[0].options == {
+        "brand": "Volkswagen",
+        "source": "uk_archive_vw",
+    }
+
+    with pytest.raises(ValueError):
+        get_sources(["missing"])
+    with pytest.raises(ValueError):
+        register_source(get_sources()[0])
+
+
+def test_changed_source_is_the_only_one_reparsed(tmp_path, feeds):
+    cache_dir = tmp_path / "cache"
+    first = load_sources(feeds, tmp_path, cache_dir, max_workers=1)
+    assert sorted(LOADED) == ["a.csv", "b.csv"]
+
+    LOADED.clear()
+    cached = load_sources(feeds, tmp_path, cache_dir, max_workers=1)
+    assert LOADED == []
+    for df, expected in zip(cached, first):
+        pd.testing.assert_frame_equal(df, expected)
+
+    pd.DataFrame({"Price": [300]}).to_csv(tmp_path / "b.csv", index=False)
+    reloaded = load_sources(feeds, tmp_path, cache_dir, max_workers=1)
+    assert LOADED == ["b.csv"]
+    assert reloaded[1]["selling_price"].tolist() == [300]
+    assert len(list(cache_dir.glob("b-*.parquet"))) == 1
+
+
+def test_process_pool_matches_in_process(tmp_path, feeds):
+    serial = load_sources(feeds, tmp_path, cache_dir=None, max_workers=1)
+    pooled = load_sources(feeds, tmp_path, cache_dir=None, max_workers=2)
+    for df, expected in zip(pooled, serial):
+        pd.testing.assert_frame_equal(df, expected)
+
+
+def test_uk_archive_units(tmp_path):
+    path = tmp_path / "bmw.csv"
+    path.write_text(
+        "model,year,price,transmission,mileage,fuelType,tax,mpg,engineSize\n"
+        " 3 Series,2017,10000,Semi-Auto,1000,Diesel,150,50.0,2.0\n"
+        " i3,2018,20000,Automatic,0,Electric,0,0.0,0.0\n"
+    )
+    df = load_uk_archive(path, "BMW")
+
+    assert list(df.columns) == UNIFIED_COLUMNS
+    assert df["model"].tolist() == ["3 Series", "i3"]
+    assert df["base_model"].tolist() == ["3", "i3"]
+    assert df["selling_price"].tolist() == [1_050_000, 2_100_000]
+    assert df["km_driven"].tolist() == [1609, 0]
+    assert df["mileage_kmpl"].iloc[0] == pytest.approx(17.7, abs=0.01)
+    assert df["engine_cc"].iloc[0] == 2000
+    assert df[["mileage_kmpl", "engine_cc"]].iloc[1].isna().all()
+    assert df["transmission"].tolist() == ["Automatic", "Automatic"]
+    assert (df["source"] == "uk_archive_bmw").all()
+
+    # Loaded through the registry, listings carry the registered source name
+    (tmp_path / "archive").mkdir()
+    (tmp_path / "archive" / "vw.csv").write_text(path.read_text())
+    vw = get_sources(["uk_archive_vw"])[0].load(tmp_path)
+    assert (vw["source"] == "uk_archive_vw").all()
+    assert (vw["brand"] == "Volkswagen").all()
@@ -1,3 +1,5 @@
+import pytest
+
 from src.decision_intelligence.recommendation_engine import RecommendationEngine
 from src.decision_intelligence.negotiation_engine import NegotiationEngine
 from src.decision_intelligence.forecast_engine import ForecastEngine
@@ -89,3 +91,69 @@ def test_decision_engine_orchestration():
     assert "total_5y" in report
     assert "insights" in report
     assert report["negotiation_assistant"]["is_available"] is False
+
+
+@pytest.mark.parametrize("with_curves", [False, True])
+def test_columnar_decision_reports_match_per_car(with_curves):
+    import json
+
+    import numpy as np
+    import pandas as pd
+
+    from src.market_statistics import MarketStatistics
+    from src.utils import VALUATION_CONFIG_PATH
+    from src.valuation_intelligence import ValuationIntelligenceEngine
+
+    with open(VALUATION_CONFIG_PATH) as f:
+        valuation_engine = ValuationIntelligenceEngine(config=json.load(f))
+    rng = np.random.default_rng(1)
+    n = 300
+    summary = pd.DataFrame(
+        {
+            "brand": rng.choice(["Maruti Suzuki", "BMW", "Hyundai"], n),
+            "model": rng.choice(["Swift", "X1", "Creta"], n),
+            "year": rng.integers(2000, 2025, n),
+            "car_age": rng.integers(0, 25, n),
+            "mileage": rng.integers(0, 250_000, n),
+            "mpg": rng.choice([0.0, 8.0, 12.0, 20.0, 25.5], n),
+            "engineSize": rng.choice([1.0, 1.2, 1.5, 2.0], n),
+        }
+    )
+    features = pd.DataFrame(
+        {
+            "car_age": summary["car_age"],
+            "configuration_scarcity_score": rng.uniform(0, 1, n),
+            "market_liquidity_score": rng.uniform(0, 1, n),
+            "market_stability_score": rng.uniform(0, 1, n),
+            "brand_popularity": rng.uniform(0, 1, n),
+            "brand_resale_retention_score": rng.uniform(0.8, 1.2, n),
+        }
+    )
+    prices = rng.uniform(1e5, 5e6, n)
+    # Asking prices around every deal-score threshold, plus unknown ones
+    asking = prices * rng.choice([0.9, 0.95, 1.0, 1.05, 1.1, 1.15, 1.3], n)
+    asking[rng.random(n) < 0.3] = np.nan
+
+    valuations = valuation_engine.build_valuation_reports(prices, summary, features)
+    market_stats = None
+    if with_curves:
+        # Training listings without Hyundai, so it falls back to segment curves
+        listings = summary[summary["brand"] != "Hyundai"].assign(
+            selling_price=prices[summary["brand"] != "Hyundai"],
+            fuel_type="Petrol",
+            transmission="Manual",
+        )
+        market_stats = MarketStatistics(listings)
+        assert market_stats.has_depreciation_curves
+    engine = DecisionIntelligenceEngine(market_stats=market_stats)
+    batch = engine.generate_decision_reports(valuations, summary, asking)
+
+    summaries = summary.to_dict("records")
+    for i in range(n):
+        expected = engine.generate_decision_report(
+            valuations.report(i),
+            summaries[i],
+            asking_price=None if np.isnan(asking[i]) else float(asking[i]),
+            current_recommendations=[],
+        )
+        assert batch.report(i) == expected
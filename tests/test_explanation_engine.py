@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import pandas as pd
 from src.explanation_engine import ExplanationEngine, BaseExplanationProvider
@@ -15,6 +16,17 @@ class MockExplanationProvider(BaseExplanationProvider):
         return base_value, contributions
 
 
+class MockApproximateProvider(MockExplanationProvider):
+    supports_approximate = True
+
+    def __init__(self):
+        self.calls = []
+
+    def explain(self, model, X: pd.DataFrame, approximate: bool = False):
+        self.calls.append(approximate)
+        return super().explain(model, X)
+
+
 @pytest.fixture
 def explanation_engine():
     config = {
@@ -53,3 +65,289 @@ def test_explain_prediction(explanation_engine):
     assert (
         "increases the market value" in result["top_positive_factors"][0]["explanation"]
     )
+
+
+def test_translations_come_from_compiled_rules():
+    import json
+
+    from src.utils import VALUATION_CONFIG_PATH
+    from src.valuation_rules import ValuationConfigError, ValuationRules
+
+    with open(VALUATION_CONFIG_PATH) as f:
+        config = json.load(f)
+    config["feature_translation_dictionary"] = {"car_age": "Age In Years"}
+    rules = ValuationRules.compile(config)
+    X = pd.DataFrame([{"car_age": 5}])
+
+    # The compiled rules win over the config the engine is given
+    engine = ExplanationEngine(MockExplanationProvider(), {}, rules)
+    result = engine.explain_prediction(None, X)
+    assert result["top_negative_factors"][0]["feature"] == "Age In Years"
+
+    with pytest.raises(ValuationConfigError):
+        ExplanationEngine(
+            MockExplanationProvider(), {"feature_translation_dictionary": []}
+        )
+
+
+@pytest.fixture
+def tree_model():
+    from sklearn.tree import DecisionTreeRegressor
+
+    X = pd.DataFrame({"car_age": [1, 3, 5, 7, 9, 11], "mileage": [1, 2, 3, 4, 5, 6]})
+    model = DecisionTreeRegressor(max_depth=2, random_state=0)
+    model.fit(X, [900, 800, 600, 500, 300, 200])
+    return model, X
+
+
+def test_shap_explainer_shared_per_model_version(tree_model, monkeypatch):
+    import shap
+
+    from src import explanation_engine
+
+    model, X = tree_model
+    explanation_engine.clear_explainer_cache()
+    built = []
+    original = shap.TreeExplainer
+
+    def counting_tree_explainer(m):
+        built.append(m)
+        return original(m)
+
+    monkeypatch.setattr(shap, "TreeExplainer", counting_tree_explainer)
+
+    first = explanation_engine.ShapExplanationProvider(model, "v1")
+    second = explanation_engine.ShapExplanationProvider(model, "v1")
+    base_value, contributions = first.explain(model, X.iloc[[0]])
+    second.explain(model, X.iloc[[1]])
+
+    assert len(built) == 1
+    assert first._get_explainer(model) is second._get_explainer(model)
+    assert base_value + sum(contributions.values()) == pytest.approx(
+        model.predict(X.iloc[[0]])[0]
+    )
+
+
+def test_unsupported_model_skips_kernel_explainer(monkeypatch):
+    import shap
+    from sklearn.linear_model import LinearRegression
+
+    from src.explanation_engine import ShapExplanationProvider
+
+    def fail(*args, **kwargs):
+        raise AssertionError("KernelExplainer must not be built per request")
+
+    monkeypatch.setattr(shap, "KernelExplainer", fail)
+    X = pd.DataFrame({"car_age": [1.0, 2.0, 3.0]})
+    model = LinearRegression().fit(X, [3.0, 2.0, 1.0])
+
+    provider = ShapExplanationProvider(model, "linear")
+    assert provider.explain(model, X.iloc[[0]]) == (0.0, {"car_age": 0.0})
+
+
+def make_listing_pipeline(regressor):
+    from sklearn.compose import ColumnTransformer
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+    X = pd.DataFrame(
+        {
+            "brand": ["Maruti", "BMW", "Audi", "Maruti", "BMW", "Tata"] * 5,
+            "year": [2018, 2015, 2020, 2012, 2019, 2016] * 5,
+        }
+    )
+    y = X["year"] * 1000 + X["brand"].map({"BMW": 50000, "Audi": 40000}).fillna(0)
+    preprocessor = ColumnTransformer(
+        [
+            ("cat", OneHotEncoder(handle_unknown="ignore"), ["brand"]),
+            ("num", StandardScaler(), ["year"]),
+        ]
+    )
+    pipeline = Pipeline([("preprocessor", preprocessor), ("regressor", regressor)])
+    return pipeline.fit(X, y), X
+
+
+def test_pipeline_contributions_aggregate_one_hot_columns():
+    import xgboost
+
+    from src.explanation_engine import TreeContributionExplainer
+
+    pipeline, X = make_listing_pipeline(
+        xgboost.XGBRegressor(n_estimators=20, max_depth=3)
+    )
+    explainer = TreeContributionExplainer(pipeline)
+    rows = pd.concat([X.iloc[:3], pd.DataFrame({"brand": ["Tesla"], "year": [2021]})])
+    base_values, values = explainer.contributions(rows)
+
+    assert explainer.feature_names == ["brand", "year"]
+    assert values.shape == (4, 2)
+    np.testing.assert_allclose(
+        base_values + values.sum(axis=1), pipeline.predict(rows), rtol=1e-5
+    )
+
+    # One-hot block summed back onto "brand"
+    transformed = pipeline[:-1].transform(rows)
+    raw = (
+        pipeline[-1]
+        .get_booster()
+        .predict(xgboost.DMatrix(transformed), pred_contribs=True)
+    )
+    np.testing.assert_allclose(values[:, 0], raw[:, :4].sum(axis=1), rtol=1e-5)
+
+    # Saabas attributions are also additive
+    approx_base, approx_values = explainer.contributions(rows, approximate=True)
+    np.testing.assert_allclose(
+        approx_base + approx_values.sum(axis=1), pipeline.predict(rows), rtol=1e-5
+    )
+
+    # Single rows take the compiled-pipeline transform
+    _, single = explainer.contributions(rows.iloc[[3]])
+    np.testing.assert_allclose(single[0], values[3], rtol=1e-5)
+
+
+def test_explain_batch_columnar_top_k(explanation_engine):
+    X = pd.DataFrame([{"car_age": 5}, {"car_age": 6}])
+    result = explanation_engine.explain_batch(None, X, top_k=3)
+
+    assert result["base_value"].tolist() == [500000.0, 500000.0]
+    assert result["contributions"].shape == (2, 4)
+    assert result["top_positive_features"].tolist()[0] == [
+        "Engine Performance",
+        "Brand Popularity",
+        None,
+    ]
+    assert result["top_negative_features"][1, 0] == "Vehicle Age"
+    np.testing.assert_array_equal(
+        result["top_negative_contributions"][0], [-50000.0, -10000.0, np.nan]
+    )
+
+
+def test_explanation_levels_degrade_to_meet_deadline():
+    import time
+
+    provider = MockApproximateProvider()
+    engine = ExplanationEngine(provider, {})
+    engine._latency_ms.update({"approx": 2.0, "exact": 20.0})
+    now = time.perf_counter()
+
+    assert engine.resolve_level("exact") == "exact"
+    assert engine.resolve_level("exact", now + 1.0) == "exact"
+    assert engine.resolve_level("exact", now + 0.010) == "approx"
+    assert engine.resolve_level("approx", now + 1.0) == "approx"
+    assert engine.resolve_level("exact", now - 1.0) == "none"
+    with pytest.raises(ValueError):
+        engine.resolve_level("fast")
+
+    X = pd.DataFrame([{"car_age": 5}])
+    assert engine.explain_prediction(None, X, level="none") == {"level": "none"}
+    assert engine.explain_prediction(None, X, level="approx")["level"] == "approx"
+    assert provider.calls == [True]
+    # Observed latency (well under 20 ms) pulls the estimate down
+    engine.explain_prediction(None, X, level="exact")
+    assert engine.expected_latency_ms("exact") < 20.0
+
+
+def test_approx_without_approximate_mode_runs_as_exact(explanation_engine):
+    import time
+
+    engine = explanation_engine
+    engine._latency_ms.update({"approx": 2.0, "exact": 20.0})
+    X = pd.DataFrame([{"car_age": 5}])
+
+    assert engine.resolve_level("approx") == "exact"
+    # Only the exact estimate decides whether "approx" fits
+    assert engine.resolve_level("approx", time.perf_counter() + 0.010) == "none"
+    assert engine.explain_prediction(None, X, level="approx")["level"] == "exact"
+    assert engine.expected_latency_ms("approx") == 2.0
+    assert engine.expected_latency_ms("exact") < 20.0
+    explained = engine.explain_predictions(None, pd.concat([X, X]), ["approx", "exact"])
+    assert [e["level"] for e in explained] == ["exact", "exact"]
+
+
+def test_skipped_level_estimate_recovers(explanation_engine):
+    import time
+
+    from src.explanation_engine import DEFAULT_LEVEL_LATENCY_MS
+
+    engine = explanation_engine
+    # One slow sample (e.g. the explainer being built) inflates the estimate
+    engine._record_latency("exact", 5000.0)
+    assert engine.expected_latency_ms("exact") > 1000.0
+
+    levels = [
+        engine.resolve_level("exact", time.perf_counter() + 0.050) for _ in range(200)
+    ]
+    assert levels[0] == "none"
+    assert levels[-1] == "exact"
+    assert engine.expected_latency_ms("exact") >= DEFAULT_LEVEL_LATENCY_MS["exact"]
+
+
+def test_explainer_artifact_round_trip(tmp_path):
+    import joblib
+    import xgboost
+
+    from src.explanation_engine import (
+        TreeContributionExplainer,
+        build_explainer_artifact,
+        load_explainer_artifact,
+    )
+
+    pipeline, X = make_listing_pipeline(
+        xgboost.XGBRegressor(n_estimators=20, max_depth=3)
+    )
+    artifact = build_explainer_artifact(pipeline, X, n_background=4)
+    derived = TreeContributionExplainer(pipeline)
+
+    assert list(artifact["background"].columns) == ["brand", "year"]
+    assert len(artifact["background"]) == 4
+    assert artifact["background_weights"].sum() == pytest.approx(1.0)
+    assert artifact["expected_value_source"] == "tree"
+    assert artifact["expected_value"] == pytest.approx(derived.expected_value)
+    assert artifact["feature_owners"].tolist() == [0, 0, 0, 0, 1]
+    # Deterministic for a fixed seed
+    again = build_explainer_artifact(pipeline, X, n_background=4)
+    pd.testing.assert_frame_equal(artifact["background"], again["background"])
+
+    path = tmp_path / "explainer.pkl"
+    artifact["pipeline_hash"] = "abc"
+    joblib.dump(artifact, path)
+    assert load_explainer_artifact(tmp_path / "missing.pkl") is None
+    assert load_explainer_artifact(path, pipeline, pipeline_hash="other") is None
+    loaded = load_explainer_artifact(path, pipeline, pipeline_hash="abc")
+
+    from_artifact = TreeContributionExplainer(pipeline, artifact=loaded)
+    np.testing.assert_allclose(
+        from_artifact.contributions(X)[1], derived.contributions(X)[1]
+    )
+
+
+def test_kernel_fallback_uses_persisted_background():
+    from sklearn.linear_model import LinearRegression
+
+    from src.explanation_engine import (
+        KernelContributionExplainer,
+        ShapExplanationProvider,
+        build_explainer_artifact,
+    )
+
+    pipeline, X = make_listing_pipeline(LinearRegression())
+    artifact = build_explainer_artifact(pipeline, X, n_background=4)
+    assert artifact["expected_value_source"] == "background"
+
+    providers = [
+        ShapExplanationProvider(pipeline, None, artifact),
+        ShapExplanationProvider(pipeline, None, artifact),
+    ]
+    results = [p.explain(pipeline, X.iloc[[1]]) for p in providers]
+    assert isinstance(providers[0]._local_explainer, KernelContributionExplainer)
+    assert results[0] == results[1]
+    base_value, contributions = results[0]
+    assert base_value + sum(contributions.values()) == pytest.approx(
+        pipeline.predict(X.iloc[[1]])[0]
+    )
+    # The base value is the weighted background mean persisted in the artifact
+    weighted_mean = pipeline.predict(artifact["background"]) @ np.asarray(
+        artifact["background_weights"]
+    )
+    assert base_value == pytest.approx(artifact["expected_value"])
+    assert base_value == pytest.approx(weighted_mean)
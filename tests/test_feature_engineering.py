@@ -1,4 +1,7 @@
+import pickle
+
 import pytest
+import numpy as np
 import pandas as pd
 from src.market_statistics import MarketStatistics
 from src.feature_engineering import MarketFeatureEngineer
@@ -107,3 +110,199 @@ def test_feature_engineering(sample_df):
     assert "mpg" in df_feat.columns
     assert "engineSize" in df_feat.columns
     assert "fuelType" in df_feat.columns
+
+
+def _random_listings(rng, n, brands, variants, fuels):
+    return pd.DataFrame(
+        {
+            "brand": rng.choice(brands, n),
+            "model": "Model",
+            "variant": rng.choice(variants, n),
+            "year": rng.integers(CURRENT_YEAR - 15, CURRENT_YEAR + 1, n),
+            "selling_price": rng.integers(100_000, 5_000_000, n),
+            "km_driven": rng.integers(0, 200_000, n),
+            "fuel_type": rng.choice(fuels, n),
+            "seller_type": rng.choice(["Individual", "Dealer"], n),
+            "transmission": rng.choice(["Manual", "Automatic"], n),
+            "owner": rng.choice(["First Owner", "Second Owner"], n),
+            "mileage_kmpl": np.where(
+                rng.random(n) < 0.1, np.nan, rng.uniform(8, 30, n).round(2)
+            ),
+            # Mixes cc and litre values so per-batch unit detection would differ
+            "engine_cc": rng.choice([796.0, 1248.0, 1.2, 2.0, 2993.0, np.nan], n),
+            "max_power_bhp": rng.uniform(40, 300, n).round(1),
+            "seats": 5.0,
+        }
+    )
+
+
+def test_batch_invariant_features_do_not_depend_on_batch():
+    rng = np.random.default_rng(0)
+    train = _random_listings(
+        rng,
+        500,
+        ["Maruti", "BMW", "Honda"],
+        ["LXI", "VXI", "ZXI"],
+        ["Petrol", "Diesel"],
+    )
+    engineer = MarketFeatureEngineer(MarketStatistics(train), batch_invariant=True)
+    # Scoring data includes brands, variants and fuels unseen in training
+    pool = _random_listings(
+        rng,
+        60,
+        ["Maruti", "BMW", "Tata"],
+        ["LXI", "VXI", "Rare Edition"],
+        ["Petrol", "Diesel", "CNG"],
+    )
+    singles = pd.concat(
+        [engineer.engineer_features(pool.iloc[[i]]) for i in range(len(pool))]
+    )
+
+    assert singles["configuration_scarcity_score"].between(0.0, 1.0).all()
+    for _ in range(25):
+        size = int(rng.integers(2, len(pool) + 1))
+        rows = rng.choice(len(pool), size, replace=bool(rng.integers(2)))
+        batch = engineer.engineer_features(pool.iloc[rows])
+        pd.testing.assert_frame_equal(batch, singles.iloc[rows])
+
+
+@pytest.mark.parametrize("batch_invariant", [True, False])
+def test_record_path_matches_dataframe_path_on_every_column(sample_df, batch_invariant):
+    """Every engineered column, over every optional input column."""
+    rng = np.random.default_rng(1)
+    engineer = MarketFeatureEngineer(
+        MarketStatistics(sample_df.copy()), batch_invariant
+    )
+    listings = _random_listings(
+        rng, 40, ["Maruti", "BMW", " Tata "], ["LXI", "Dzire VDI"], ["Petrol", "Diesel"]
+    )
+    listings.loc[0, "year"] = CURRENT_YEAR
+    listings.loc[1, "engine_cc"] = 0.0
+    listings.loc[2, "fuel_type"] = np.nan
+    frames = [
+        sample_df,
+        listings,
+        # Inference-style input: car_age, engineSize and mpg given directly
+        listings.drop(columns=["owner", "seller_type", "mileage_kmpl", "engine_cc"])
+        .rename(columns={"max_power_bhp": "mpg"})
+        .assign(car_age=3, engineSize=1.2),
+        listings.drop(columns=["variant", "engine_cc", "max_power_bhp"]),
+    ]
+    for frame in frames:
+        for i, record in enumerate(frame.to_dict("records")):
+            # A record is a one-row batch
+            expected = engineer.engineer_features(frame.iloc[[i]])
+            features = engineer.engineer_record(record)
+            assert list(features) == list(expected.columns)
+            for key, value in features.items():
+                want = expected[key].iloc[0]
+                if isinstance(want, str):
+                    assert value == want, key
+                else:
+                    assert value == pytest.approx(want, nan_ok=True), key
+
+
+def test_batch_invariant_matches_batch_mode_on_training_data(sample_df):
+    stats = MarketStatistics(sample_df.copy())
+    batch = MarketFeatureEngineer(stats).engineer_features(sample_df)
+    invariant = MarketFeatureEngineer(stats, batch_invariant=True).engineer_features(
+        sample_df
+    )
+    pd.testing.assert_frame_equal(invariant, batch)
+
+
+def test_batch_invariant_falls_back_for_old_statistics(sample_df):
+    stats = MarketStatistics(sample_df.copy())
+    # Statistics unpickled from before the normalizers existed
+    del stats.configuration_scarcity_normalizer, stats.fuel_efficiency_medians
+
+    engineer = MarketFeatureEngineer(stats, batch_invariant=True)
+    assert not engineer.batch_invariant
+    pd.testing.assert_frame_equal(
+        engineer.engineer_features(sample_df),
+        MarketFeatureEngineer(stats).engineer_features(sample_df),
+    )
+
+
+def test_backfill_restores_training_normalizers(sample_df):
+    stats = MarketStatistics(sample_df.copy())
+    normalizer = stats.configuration_scarcity_normalizer
+    del stats.configuration_scarcity_normalizer, stats.fuel_efficiency_medians
+    popularity = dict(stats.variant_popularity)
+
+    # A later dataset without the rarest training variant
+    later = sample_df[sample_df["variant"] != "800 LXI"]
+    assert stats.backfill(later) == [
+        "configuration_scarcity_normalizer",
+        "fuel_efficiency_medians",
+    ]
+    assert stats.configuration_scarcity_normalizer == normalizer
+    assert stats.variant_popularity == popularity
+    # Fuel medians can only come from the dataset at hand
+    assert stats.fuel_efficiency_medians == (
+        later.groupby("fuel_type")["mileage_kmpl"].median().to_dict()
+    )
+    assert stats.backfill(later) == []
+
+    # Curves are computed from the dataset at hand
+    del stats.brand_depreciation_curves
+    assert "brand_depreciation_curves" in stats.backfill(sample_df)
+    assert set(stats.brand_depreciation_curves) == {"Maruti", "BMW"}
+
+
+def test_lookup_tables_match_accessors(sample_df):
+    stats = MarketStatistics(sample_df.copy())
+    brands = ["Maruti", "BMW", "Tata", None, np.nan]
+    for name, accessor in [
+        ("brand_popularity", stats.get_brand_popularity),
+        ("brand_stability", stats.get_brand_stability),
+        ("brand_retention_score", stats.get_brand_retention_score),
+        ("brand_annual_depreciation_rate", stats.get_brand_annual_depreciation_rate),
+    ]:
+        np.testing.assert_array_equal(
+            stats.lookup(name, brands), [accessor(b) for b in brands]
+        )
+
+    # Tables are rebuilt lazily rather than pickled
+    restored = pickle.loads(pickle.dumps(stats))
+    assert "_lookup_tables" in vars(stats)
+    assert "_lookup_tables" not in vars(restored)
+    assert restored.lookup("fuel_demand", ["Diesel"])[0] == 2.0 / 3.0
+
+
+def test_depreciation_curves_recover_brand_rates():
+    rng = np.random.default_rng(0)
+    n = 4000
+    brand = rng.choice(["Fast", "Slow"], n)
+    age = rng.integers(0, 15, n)
+    rate = np.where(brand == "Fast", 0.2, 0.05)
+    listings = pd.DataFrame(
+        {
+            "brand": brand,
+            "year": CURRENT_YEAR - age,
+            "car_age": age,
+            "selling_price": 1_000_000 * (1 - rate) ** age,
+            "fuel_type": "Petrol",
+            "transmission": "Manual",
+            "engine_cc": 1197.0,
+        }
+    )
+    stats = MarketStatistics(listings)
+
+    for name, expected in [("Fast", 0.2), ("Slow", 0.05)]:
+        np.testing.assert_allclose(stats.brand_depreciation_curves[name], expected)
+    assert set(stats.segment_depreciation_curves) == {"B-Segment/Compact"}
+
+    retained = stats.retention_forecast(
+        np.array(["Fast", "Slow", "Unseen"], dtype=object), np.array([1, 3, 20]), 10
+    )
+    assert retained.shape == (3, 10)
+    np.testing.assert_allclose(retained[0], 0.8 ** np.arange(1, 11))
+    np.testing.assert_allclose(retained[1], 0.95 ** np.arange(1, 11))
+    # Unseen brands follow the global curve
+    global_rate = stats.global_depreciation_curve[-1]
+    np.testing.assert_allclose(retained[2], (1 - global_rate) ** np.arange(1, 11))
+
+    # Statistics pickled before the curves existed
+    del stats.brand_depreciation_curves
+    assert not stats.has_depreciation_curves
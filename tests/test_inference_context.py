@@ -0,0 +1,73 @@
+import joblib
+import pytest
+
+import src.inference_context as inference_context
+from src.inference_context import InferenceContext, get_inference_context
+from src.prediction import predict_price
+
+
+@pytest.fixture
+def context():
+    return get_inference_context(reload=True)
+
+
+def test_context_is_shared(context):
+    assert get_inference_context() is context
+    assert isinstance(context.version, str) and len(context.version) == 12
+
+
+def test_context_reloads_when_artifacts_change(context, monkeypatch):
+    monkeypatch.setattr(
+        inference_context, "_artifact_signature", lambda paths: ("changed",)
+    )
+    reloaded = get_inference_context()
+    assert reloaded is not context
+    assert reloaded.version == context.version  # same bytes on disk
+
+
+def test_context_watches_valuation_config(context, monkeypatch):
+    # The Streamlit app relies on this instead of caching its own context
+    watched = []
+    signature = inference_context._artifact_signature
+    monkeypatch.setattr(
+        inference_context,
+        "_artifact_signature",
+        lambda paths: watched.append(paths) or signature(paths),
+    )
+    assert get_inference_context() is context
+    assert inference_context.VALUATION_CONFIG_PATH in watched[-1]
+
+
+def test_production_features_are_batch_invariant(context):
+    # The shipped statistics carry the training-time normalizers
+    assert context.market_stats.has_normalizers
+    assert context.feature_engineer.batch_invariant
+
+
+def test_production_forecasts_use_depreciation_curves(context):
+    assert context.market_stats.has_depreciation_curves
+    assert context.decision_engine.forecast_engine.market_stats is not None
+
+
+def test_predict_price_does_not_reload_artifacts(context, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("artifacts must not be reloaded per request")
+
+    monkeypatch.setattr(joblib, "load", fail)
+    monkeypatch.setattr(InferenceContext, "load", fail)
+
+    result = predict_price(
+        "Maruti", "Swift Dzire VDI", 2018, "Manual", 45000, "Diesel", 23.4, 1.2
+    )
+    assert result["predicted_price_raw"] > 0
+    assert "decision_report" in result
+
+
+def test_bind_knowledge_engine(context):
+    local = InferenceContext(
+        context.pipeline, context.market_stats, context.config, context.version
+    )
+    sentinel = object()
+    local.bind_knowledge_engine(sentinel)
+    assert local.valuation_engine.knowledge_engine is sentinel
+    assert local.decision_engine.alternatives_engine.knowledge_engine is sentinel
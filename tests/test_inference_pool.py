@@ -0,0 +1,52 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.inference_pool import InferencePool, InferencePoolSaturated
+
+
+def test_run_returns_result_on_worker_thread():
+    pool = InferencePool(max_workers=2, max_queue=0)
+    name = asyncio.run(pool.run(lambda: threading.current_thread().name))
+
+    assert name.startswith("inference")
+    assert pool.stats()["completed"] == 1
+    assert pool.in_flight == 0
+
+
+def test_run_propagates_exceptions():
+    pool = InferencePool(max_workers=1)
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(pool.run(fail))
+    assert pool.in_flight == 0
+
+
+def test_saturated_pool_sheds_load():
+    pool = InferencePool(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(InferencePoolSaturated):
+            await pool.run(release.wait)
+        # The event loop stays free while the workers are busy
+        assert await asyncio.sleep(0, result="alive") == "alive"
+        release.set()
+        return await asyncio.gather(*running)
+
+    assert asyncio.run(scenario()) == [True, True]
+    stats = pool.stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 2
+    assert stats["in_flight"] == 0
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        InferencePool(max_workers=0)
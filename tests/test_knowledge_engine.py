@@ -139,3 +139,42 @@ def test_get_similar_configurations(mock_df):
     similar = engine.get_similar_configurations("Maruti", "Swift", 2018, "Dzire VDI")
     assert len(similar) == 1
     assert similar[0]["variant"] == "ZXI"
+
+
+def test_index_matches_dataframe_lookups(mock_df):
+    # Rows with missing keys are only reachable up to their first NaN level
+    mock_df.loc[3] = {
+        "brand": "Maruti",
+        "base_model": "Swift",
+        "variant": "LXI",
+        "year": 2019,
+        "fuelType": None,
+        "transmission": "Manual",
+        "engineSize": 1.2,
+        "max_power_bhp": 82.0,
+        "mpg": 21.2,
+        "seats": 5.0,
+    }
+    mock_df.loc[4] = {**mock_df.loc[3].to_dict(), "base_model": None}
+    engine = VehicleKnowledgeEngine(mock_df)
+    kb = engine.kb
+
+    for brand in engine.get_brands():
+        models = sorted(kb.loc[kb["brand"] == brand, "base_model"].dropna().unique())
+        assert engine.get_models(brand) == models
+        for model in models:
+            subset = kb[(kb["brand"] == brand) & (kb["base_model"] == model)]
+            years = sorted(subset["year"].dropna().astype(int).unique(), reverse=True)
+            assert engine.get_years(brand, model) == years
+            for year in years:
+                variants = subset.loc[subset["year"] == year, "variant"]
+                assert engine.get_variants(brand, model, year) == sorted(
+                    variants.dropna().unique()
+                )
+
+    assert engine.get_variants("Maruti", "Swift", 2019) == ["LXI", "VXI"]
+    assert engine.get_fuel_types("Maruti", "Swift", 2019, "LXI") == []
+    assert engine.get_variant_label("Maruti", "Swift", 2019, "LXI") == (
+        "LXI (1.2L nan Manual)"
+    )
+    assert engine.get_specs("Maruti", None, 2019, "LXI", None, "Manual") is None
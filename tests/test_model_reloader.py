@@ -0,0 +1,106 @@
+import json
+import os
+
+import pytest
+
+import src.experimentation.registry as registry_module
+import src.inference_context as inference_context
+from src.inference_context import InferenceContext, get_inference_context
+from src.model_reloader import ModelReloader
+
+
+@pytest.fixture
+def registry(tmp_path):
+    path = tmp_path / "registry.json"
+    path.write_text(json.dumps({"production_model": None, "history": []}))
+    return path
+
+
+def _promote(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_promotion_swaps_in_a_new_context(registry):
+    current = get_inference_context()
+    swapped = []
+    reloader = ModelReloader(registry, on_swap=swapped.append)
+    assert not reloader.check()
+
+    _promote(registry)
+    assert reloader.check()
+    assert swapped and swapped[0] is not current
+    assert get_inference_context() is swapped[0]
+    assert swapped[0].version == current.version  # same bytes on disk
+    assert not reloader.check()
+
+
+def test_failed_reload_keeps_serving_and_retries(registry, monkeypatch):
+    current = get_inference_context()
+    reloader = ModelReloader(registry)
+
+    def fail(*args, **kwargs):
+        raise FileNotFoundError("pipeline.pkl")
+
+    _promote(registry)
+    monkeypatch.setattr(InferenceContext, "load", fail)
+    assert not reloader.check()
+    assert get_inference_context() is current
+    assert reloader.stats()["failures"] == 1
+
+    monkeypatch.undo()
+    assert reloader.check()
+
+
+def test_requests_do_not_reload_while_watching(registry, monkeypatch):
+    current = get_inference_context()
+    reloader = ModelReloader(registry, poll_seconds=60)
+    reloader.start()
+    try:
+        monkeypatch.setattr(
+            inference_context, "_artifact_signature", lambda paths: ("changed",)
+        )
+        assert get_inference_context() is current
+        assert inference_context.loaded_model_version() == current.version
+    finally:
+        reloader.stop()
+    assert get_inference_context() is not current
+
+
+def test_registry_is_updated_after_production_artifacts(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_module, "MODELS_DIR", tmp_path)
+    monkeypatch.setattr(registry_module, "REGISTRY_PATH", tmp_path / "registry.json")
+    registry = registry_module.ModelRegistry()
+    candidate = tmp_path / "candidate.pkl"
+    candidate.write_bytes(b"model")
+    production = registry.production_dir
+    (production / "pipeline.pkl").write_bytes(b"old model")
+    (production / "market_stats.pkl").write_bytes(b"old stats")
+
+    def write_artifacts(staging_dir):
+        assert staging_dir != production
+        assert (staging_dir / "pipeline.pkl").read_bytes() == b"model"
+        (staging_dir / "market_stats.pkl").write_bytes(b"stats")
+        # Nothing in production changes until every artifact is written
+        assert (production / "pipeline.pkl").read_bytes() == b"old model"
+        assert (production / "market_stats.pkl").read_bytes() == b"old stats"
+        assert json.loads(registry.registry_path.read_text())["history"] == []
+
+    registry.promote_to_production(
+        candidate, {"model_name": "XGBoost"}, write_artifacts
+    )
+    manifest = json.loads(registry.registry_path.read_text())
+    assert manifest["production_model"]["model_name"] == "XGBoost"
+    assert (production / "pipeline.pkl").read_bytes() == b"model"
+    assert (production / "market_stats.pkl").read_bytes() == b"stats"
+    assert json.loads((production / "metadata.json").read_text()) == {
+        "model_name": "XGBoost"
+    }
+    assert sorted(p.name for p in production.iterdir()) == [
+        "market_stats.pkl",
+        "metadata.json",
+        "pipeline.pkl",
+    ]
+    assert [p.read_bytes() for p in registry.archive_dir.glob("pipeline_*")] == [
+        b"old model"
+    ]
@@ -105,6 +105,24 @@ class TestDataPreprocessing:
         assert cleaned["selling_price"].min() >= 20000
         assert cleaned["km_driven"].min() >= 100
 
+    def test_near_duplicate_mask_matches_reference(self, monkeypatch):
+        """Test the vectorized near-duplicate filter against the row loop."""
+        import numpy as np
+        import src.data_processing as dp
+
+        rng = np.random.default_rng(0)
+        # 0 rounds exercises the row-by-row chain fallback on its own
+        for max_rounds in [dp._DEDUP_MAX_ROUNDS, 1, 0]:
+            monkeypatch.setattr(dp, "_DEDUP_MAX_ROUNDS", max_rounds)
+            for _ in range(50):
+                n = int(rng.integers(1, 300))
+                keys = rng.integers(0, 5, n).astype(str).astype(object)
+                km = rng.integers(100, int(rng.choice([2_000, 200_000])), n)
+                price = np.sort(rng.integers(20_000, int(rng.choice([25_000, 1e6])), n))
+
+                expected = dp._near_duplicate_mask_reference(keys, km, price)
+                assert (dp.near_duplicate_mask(keys, km, price) == expected).all()
+
     def test_prices_are_native_inr(self):
         """Test that prices are in native INR (no conversion needed)."""
         from src.data_processing import load_and_merge_datasets, clean_data
@@ -249,6 +267,71 @@ class TestParsing:
         assert parse_numeric_with_unit("74 bhp", "bhp") == 74.0
         assert parse_numeric_with_unit(None) is None
 
+    @pytest.mark.parametrize("pyarrow_available", [True, False])
+    def test_columnar_parsers_match_row_wise(self, pyarrow_available, monkeypatch):
+        """Test the columnar parsers against the row-wise ones."""
+        import numpy as np
+        import src.data_processing as dp
+        from src.utils import DATA_DIR
+
+        monkeypatch.setattr(
+            dp, "PYARROW_AVAILABLE", pyarrow_available and dp.PYARROW_AVAILABLE
+        )
+        cardekho = pd.read_csv(DATA_DIR / "raw" / "cardekho_v3.csv")
+        kasliwal = pd.read_csv(DATA_DIR / "raw" / "kasliwal_train.csv")
+        edge_cases = [
+            None,
+            np.nan,
+            "",
+            " ",
+            "Maruti",
+            "Land Rover",
+            "Land Rover Discovery Sport TD4 HSE",
+            "Ashok Leyland Stile LE",
+            "  Maruti  Swift\tVDI ",
+            "Škoda Octavia 1.8 TSI",
+            "Mini Cooper S",
+            "null bhp",
+            "1248 CC",
+            " 74 bhp ",
+            "23.4 kmpl",
+            "26.6 km/kg",
+            "17.0 KM/L",
+            "1e3",
+            ".5",
+            "inf",
+            "١٢ kmpl",
+            42,
+        ]
+
+        names = pd.concat(
+            [cardekho["name"], kasliwal["Name"], pd.Series(edge_cases)],
+            ignore_index=True,
+        )
+        expected = pd.DataFrame(
+            [dp.parse_brand_model(n) for n in names],
+            columns=["brand", "model", "base_model", "variant"],
+        )
+        pd.testing.assert_frame_equal(dp.parse_brand_model_columns(names), expected)
+
+        for column, unit in [
+            (cardekho["engine"], "CC"),
+            (cardekho["max_power"], "bhp"),
+            (kasliwal["Power"], "bhp"),
+            (pd.Series(edge_cases), ""),
+            (pd.Series(edge_cases), "bhp"),
+        ]:
+            expected = column.apply(lambda x: dp.parse_numeric_with_unit(x, unit))
+            pd.testing.assert_series_equal(
+                dp.parse_numeric_column(column, unit), expected.astype(float)
+            )
+
+        for column in [cardekho["mileage"], kasliwal["Mileage"], pd.Series(edge_cases)]:
+            expected = column.apply(dp.parse_mileage_kmpl)
+            pd.testing.assert_series_equal(
+                dp.parse_mileage_kmpl_column(column), expected.astype(float)
+            )
+
 
 # ============================================================================
 # Tests: src/predict.py
@@ -274,6 +357,148 @@ class TestPredict:
         assert len(df) == 1
         assert df["brand"].iloc[0] == "Maruti"
 
+    def test_create_input_frame_matches_single_row(self):
+        """Test the vectorized input frame matches the single-car builder."""
+        from src.prediction import create_input_dataframe, create_input_frame
+
+        cars = pd.DataFrame(
+            {
+                "brand": ["Maruti", "BMW", "Hyundai"],
+                "model": ["Swift", "3 Series 320d", "i20 Asta"],
+                "year": [2019, 2016, 2026],
+                "transmission": ["Manual", "Automatic", "Manual"],
+                "mileage": [45000, 30000, 0],
+                "fuel_type": ["Petrol", "Diesel", "Petrol"],
+                "mpg": [22.0, 18.0, 20.0],
+                "engine_size": [1.2, 2.0, 1.2],
+            }
+        )
+        batch = create_input_frame(cars)
+        for i, car in cars.iterrows():
+            single = create_input_dataframe(**car.to_dict())
+            pd.testing.assert_frame_equal(
+                batch.iloc[[i]].reset_index(drop=True),
+                single,
+                check_dtype=False,
+            )
+
+    @pytest.mark.parametrize("batch_invariant", [True, False])
+    def test_record_path_matches_dataframe_path(self, batch_invariant):
+        """Test the single-record fast path against the DataFrame path."""
+        import numpy as np
+        from src.feature_engineering import MarketFeatureEngineer
+        from src.inference_context import get_inference_context
+        from src.prediction import create_input_dataframe, create_input_record
+        from src.valuation_intelligence import ValuationIntelligenceEngine
+
+        context = get_inference_context()
+        compiled = context.compiled_pipeline
+        assert compiled is not None
+        engineer = MarketFeatureEngineer(context.market_stats, batch_invariant)
+        valuation_engine = ValuationIntelligenceEngine(config=context.config)
+
+        cars = [
+            ("Maruti", "Swift Dzire VDI", 2018, "Manual", 45000, "Diesel", 23.4, 1.2),
+            ("BMW", "3 Series 320d", 2016, "Automatic", 30000, "Diesel", 18.0, 2.0),
+            # Unseen brand, new car, missing mpg, zero engine size
+            ("Tesla", "Model 3", 2026, "Automatic", 0, "Electric", np.nan, 0.0),
+            (" Audi ", "A4", 2005, "Manual", 200000, "Petrol", 15.0, 2.0),
+        ]
+        for car in cars:
+            input_df = create_input_dataframe(*car)
+            features_df = engineer.engineer_features(input_df)
+            record = create_input_record(*car)
+            features = engineer.engineer_record(record)
+
+            assert set(features) == set(features_df.columns)
+            for key, value in features.items():
+                expected = features_df[key].iloc[0]
+                assert value == pytest.approx(expected, nan_ok=True) or (
+                    value == expected
+                ), key
+
+            model_input = features_df[compiled.feature_names]
+            np.testing.assert_allclose(
+                compiled.transform_record(features),
+                context.pipeline[:-1].transform(model_input)[0],
+            )
+            assert compiled.predict_record(features) == pytest.approx(
+                float(context.pipeline.predict(model_input)[0])
+            )
+            assert valuation_engine.generate_record_report(
+                context.pipeline, record, features, compiled
+            ) == valuation_engine.generate_valuation_report(
+                context.pipeline, input_df, features_df
+            )
+
+    def test_predict_price_batch_matches_predict_price(self):
+        """Test batch valuations match single-car valuations."""
+        from src.prediction import predict_price, predict_price_batch
+
+        cars = pd.DataFrame(
+            {
+                "brand": ["Maruti", "BMW"],
+                "model": ["Swift Dzire VDI", "3 Series 320d"],
+                "year": [2018, 2016],
+                "transmission": ["Manual", "Automatic"],
+                "mileage": [45000, 30000],
+                "fuel_type": ["Diesel", "Diesel"],
+                "mpg": [23.4, 18.0],
+                "engine_size": [1.2, 2.0],
+            }
+        )
+        batch = predict_price_batch(cars, asking_prices=pd.Series([500000, None]))
+        assert len(batch) == 2
+        for (i, car), asking in zip(cars.iterrows(), [500000, None]):
+            single = predict_price(**car.to_dict(), asking_price=asking)
+            for key in [
+                "predicted_price_raw",
+                "price_range",
+                "original_price",
+                "depreciation_percent",
+                "confidence",
+                "input_summary",
+            ]:
+                assert batch[i][key] == single[key]
+            assert batch[i]["decision_report"] == single["decision_report"]
+
+    def test_batch_predict_explanations_match_single(self):
+        """Test batched top factors match per-car explanations."""
+        from src.inference_context import get_inference_context
+        from src.prediction import batch_predict, create_input_dataframe
+
+        context = get_inference_context()
+        cars = [
+            ("Maruti", "Swift Dzire VDI", 2018, "Manual", 45000, "Diesel", 23.4, 1.2),
+            ("BMW", "3 Series 320d", 2016, "Automatic", 30000, "Diesel", 18.0, 2.0),
+            ("Honda", "City i-VTEC VX", 2019, "Automatic", 25000, "Petrol", 17.4, 1.5),
+        ]
+        input_df = pd.concat(
+            [create_input_dataframe(*car) for car in cars], ignore_index=True
+        )
+        result = batch_predict(input_df, explain=True, top_k=3)
+
+        for i in range(len(cars)):
+            features = context.feature_engineer.engineer_features(input_df.iloc[[i]])
+            single = context.explanation_engine.explain_prediction(
+                context.pipeline, features[list(context.pipeline.feature_names_in_)]
+            )
+            assert result["explanation_base_value"][i] == pytest.approx(
+                single["base_value"]
+            )
+            for side in ["positive", "negative"]:
+                factors = single[f"top_{side}_factors"]
+                for j in range(3):
+                    feature = result[f"top_{side}_{j + 1}_feature"][i]
+                    contribution = result[f"top_{side}_{j + 1}_contribution"][i]
+                    if j < len(factors):
+                        assert feature == factors[j]["feature"]
+                        assert contribution == pytest.approx(
+                            factors[j]["contribution"], rel=1e-4
+                        )
+                    else:
+                        assert feature is None and pd.isna(contribution)
+
 
 # ============================================================================
 # Tests: API
@@ -309,6 +534,169 @@ class TestAPI:
         assert "status" in data
         assert data["status"] == "healthy"
 
+    def test_api_predict_batch(self):
+        """Test batch prediction reports per-row results and errors."""
+        from fastapi.testclient import TestClient
+        import src.api as api
+
+        with TestClient(api.app) as client:
+            if api.pipeline is None or api.knowledge_engine is None:
+                pytest.skip("Model or Knowledge Engine not available")
+
+            kb = api.knowledge_engine.kb.dropna(
+                subset=[
+                    "brand",
+                    "base_model",
+                    "year",
+                    "variant",
+                    "fuelType",
+                    "transmission",
+                ]
+            )
+            row = kb.iloc[0]
+            car = {
+                "brand": row["brand"],
+                "model": row["base_model"],
+                "variant": row["variant"],
+                "year": int(row["year"]),
+                "transmission": row["transmission"],
+                "mileage": 30000,
+                "fuelType": row["fuelType"],
+            }
+            response = client.post(
+                "/predict/batch",
+                json={"cars": [car, {**car, "year": 1800}, {**car, "model": "?"}]},
+            )
+            # Batch valuations skip explanations
+            single = client.post("/predict", json={**car, "explanation_level": "none"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["n_succeeded"] == 1
+        assert data["n_failed"] == 2
+        assert [item["status"] for item in data["results"]] == ["ok", "error", "error"]
+        assert data["results"][0]["result"] == single.json()
+        assert "year" in data["results"][1]["error"]
+        assert "Invalid vehicle configuration" in data["results"][2]["error"]
+
+    def test_api_coalesced_predictions_match_single(self):
+        """Test that a micro-batch answers each request as /predict alone does."""
+        from fastapi import HTTPException
+        from fastapi.testclient import TestClient
+        import src.api as api
+
+        with TestClient(api.app):
+            if api.pipeline is None or api.knowledge_engine is None:
+                pytest.skip("Model or Knowledge Engine not available")
+
+        kb = api.knowledge_engine.kb.dropna(
+            subset=[
+                "brand",
+                "base_model",
+                "year",
+                "variant",
+                "fuelType",
+                "transmission",
+            ]
+        )
+        cars = [
+            api.CarInput(
+                brand=row["brand"],
+                model=row["base_model"],
+                variant=row["variant"],
+                year=int(row["year"]),
+                transmission=row["transmission"],
+                mileage=30000,
+                fuelType=row["fuelType"],
+                explanation_level=level,
+            )
+            for (_, row), level in zip(
+                kb.iloc[:3].iterrows(), ["exact", "approx", "none"]
+            )
+        ]
+        invalid = cars[0].model_copy(update={"model": "?"})
+
+        results = api._predict_coalesced([(car, None) for car in cars + [invalid]])
+
+        for car, result in zip(cars, results):
+            assert result == api._predict(car)
+            assert result.explanation["level"] == car.explanation_level
+        assert isinstance(results[-1], HTTPException)
+        assert results[-1].status_code == 400
+
+    def test_api_predict_serves_repeat_configurations_from_cache(self, monkeypatch):
+        """Test that cars in one mileage bucket share a cached valuation."""
+        from fastapi.testclient import TestClient
+        import src.api as api
+        from src.valuation_cache import ValuationCache
+
+        cache = ValuationCache(mileage_bucket_km=1000)
+        monkeypatch.setattr(api, "valuation_cache", cache)
+        with TestClient(api.app) as client:
+            if api.pipeline is None or api.knowledge_engine is None:
+                pytest.skip("Model or Knowledge Engine not available")
+
+            row = api.knowledge_engine.kb.dropna(
+                subset=["brand", "base_model", "year", "variant", "fuelType"]
+            ).iloc[0]
+            car = {
+                "brand": row["brand"],
+                "model": row["base_model"],
+                "variant": row["variant"],
+                "year": int(row["year"]),
+                "transmission": row["transmission"],
+                "mileage": 30100,
+                "fuelType": row["fuelType"],
+            }
+            first = client.post("/predict", json=car).json()
+            second = client.post("/predict", json={**car, "mileage": 30900}).json()
+            other = client.post("/predict", json={**car, "mileage": 31000}).json()
+            # May be degraded to meet the deadline, so not stored or bucketed
+            timed = client.post(
+                "/predict", json={**car, "mileage": 45100, "deadline_ms": 10_000}
+            ).json()
+            health = client.get("/health").json()
+            stats = health["valuation_cache"]
+
+        assert first == second
+        assert first["model_version"] == health["model_version"]
+        assert first["input_summary"]["mileage"] == 30500
+        assert other["input_summary"]["mileage"] == 31500
+        assert timed["input_summary"]["mileage"] == 45100
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 3, 2)
+
+        cache.sync_version("promoted")
+        assert len(cache) == 0
+
+    def test_api_predict_sheds_load_when_pool_is_full(self, monkeypatch):
+        """Test that a saturated inference pool answers 429 without blocking."""
+        from fastapi.testclient import TestClient
+        import src.api as api
+        from src.inference_pool import InferencePoolSaturated
+
+        class FullPool:
+            async def run(self, fn, *args):
+                raise InferencePoolSaturated("full")
+
+            def stats(self):
+                return {"in_flight": 0}
+
+        monkeypatch.setattr(api, "inference_pool", FullPool())
+        client = TestClient(api.app)
+        car = {
+            "brand": "Maruti",
+            "model": "Swift",
+            "year": 2018,
+            "transmission": "Manual",
+            "mileage": 45000,
+            "fuelType": "Diesel",
+        }
+        response = client.post("/predict", json=car)
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
+        assert client.post("/predict/batch", json={"cars": [car]}).status_code == 429
+        assert client.get("/health").json()["inference_pool"] == {"in_flight": 0}
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
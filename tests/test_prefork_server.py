@@ -0,0 +1,27 @@
+import gc
+import os
+
+import pytest
+
+import src.api as api
+from src.prefork_server import memory_report, preload
+from src.utils import process_memory
+
+
+def test_process_memory_reports_unique_within_resident():
+    memory = process_memory()
+    if not memory:
+        pytest.skip("/proc/<pid>/smaps_rollup not available")
+    assert 0 < memory["uss_mb"] <= memory["rss_mb"]
+    assert memory["pss_mb"] <= memory["rss_mb"]
+    assert memory_report([os.getpid()])[0]["pid"] == os.getpid()
+
+
+def test_preload_loads_artifacts_and_freezes_them():
+    try:
+        preload()
+        if api.pipeline is None or api.knowledge_engine is None:
+            pytest.skip("Model or Knowledge Engine not available")
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from src.request_coalescer import RequestCoalescer
+
+
+def _batches_of(handler_calls):
+    def handler(items):
+        handler_calls.append(list(items))
+        return [ValueError(item) if item < 0 else item * 10 for item in items]
+
+    return handler
+
+
+def test_concurrent_requests_share_one_batch():
+    calls = []
+    coalescer = RequestCoalescer(_batches_of(calls), window_ms=20, max_batch=10)
+
+    async def scenario():
+        return await asyncio.gather(*(coalescer.submit(i) for i in range(4)))
+
+    assert asyncio.run(scenario()) == [0, 10, 20, 30]
+    assert calls == [[0, 1, 2, 3]]
+    assert coalescer.stats()["mean_batch_size"] == 4
+
+
+def test_full_batch_is_flushed_without_waiting():
+    calls = []
+    coalescer = RequestCoalescer(_batches_of(calls), window_ms=10_000, max_batch=2)
+
+    async def scenario():
+        return await asyncio.wait_for(
+            asyncio.gather(*(coalescer.submit(i) for i in range(4))), timeout=5
+        )
+
+    assert asyncio.run(scenario()) == [0, 10, 20, 30]
+    assert calls == [[0, 1], [2, 3]]
+
+
+def test_per_item_errors_stay_with_their_caller():
+    coalescer = RequestCoalescer(_batches_of([]), window_ms=5)
+
+    async def scenario():
+        return await asyncio.gather(
+            coalescer.submit(1), coalescer.submit(-1), return_exceptions=True
+        )
+
+    ok, error = asyncio.run(scenario())
+    assert ok == 10
+    assert isinstance(error, ValueError)
+
+
+def test_handler_failure_reaches_every_caller():
+    def handler(items):
+        raise RuntimeError("model down")
+
+    coalescer = RequestCoalescer(handler, window_ms=5)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(coalescer.submit(i) for i in range(3)), return_exceptions=True
+        )
+
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(scenario()))
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        RequestCoalescer(lambda items: items, max_batch=0)
@@ -0,0 +1,75 @@
+import pytest
+
+from src.valuation_cache import ValuationCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+CAR = {"brand": "Maruti", "model": "Swift", "year": 2018, "mileage": 45200}
+
+
+def test_mileage_bucket_shares_an_entry():
+    cache = ValuationCache(mileage_bucket_km=1000)
+    cache.sync_version("v1")
+    cache.put(cache.key("v1", CAR), "value")
+
+    assert cache.bucket_mileage(45200) == 45500
+    assert cache.get(cache.key("v1", dict(CAR, mileage=45999))) == "value"
+    assert cache.get(cache.key("v1", dict(CAR, mileage=46000))) is None
+    assert cache.get(cache.key("v1", dict(CAR, model="swift"))) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 2, 0.3333)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ValuationCache(max_entries=2)
+    cache.sync_version("v1")
+    keys = [cache.key("v1", dict(CAR, year=year)) for year in (2016, 2017, 2018)]
+    cache.put(keys[0], 0)
+    cache.put(keys[1], 1)
+    cache.get(keys[0])
+    cache.put(keys[2], 2)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == 0
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ValuationCache(ttl_seconds=60, clock=clock)
+    cache.sync_version("v1")
+    key = cache.key("v1", CAR)
+    cache.put(key, "value")
+
+    clock.now = 59
+    assert cache.get(key) == "value"
+    clock.now = 60
+    assert cache.get(key) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_new_model_version_invalidates_entries():
+    cache = ValuationCache()
+    cache.sync_version("v1")
+    old_key = cache.key("v1", CAR)
+    cache.put(old_key, "old")
+
+    cache.sync_version("v2")
+    assert len(cache) == 0
+    assert cache.stats()["invalidations"] == 1
+
+    # A result computed with the old model is not stored
+    cache.put(old_key, "late")
+    assert len(cache) == 0
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        ValuationCache(mileage_bucket_km=0)
@@ -1,7 +1,17 @@
 import pytest
+import numpy as np
 import pandas as pd
 import json
+from src.knowledge_engine import VehicleKnowledgeEngine
+from src.utils import VALUATION_CONFIG_PATH
 from src.valuation_intelligence import ValuationIntelligenceEngine
+from src.valuation_rules import (
+    CONFIDENCE_LABELS,
+    MARKET_POSITIONS,
+    RISK_LEVELS,
+    ValuationConfigError,
+    ValuationRules,
+)
 
 
 class MockPipeline:
@@ -99,3 +109,105 @@ def test_generate_valuation_report(valuation_engine):
     assert report["confidence"]["label"] == "High"
     assert "ownership risk" in [k.lower() for k in report["risk_assessment"].keys()]
     assert isinstance(report["ai_summary"], str)
+
+
+class StubKnowledgeEngine:
+    def get_brand_knowledge(self, brand):
+        return VehicleKnowledgeEngine.BRAND_KNOWLEDGE.get(brand, {})
+
+
+def test_columnar_reports_match_single_row(valuation_engine):
+    valuation_engine.knowledge_engine = StubKnowledgeEngine()
+    rng = np.random.default_rng(0)
+    n = 300
+    brands = ["Maruti Suzuki", "BMW", "Hyundai", "Unknown Make"]
+    input_data = pd.DataFrame(
+        {
+            "brand": rng.choice(brands, n),
+            "model": rng.choice(["Swift", "X1", "Creta"], n),
+            "year": rng.integers(2000, 2025, n),
+            "car_age": rng.integers(0, 25, n),
+            "mileage": rng.integers(0, 250_000, n),
+        }
+    )
+    # Exact threshold values and NaNs exercise the boundary/quirk handling
+    retention = rng.choice([0.8, 0.95, 1.0, 1.05, 1.2, np.nan], n)
+    input_features = pd.DataFrame(
+        {
+            "car_age": input_data["car_age"],
+            "configuration_scarcity_score": rng.choice([0.1, 0.7, 0.95, np.nan], n),
+            "market_liquidity_score": rng.choice([0.1, 0.3, 0.8, np.nan], n),
+            "market_stability_score": rng.uniform(0, 1, n),
+            "brand_popularity": rng.uniform(0, 1, n),
+            "brand_resale_retention_score": retention,
+        }
+    )
+    prices = rng.uniform(1e5, 5e6, n)
+
+    batch = valuation_engine.build_valuation_reports(prices, input_data, input_features)
+
+    assert len(batch) == n
+    for i in range(n):
+        expected = valuation_engine.build_valuation_report(
+            float(prices[i]), input_data.iloc[[i]], input_features.iloc[[i]]
+        )
+        assert batch.report(i) == expected
+    assert set(batch.to_frame()["recommendation"]) <= {
+        "Excellent Buy",
+        "Fair Purchase",
+    }
+
+
+def test_compiled_recommendations_match_matrix_search():
+    with open(VALUATION_CONFIG_PATH) as f:
+        config = json.load(f)
+    rules = ValuationRules.compile(config)
+    ranks = {"Low": 1, "Medium": 2, "High": 3}
+
+    def search(position, confidence, risk):
+        for rec, rule in config["recommendation_matrix"].items():
+            if (
+                position in rule["market_position"]
+                and confidence in rule["confidence"]
+                and ranks[risk] <= ranks[rule["max_ownership_risk"]]
+            ):
+                return rec
+        return "Fair Purchase"
+
+    for p, position in enumerate(MARKET_POSITIONS):
+        for c, confidence in enumerate(CONFIDENCE_LABELS):
+            for r, risk in enumerate(RISK_LEVELS):
+                expected = search(position, confidence, risk)
+                assert rules.recommendation(position, confidence, risk) == expected
+                assert rules.recommendation_table[p, c, r] == expected
+
+    with pytest.raises(AttributeError):
+        rules.confidence_bounds = (0, 0)
+    with pytest.raises(TypeError):
+        rules.recommendations[("Undervalued", "High", "Low")] = "Avoid"
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda c: c.pop("risk_thresholds"),
+        lambda c: c["confidence_thresholds"].update(high_min="85"),
+        lambda c: c["confidence_thresholds"].update(medium_min=90),
+        lambda c: c["market_position_thresholds"].update(undervalued_max=0.5),
+        lambda c: c["risk_thresholds"].pop("market_risk"),
+        lambda c: c["recommendation_matrix"]["Fair Purchase"].update(
+            confidence=["Very High"]
+        ),
+        lambda c: c["recommendation_matrix"]["Excellent Buy"].update(
+            max_ownership_risk="None"
+        ),
+    ],
+)
+def test_invalid_config_rejected_at_load(valuation_engine, tmp_path, mutate):
+    config = json.loads(json.dumps(valuation_engine.config))
+    mutate(config)
+    config_file = tmp_path / "bad_config.json"
+    config_file.write_text(json.dumps(config))
+
+    with pytest.raises(ValuationConfigError):
+        ValuationIntelligenceEngine(config_path=str(config_file))